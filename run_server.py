@@ -1,6 +1,12 @@
 from fastmcp.server.server import FastMCP
 from fastmcp.server.auth.providers.bearer import BearerAuthProvider, RSAKeyPair
-from fastmcp.tool_loader import generate_openapi_spec_from_supabase, create_client_for_tools
+from fastmcp.tool_loader import (
+    ToolCatalogWatcher,
+    create_client_for_tools,
+    create_tool_db_pool,
+    fetch_openapi_spec,
+    generate_openapi_spec_from_supabase,
+)
 from fastmcp.server.middleware.logging import LoggingMiddleware
 import os
 import anyio
@@ -53,9 +59,24 @@ async def main():
     )
 
     # --- Dynamic Tool Loading & Mounting ---
-    openapi_spec = generate_openapi_spec_from_supabase()
+    # With a database URL, tools are loaded through a connection pool and kept
+    # in sync with the registry while the server runs
+    db_pool = None
+    if os.environ.get("SUPABASE_DB_URL"):
+        db_pool = await create_tool_db_pool()
+        openapi_spec = await fetch_openapi_spec(db_pool)
+    else:
+        openapi_spec = generate_openapi_spec_from_supabase()
     http_client = create_client_for_tools()
-    tools_server = FastMCP.from_openapi(openapi_spec=openapi_spec, client=http_client)
+    tools_server = FastMCP.from_openapi(
+        openapi_spec=openapi_spec,
+        client=http_client,
+        snapshot_path=os.environ.get("OPENAPI_SNAPSHOT_PATH"),
+    )
+    print(
+        f"HTTP connection pool: max_connections={http_client.pool.max_connections}, "
+        f"http2={http_client.pool.http2}"
+    )
     auth_server.mount(tools_server)
 
     # --- Log Loaded Tools on Startup ---
@@ -87,7 +108,23 @@ async def main():
             f"received: {port_str!r}."
         )
 
-    await auth_server.run_async(transport="http", host="0.0.0.0", port=port)
+    if db_pool is None:
+        await auth_server.run_async(transport="http", host="0.0.0.0", port=port)
+        return
+
+    watcher = ToolCatalogWatcher(
+        db_pool,
+        tools_server,
+        interval=float(os.environ.get("TOOL_REFRESH_INTERVAL", "30")),
+        channel=os.environ.get("TOOL_REFRESH_CHANNEL"),
+    )
+    try:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(watcher.run)
+            await auth_server.run_async(transport="http", host="0.0.0.0", port=port)
+            tg.cancel_scope.cancel()
+    finally:
+        await db_pool.close()
 
 if __name__ == "__main__":
     try:
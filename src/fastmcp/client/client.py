@@ -10,7 +10,6 @@ from typing import Any, Generic, Literal, cast, overload
 import anyio
 import httpx
 import mcp.types
-import pydantic_core
 from exceptiongroup import catch
 from mcp import ClientSession
 from pydantic import AnyUrl
@@ -32,6 +31,7 @@ from fastmcp.client.roots import (
 from fastmcp.client.sampling import SamplingHandler, create_sampling_callback
 from fastmcp.exceptions import ToolError
 from fastmcp.server import FastMCP
+from fastmcp.utilities import json_backend
 from fastmcp.utilities.exceptions import get_catch_handlers
 from fastmcp.utilities.json_schema_type import json_schema_to_type
 from fastmcp.utilities.logging import get_logger
@@ -264,6 +264,27 @@ class Client(Generic[ClientTransportT]):
         """Check if the client is currently connected."""
         return self._session is not None
 
+    def new(self) -> Client[ClientTransportT]:
+        """
+        Create a new client with the same configuration but its own,
+        disconnected session state. Useful for opening several concurrent
+        sessions to the same server. Transports that hold a connection, such as
+        stdio transports, are copied, so that each client has its own.
+        """
+        new_client = type(self).__new__(type(self), self.transport)
+        new_client.__dict__.update(self.__dict__)
+        new_client.transport = self.transport.new()
+        new_client._session_kwargs = self._session_kwargs.copy()
+        new_client._initialize_result = None
+        new_client._session = None
+        new_client._exit_stack = None
+        new_client._nesting_counter = 0
+        new_client._context_lock = anyio.Lock()
+        new_client._session_task = None
+        new_client._ready_event = anyio.Event()
+        new_client._stop_event = anyio.Event()
+        return new_client
+
     @asynccontextmanager
     async def _context_manager(self):
         with catch(get_catch_handlers()):
@@ -580,10 +601,7 @@ class Client(Generic[ClientTransportT]):
                 if isinstance(value, str):
                     serialized_arguments[key] = value
                 else:
-                    # Use pydantic_core.to_json for consistent serialization
-                    serialized_arguments[key] = pydantic_core.to_json(value).decode(
-                        "utf-8"
-                    )
+                    serialized_arguments[key] = json_backend.dumps(value)
 
         result = await self.session.get_prompt(
             name=name, arguments=serialized_arguments
@@ -1,6 +1,7 @@
 import abc
 import asyncio
 import contextlib
+import copy
 import datetime
 import os
 import shutil
@@ -24,7 +25,7 @@ from mcp.client.session import (
 from mcp.server.fastmcp import FastMCP as FastMCP1Server
 from mcp.shared.memory import create_client_server_memory_streams
 from pydantic import AnyUrl
-from typing_extensions import TypedDict, Unpack
+from typing_extensions import Self, TypedDict, Unpack
 
 import fastmcp
 from fastmcp.client.auth.bearer import BearerAuth
@@ -107,6 +108,14 @@ class ClientTransport(abc.ABC):
         """Close the transport."""
         pass
 
+    def new(self) -> Self:
+        """
+        Returns a transport for a separate connection to the same server.
+        Transports that keep no connection state between sessions return
+        themselves.
+        """
+        return self
+
     def _set_auth(self, auth: httpx.Auth | Literal["oauth"] | str | None):
         if auth is not None:
             raise ValueError("This transport does not support auth")
@@ -421,6 +430,18 @@ class StdioTransport(ClientTransport):
     async def close(self):
         await self.disconnect()
 
+    def new(self) -> Self:
+        """
+        Returns a disconnected copy of the transport, which runs its own
+        subprocess.
+        """
+        transport = copy.copy(self)
+        transport._session = None
+        transport._connect_task = None
+        transport._ready_event = anyio.Event()
+        transport._stop_event = anyio.Event()
+        return transport
+
     def __repr__(self) -> str:
         return (
             f"<{self.__class__.__name__}(command='{self.command}', args={self.args})>"
@@ -806,6 +827,11 @@ class MCPConfigTransport(ClientTransport):
         async with self.transport.connect_session(**session_kwargs) as session:
             yield session
 
+    def new(self) -> Self:
+        transport = copy.copy(self)
+        transport.transport = self.transport.new()
+        return transport
+
     def __repr__(self) -> str:
         return f"<MCPConfigTransport(config='{self.config}')>"
 
@@ -1,8 +1,10 @@
 from typing import Any
 
-from mcp.types import CallToolResult
+import anyio
+from mcp.types import CallToolResult, TextContent
 from pydantic import BaseModel, Field
 
+import fastmcp.server.context
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.client.transports import FastMCPTransport
@@ -11,6 +13,7 @@ from fastmcp.contrib.mcp_mixin.mcp_mixin import (
     MCPMixin,
     mcp_tool,
 )
+from fastmcp.exceptions import DisabledError, NotFoundError
 
 
 class CallToolRequest(BaseModel):
@@ -51,8 +54,24 @@ class CallToolRequestResult(CallToolResult):
 class BulkToolCaller(MCPMixin):
     """
     A class to provide a "bulk tool call" tool for a FastMCP server
+
+    Args:
+        max_concurrency: The maximum number of calls from a single bulk request
+            that may run at the same time. Defaults to 1, which runs the calls
+            one after another.
+        direct: If True, calls are dispatched to the server in-process,
+            through its middleware, instead of over an MCP client session.
+            This avoids serializing every call and result, but skips the
+            protocol-level validation of tool arguments and structured output
+            against the tools' JSON schemas.
     """
 
+    def __init__(self, max_concurrency: int = 1, direct: bool = False):
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency: {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self.direct = direct
+
     def register_tools(
         self,
         mcp_server: "FastMCP",
@@ -75,17 +94,10 @@ class BulkToolCaller(MCPMixin):
          be for a different tool and can include different arguments. Useful for speeding up
          what would otherwise take several individual tool calls.
         """
-        results = []
-
-        for tool_call in tool_calls:
-            result = await self._call_tool(tool_call.tool, tool_call.arguments)
-
-            results.append(result)
-
-            if result.isError and not continue_on_error:
-                return results
-
-        return results
+        return await self._call_tools(
+            [(tool_call.tool, tool_call.arguments) for tool_call in tool_calls],
+            continue_on_error=continue_on_error,
+        )
 
     @mcp_tool()
     async def call_tool_bulk(
@@ -103,31 +115,152 @@ class BulkToolCaller(MCPMixin):
             tool: The name of the tool to call.
             tool_arguments: A list of dictionaries, where each dictionary contains the arguments for an individual run of the tool.
         """
-        results = []
+        return await self._call_tools(
+            [(tool, tool_call_arguments) for tool_call_arguments in tool_arguments],
+            continue_on_error=continue_on_error,
+        )
+
+    async def _call_tools(
+        self, tool_calls: list[tuple[str, dict[str, Any]]], continue_on_error: bool
+    ) -> list[CallToolRequestResult]:
+        """
+        Helper method to make a series of tool calls, either in-process or over
+        a single session.
+
+        Results are returned in the order of the calls. Unless `continue_on_error`
+        is True, the results end with the first failed call, and calls after it
+        are not started or are cancelled.
+        """
+        if self.direct:
+            return await self._run_tool_calls(None, tool_calls, continue_on_error)
 
-        for tool_call_arguments in tool_arguments:
-            result = await self._call_tool(tool, tool_call_arguments)
+        async with Client(self.connection) as client:
+            return await self._run_tool_calls(client, tool_calls, continue_on_error)
+
+    async def _run_tool_calls(
+        self,
+        client: Client | None,
+        tool_calls: list[tuple[str, dict[str, Any]]],
+        continue_on_error: bool,
+    ) -> list[CallToolRequestResult]:
+        """
+        Helper method to run tool calls one after another, or concurrently if
+        `max_concurrency` allows it.
+        """
+        if self.max_concurrency == 1 or len(tool_calls) < 2:
+            results = []
+
+            for tool, arguments in tool_calls:
+                result = await self._call_tool(client, tool, arguments)
 
-            results.append(result)
+                results.append(result)
 
-            if result.isError and not continue_on_error:
-                return results
+                if result.isError and not continue_on_error:
+                    return results
 
-        return results
+            return results
+
+        return await self._call_tools_concurrently(
+            client, tool_calls, continue_on_error
+        )
+
+    async def _call_tools_concurrently(
+        self,
+        client: Client | None,
+        tool_calls: list[tuple[str, dict[str, Any]]],
+        continue_on_error: bool,
+    ) -> list[CallToolRequestResult]:
+        """
+        Helper method to run tool calls in a task group, at most
+        `max_concurrency` at a time. As with sequential calls, an exception
+        raised by a call is re-raised as is: the one from the earliest call wins,
+        and calls after it are cancelled.
+        """
+        results: list[CallToolRequestResult | None] = [None] * len(tool_calls)
+        cancel_scopes = [anyio.CancelScope() for _ in tool_calls]
+        limiter = anyio.CapacityLimiter(self.max_concurrency)
+        first_error: int | None = None
+        errors: dict[int, Exception] = {}
+
+        async def run(index: int, tool: str, arguments: dict[str, Any]) -> None:
+            nonlocal first_error
+
+            with cancel_scopes[index]:
+                async with limiter:
+                    try:
+                        result = await self._call_tool(client, tool, arguments)
+                    except Exception as e:
+                        errors[index] = e
+                        for scope in cancel_scopes[index + 1 :]:
+                            scope.cancel()
+                        return
+
+                results[index] = result
+                if result.isError and not continue_on_error:
+                    if first_error is None or index < first_error:
+                        first_error = index
+                    # stop every call that comes after the failed one
+                    for scope in cancel_scopes[index + 1 :]:
+                        scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            for index, (tool, arguments) in enumerate(tool_calls):
+                tg.start_soon(run, index, tool, arguments)
+
+        if errors:
+            raise errors[min(errors)]
+
+        if first_error is not None:
+            results = results[: first_error + 1]
+        return [result for result in results if result is not None]
 
     async def _call_tool(
-        self, tool: str, arguments: dict[str, Any]
+        self, client: Client | None, tool: str, arguments: dict[str, Any]
     ) -> CallToolRequestResult:
         """
-        Helper method to call a tool with the provided arguments.
+        Helper method to call a tool with the provided arguments, in-process if
+        no client is given.
         """
+        if client is None:
+            return await self._call_tool_direct(tool, arguments)
 
-        async with Client(self.connection) as client:
-            result = await client.call_tool_mcp(name=tool, arguments=arguments)
+        result = await client.call_tool_mcp(name=tool, arguments=arguments)
 
+        return CallToolRequestResult(
+            tool=tool,
+            arguments=arguments,
+            isError=result.isError,
+            content=result.content,
+        )
+
+    async def _call_tool_direct(
+        self, tool: str, arguments: dict[str, Any]
+    ) -> CallToolRequestResult:
+        """
+        Helper method to call a tool through the server's middleware without a
+        client session. Errors are reported the same way the MCP server reports
+        them to clients.
+        """
+        server = self.connection.server
+        assert isinstance(server, FastMCP)
+
+        try:
+            async with fastmcp.server.context.Context(fastmcp=server):
+                try:
+                    result = await server._call_tool(tool, arguments)
+                except (DisabledError, NotFoundError):
+                    raise NotFoundError(f"Unknown tool: {tool}")
+        except Exception as e:
             return CallToolRequestResult(
                 tool=tool,
                 arguments=arguments,
-                isError=result.isError,
-                content=result.content,
+                isError=True,
+                content=[TextContent(type="text", text=str(e))],
             )
+
+        return CallToolRequestResult(
+            tool=tool,
+            arguments=arguments,
+            isError=False,
+            content=result.content,
+        )
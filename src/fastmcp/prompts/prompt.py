@@ -3,7 +3,6 @@
 from __future__ import annotations as _annotations
 
 import inspect
-import json
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
@@ -16,6 +15,7 @@ from pydantic import Field, TypeAdapter
 
 from fastmcp.exceptions import PromptError
 from fastmcp.server.dependencies import get_context
+from fastmcp.utilities import json_backend
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
@@ -218,7 +218,7 @@ class FunctionPrompt(Prompt):
                             param_schema = param_adapter.json_schema()
 
                             # Create compact schema representation
-                            schema_str = json.dumps(param_schema, separators=(",", ":"))
+                            schema_str = json_backend.dumps(param_schema)
 
                             # Append schema info to description
                             schema_note = f"Provide as a JSON string matching the following schema: {schema_str}"
@@ -350,9 +350,7 @@ class FunctionPrompt(Prompt):
                             )
                         )
                     else:
-                        content = pydantic_core.to_json(
-                            msg, fallback=str, indent=2
-                        ).decode()
+                        content = json_backend.dumps(msg, fallback=str, indent=2)
                         messages.append(
                             PromptMessage(
                                 role="user",
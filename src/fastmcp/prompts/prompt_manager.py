@@ -1,8 +1,8 @@
 from __future__ import annotations as _annotations
 
 import warnings
-from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from mcp import GetPromptResult
 
@@ -11,9 +11,10 @@ from fastmcp.exceptions import NotFoundError, PromptError
 from fastmcp.prompts.prompt import FunctionPrompt, Prompt, PromptResult
 from fastmcp.settings import DuplicateBehavior
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.routing import PrefixRouter
 
 if TYPE_CHECKING:
-    from fastmcp.server.server import MountedServer
+    from fastmcp.server.server import FastMCP, MountedServer
 
 logger = get_logger(__name__)
 
@@ -21,6 +22,11 @@ logger = get_logger(__name__)
 class PromptManager:
     """Manages FastMCP prompts."""
 
+    # Whether this manager's inventory only changes through its own mutation
+    # methods. Managers that source prompts from elsewhere (e.g. a remote
+    # server) set this to False, which prevents their parents from caching.
+    _cacheable: ClassVar[bool] = True
+
     def __init__(
         self,
         duplicate_behavior: DuplicateBehavior | None = None,
@@ -28,6 +34,10 @@ class PromptManager:
     ):
         self._prompts: dict[str, Prompt] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._mount_router: PrefixRouter[MountedServer] = PrefixRouter()
+        self._parent_managers: list[PromptManager] = []
+        # incremented whenever this manager or any mounted manager changes
+        self._generation: int = 0
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
         # Default to "warn" if None is provided
@@ -45,6 +55,47 @@ class PromptManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for prompts."""
         self._mounted_servers.append(server)
+        self._mount_router.add(server.prefix, server)
+        server.server._prompt_manager._parent_managers.append(self)
+        self._invalidate()
+
+    def remount(self, old_server: FastMCP[Any], new_server: FastMCP[Any]) -> None:
+        """
+        Updates this manager after one of its mounted servers was replaced, so
+        that changes to the new server, not the old one, invalidate it.
+        """
+        old_server._prompt_manager._parent_managers.remove(self)
+        new_server._prompt_manager._parent_managers.append(self)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """
+        Marks the prompt inventory of this manager and of every manager this
+        one is mounted on as changed.
+        """
+        self._generation += 1
+        for parent in self._parent_managers:
+            parent._invalidate()
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter that increases whenever the prompt inventory of this manager,
+        or of a manager mounted on it, changes.
+        """
+        return self._generation
+
+    @property
+    def mounted_servers(self) -> Sequence[MountedServer]:
+        """The servers mounted on this manager, in the order they were mounted."""
+        return self._mounted_servers
+
+    def is_cacheable(self) -> bool:
+        """Whether this manager's inventory is fully tracked by invalidation."""
+        return self._cacheable and all(
+            mounted.server._prompt_manager.is_cacheable()
+            for mounted in self._mounted_servers
+        )
 
     async def _load_prompts(self, *, via_server: bool = False) -> dict[str, Prompt]:
         """
@@ -147,6 +198,7 @@ class PromptManager:
                 return existing
         else:
             self._prompts[prompt.key] = prompt
+        self._invalidate()
         return prompt
 
     async def render_prompt(
@@ -160,9 +212,7 @@ class PromptManager:
         """
         # 1. Check local prompts first. The server will have already applied its filter.
         if name in self._prompts:
-            prompt = await self.get_prompt(name)
-            if not prompt:
-                raise NotFoundError(f"Unknown prompt: {name}")
+            prompt = self._prompts[name]
 
             try:
                 messages = await prompt.render(arguments)
@@ -185,16 +235,12 @@ class PromptManager:
                     # Include original error details
                     raise PromptError(f"Error rendering prompt {name!r}: {e}") from e
 
-        # 2. Check mounted servers using the filtered protocol path.
-        for mounted in reversed(self._mounted_servers):
-            prompt_key = name
-            if mounted.prefix:
-                if name.startswith(f"{mounted.prefix}_"):
-                    prompt_key = name.removeprefix(f"{mounted.prefix}_")
-                else:
-                    continue
+        # 2. Check mounted servers using the filtered protocol path. The router
+        # only yields servers whose prefix matches, most recently mounted first.
+        for prompt_key, mounted in self._mount_router.route(name):
             try:
-                return await mounted.server._get_prompt(prompt_key, arguments)
+                async with mounted.track_call() as server:
+                    return await server._get_prompt(prompt_key, arguments)
             except NotFoundError:
                 continue
 
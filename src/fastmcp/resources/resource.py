@@ -7,7 +7,6 @@ import inspect
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Annotated, Any
 
-import pydantic_core
 from mcp.types import Resource as MCPResource
 from pydantic import (
     AnyUrl,
@@ -20,6 +19,7 @@ from pydantic import (
 from typing_extensions import Self
 
 from fastmcp.server.dependencies import get_context
+from fastmcp.utilities import json_backend
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.types import (
     find_kwarg_by_type,
@@ -192,4 +192,4 @@ class FunctionResource(Resource):
         elif isinstance(result, str):
             return result
         else:
-            return pydantic_core.to_json(result, fallback=str, indent=2).decode()
+            return json_backend.dumps(result, fallback=str, indent=2)
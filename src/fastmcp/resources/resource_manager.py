@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import inspect
 import warnings
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import AnyUrl
 
@@ -14,13 +14,15 @@ from fastmcp.exceptions import NotFoundError, ResourceError
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import (
     ResourceTemplate,
-    match_uri_template,
+    TemplateMatcher,
+    get_template_matcher,
 )
 from fastmcp.settings import DuplicateBehavior
+from fastmcp.utilities.components import get_component_state_generation
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
-    from fastmcp.server.server import MountedServer
+    from fastmcp.server.server import FastMCP, MountedServer
 
 logger = get_logger(__name__)
 
@@ -28,6 +30,12 @@ logger = get_logger(__name__)
 class ResourceManager:
     """Manages FastMCP resources."""
 
+    # Whether this manager's inventory only changes through its own mutation
+    # methods. Managers that source resources from elsewhere (e.g. a remote
+    # server) set this to False, which prevents them and their parents from
+    # caching.
+    _cacheable: ClassVar[bool] = True
+
     def __init__(
         self,
         duplicate_behavior: DuplicateBehavior | None = None,
@@ -44,6 +52,20 @@ class ResourceManager:
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._parent_managers: list[ResourceManager] = []
+
+        # Cached, unfiltered inventories of local and mounted resources and
+        # templates, plus a compiled matcher for the templates. They are rebuilt
+        # lazily after this manager or any mounted manager changes, or after any
+        # component is enabled or disabled.
+        self._resource_index: dict[str, Resource] | None = None
+        self._resource_index_state: int = -1
+        self._template_index: dict[str, ResourceTemplate] | None = None
+        self._template_index_state: int = -1
+        self._template_matcher: TemplateMatcher | None = None
+        self._local_template_matcher: TemplateMatcher | None = None
+        self._generation: int = 0
+
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
         # Default to "warn" if None is provided
@@ -60,14 +82,131 @@ class ResourceManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for resources and templates."""
         self._mounted_servers.append(server)
+        server.server._resource_manager._parent_managers.append(self)
+        self._invalidate()
+
+    def remount(self, old_server: FastMCP[Any], new_server: FastMCP[Any]) -> None:
+        """
+        Updates this manager after one of its mounted servers was replaced, so
+        that changes to the new server, not the old one, invalidate it.
+        """
+        old_server._resource_manager._parent_managers.remove(self)
+        new_server._resource_manager._parent_managers.append(self)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """
+        Discards the cached inventories of this manager and of every manager
+        this one is mounted on.
+        """
+        self._generation += 1
+        self._resource_index = None
+        self._template_index = None
+        self._template_matcher = None
+        self._local_template_matcher = None
+        for parent in self._parent_managers:
+            parent._invalidate()
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter that increases whenever the resource inventory of this manager,
+        or of a manager mounted on it, changes.
+        """
+        return self._generation
+
+    @property
+    def mounted_servers(self) -> Sequence[MountedServer]:
+        """The servers mounted on this manager, in the order they were mounted."""
+        return self._mounted_servers
+
+    def is_cacheable(self) -> bool:
+        """Whether this manager's inventory is fully tracked by invalidation."""
+        return self._cacheable and all(
+            mounted.server._resource_manager.is_cacheable()
+            for mounted in self._mounted_servers
+        )
+
+    async def _get_resource_index(self) -> dict[str, Resource]:
+        """
+        Returns the unfiltered resource inventory, rebuilding it only if it has
+        been invalidated. The returned dict is shared and must not be mutated.
+        """
+        state = get_component_state_generation()
+        if self._resource_index is not None and self._resource_index_state == state:
+            return self._resource_index
+
+        generation = self._generation
+        resources = await self._load_resources(via_server=False)
+
+        # only store the index if nothing changed while it was being built
+        if generation == self._generation and self.is_cacheable():
+            self._resource_index = resources
+            self._resource_index_state = state
+        return resources
+
+    async def _get_template_index(
+        self,
+    ) -> tuple[dict[str, ResourceTemplate], TemplateMatcher]:
+        """
+        Returns the unfiltered template inventory and a matcher for its keys,
+        rebuilding them only if they have been invalidated. The returned dict is
+        shared and must not be mutated.
+        """
+        state = get_component_state_generation()
+        if (
+            self._template_index is not None
+            and self._template_matcher is not None
+            and self._template_index_state == state
+        ):
+            return self._template_index, self._template_matcher
+
+        generation = self._generation
+        templates = await self._load_resource_templates(via_server=False)
+        matcher = get_template_matcher(tuple(templates))
+
+        # only store the index if nothing changed while it was being built
+        if generation == self._generation and self.is_cacheable():
+            self._template_index = templates
+            self._template_matcher = matcher
+            self._template_index_state = state
+        return templates, matcher
+
+    async def _lookup_resources(self) -> dict[str, Resource]:
+        """
+        Returns the resource inventory used for URI lookups, avoiding a copy of
+        the cached index when this manager's inventory is fully tracked.
+        """
+        if self._cacheable:
+            return await self._get_resource_index()
+        return await self.get_resources()
+
+    async def _lookup_templates(
+        self,
+    ) -> tuple[dict[str, ResourceTemplate], TemplateMatcher]:
+        """
+        Returns the template inventory used for URI lookups and a matcher for
+        its keys.
+        """
+        if self._cacheable:
+            return await self._get_template_index()
+        templates = await self.get_resource_templates()
+        return templates, get_template_matcher(tuple(templates))
+
+    def _get_local_template_matcher(self) -> TemplateMatcher:
+        """Returns a matcher for the keys of this manager's own templates."""
+        if self._local_template_matcher is None:
+            self._local_template_matcher = get_template_matcher(tuple(self._templates))
+        return self._local_template_matcher
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, keyed by URI."""
-        return await self._load_resources(via_server=False)
+        return dict(await self._get_resource_index())
 
     async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
         """Get all registered templates, keyed by URI template."""
-        return await self._load_resource_templates(via_server=False)
+        templates, _ = await self._get_template_index()
+        return dict(templates)
 
     async def _load_resources(self, *, via_server: bool = False) -> dict[str, Resource]:
         """
@@ -287,6 +426,7 @@ class ResourceManager:
             elif self.duplicate_behavior == "ignore":
                 return existing
         self._resources[resource.key] = resource
+        self._invalidate()
         return resource
 
     def add_template_from_fn(
@@ -340,6 +480,7 @@ class ResourceManager:
             elif self.duplicate_behavior == "ignore":
                 return existing
         self._templates[template.key] = template
+        self._invalidate()
         return template
 
     async def has_resource(self, uri: AnyUrl | str) -> bool:
@@ -347,17 +488,13 @@ class ResourceManager:
         uri_str = str(uri)
 
         # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
+        resources = await self._lookup_resources()
         if uri_str in resources:
             return True
 
         # Then check templates (local and mounted) only if not found in concrete resources
-        templates = await self.get_resource_templates()
-        for template_key in templates.keys():
-            if match_uri_template(uri_str, template_key):
-                return True
-
-        return False
+        _, matcher = await self._lookup_templates()
+        return matcher.match(uri_str) is not None
 
     async def get_resource(self, uri: AnyUrl | str) -> Resource:
         """Get resource by URI, checking concrete resources first, then templates.
@@ -372,15 +509,17 @@ class ResourceManager:
         logger.debug("Getting resource", extra={"uri": uri_str})
 
         # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
+        resources = await self._lookup_resources()
         if resource := resources.get(uri_str):
             return resource
 
-        # Then check templates (local and mounted) - use the utility function to match against storage keys
-        templates = await self.get_resource_templates()
-        for storage_key, template in templates.items():
-            # Try to match against the storage key (which might be a custom key)
-            if params := match_uri_template(uri_str, storage_key):
+        # Then check templates (local and mounted), matching against storage keys
+        # (which might be custom keys)
+        templates, matcher = await self._lookup_templates()
+        if match := matcher.match(uri_str):
+            storage_key, params = match
+            template = templates[storage_key]
+            if params:
                 try:
                     return await template.create_resource(
                         uri_str,
@@ -413,9 +552,7 @@ class ResourceManager:
 
         # 1. Check local resources first. The server will have already applied its filter.
         if uri_str in self._resources:
-            resource = await self.get_resource(uri_str)
-            if not resource:
-                raise NotFoundError(f"Resource {uri_str!r} not found")
+            resource = self._resources[uri_str]
 
             try:
                 return await resource.read()
@@ -438,8 +575,10 @@ class ResourceManager:
                     ) from e
 
         # 1b. Check local templates if not found in concrete resources
-        for key, template in self._templates.items():
-            if params := match_uri_template(uri_str, key):
+        if match := self._get_local_template_matcher().match(uri_str):
+            key, params = match
+            template = self._templates[key]
+            if params:
                 try:
                     resource = await template.create_resource(uri_str, params=params)
                     return await resource.read()
@@ -482,7 +621,8 @@ class ResourceManager:
                         continue
 
                 try:
-                    result = await mounted.server._read_resource(key)
+                    async with mounted.track_call() as server:
+                        result = await server._read_resource(key)
                     return result[0].content
                 except NotFoundError:
                     continue
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import inspect
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from typing import Any
 from urllib.parse import unquote
 
@@ -25,19 +26,36 @@ from fastmcp.utilities.types import (
 )
 
 
-def build_regex(template: str) -> re.Pattern:
+def _build_pattern(template: str, group_prefix: str = "") -> tuple[str, list[str]]:
+    """
+    Translate a URI template into an (unanchored) regex pattern. Returns the
+    pattern and the parameter names, in the order of their groups. Parameter
+    groups are named `{group_prefix}{index}` if a prefix is given, and after
+    the parameter itself otherwise.
+    """
     parts = re.split(r"(\{[^}]+\})", template)
     pattern = ""
+    names: list[str] = []
     for part in parts:
         if part.startswith("{") and part.endswith("}"):
             name = part[1:-1]
-            if name.endswith("*"):
+            wildcard = name.endswith("*")
+            if wildcard:
                 name = name[:-1]
-                pattern += f"(?P<{name}>.+)"
+            group = f"{group_prefix}{len(names)}" if group_prefix else name
+            names.append(name)
+            if wildcard:
+                pattern += f"(?P<{group}>.+)"
             else:
-                pattern += f"(?P<{name}>[^/]+)"
+                pattern += f"(?P<{group}>[^/]+)"
         else:
             pattern += re.escape(part)
+    return pattern, names
+
+
+@lru_cache(maxsize=5000)
+def build_regex(template: str) -> re.Pattern:
+    pattern, _ = _build_pattern(template)
     return re.compile(f"^{pattern}$")
 
 
@@ -49,6 +67,83 @@ def match_uri_template(uri: str, uri_template: str) -> dict[str, str] | None:
     return None
 
 
+def _template_scheme(uri_template: str) -> str | None:
+    """The literal scheme of a URI template, or None if it is parameterized."""
+    literal_prefix = uri_template.split("{", 1)[0]
+    if "://" in literal_prefix:
+        return literal_prefix.split("://", 1)[0]
+    return None
+
+
+class TemplateMatcher:
+    """
+    Matches URIs against many URI templates at once.
+
+    Templates are grouped by their literal scheme, and each group is compiled
+    into a single alternation regex. A URI is only checked against the group
+    for its scheme (plus any templates with a parameterized scheme), and the
+    first template in registration order that matches wins, exactly as if each
+    template were tried with `match_uri_template` in turn.
+    """
+
+    def __init__(self, uri_templates: Iterable[str]):
+        self.uri_templates: tuple[str, ...] = tuple(uri_templates)
+        self._params: list[list[str]] = []
+
+        alternatives: list[str] = []
+        schemes: list[str | None] = []
+        for index, uri_template in enumerate(self.uri_templates):
+            pattern, names = _build_pattern(uri_template, group_prefix=f"t{index}_")
+            alternatives.append(f"(?P<t{index}>{pattern})")
+            schemes.append(_template_scheme(uri_template))
+            self._params.append(names)
+
+        def compile_group(indices: list[int]) -> re.Pattern | None:
+            if not indices:
+                return None
+            return re.compile("|".join(alternatives[i] for i in indices))
+
+        unschemed = [i for i, scheme in enumerate(schemes) if scheme is None]
+        self._unschemed_regex = compile_group(unschemed)
+        self._scheme_regexes: dict[str, re.Pattern | None] = {
+            scheme: compile_group(
+                [i for i, s in enumerate(schemes) if s is None or s == scheme]
+            )
+            for scheme in {s for s in schemes if s is not None}
+        }
+
+    def __len__(self) -> int:
+        return len(self.uri_templates)
+
+    def match(self, uri: str) -> tuple[str, dict[str, str]] | None:
+        """
+        Return the first template matching `uri` and its extracted parameters,
+        or None if no template matches.
+        """
+        regex = self._unschemed_regex
+        if "://" in uri:
+            regex = self._scheme_regexes.get(uri.split("://", 1)[0], regex)
+        if regex is None:
+            return None
+
+        match = regex.fullmatch(uri)
+        if match is None or match.lastgroup is None:
+            return None
+
+        index = int(match.lastgroup[1:])
+        params = {
+            name: unquote(match.group(f"t{index}_{position}"))
+            for position, name in enumerate(self._params[index])
+        }
+        return self.uri_templates[index], params
+
+
+@lru_cache(maxsize=64)
+def get_template_matcher(uri_templates: tuple[str, ...]) -> TemplateMatcher:
+    """Return a (cached) matcher for the given URI templates."""
+    return TemplateMatcher(uri_templates)
+
+
 class ResourceTemplate(FastMCPComponent):
     """A template for dynamically creating resources."""
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import anyio
@@ -13,6 +12,7 @@ from pydantic import Field, ValidationInfo
 
 from fastmcp.exceptions import ResourceError
 from fastmcp.resources.resource import Resource
+from fastmcp.utilities import json_backend
 from fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -146,6 +146,6 @@ class DirectoryResource(Resource):
         try:
             files = await anyio.to_thread.run_sync(self.list_files)
             file_list = [str(f.relative_to(self.path)) for f in files if f.is_file()]
-            return json.dumps({"files": file_list}, indent=2)
+            return json_backend.dumps({"files": file_list}, indent=2)
         except Exception:
             raise ResourceError(f"Error reading directory {self.path}")
@@ -1,5 +1,10 @@
-from typing import Any
+import weakref
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
 
+import anyio
+import mcp.types
 from mcp.server.lowlevel.server import (
     LifespanResultT,
     NotificationOptions,
@@ -9,6 +14,14 @@ from mcp.server.lowlevel.server import (
     Server as _Server,
 )
 from mcp.server.models import InitializationOptions
+from mcp.server.session import ServerSession
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
 
 
 class LowLevelServer(_Server[LifespanResultT, RequestT]):
@@ -20,6 +33,12 @@ class LowLevelServer(_Server[LifespanResultT, RequestT]):
             resources_changed=True,
             tools_changed=True,
         )
+        # sessions that have sent a request, so that notifications can be sent
+        # to all connected clients outside of a request
+        self.sessions: weakref.WeakSet[ServerSession] = weakref.WeakSet()
+        self.request_handlers[mcp.types.PingRequest] = self.track_sessions(
+            self.request_handlers[mcp.types.PingRequest]
+        )
 
     def create_initialization_options(
         self,
@@ -35,3 +54,41 @@ class LowLevelServer(_Server[LifespanResultT, RequestT]):
             experimental_capabilities=experimental_capabilities,
             **kwargs,
         )
+
+    def track_sessions(
+        self, handler: Callable[P, Awaitable[R]]
+    ) -> Callable[P, Awaitable[R]]:
+        """
+        Wraps a request handler so that the session of every request it handles
+        is recorded in `sessions`.
+        """
+
+        @wraps(handler)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            self.sessions.add(self.request_context.session)
+            return await handler(*args, **kwargs)
+
+        return wrapper
+
+    async def broadcast_list_changed(
+        self, *, tools: bool = False, resources: bool = False, prompts: bool = False
+    ) -> None:
+        """Sends list changed notifications to every connected client at once."""
+
+        async def notify(session: ServerSession) -> None:
+            try:
+                if tools:
+                    await session.send_tool_list_changed()
+                if resources:
+                    await session.send_resource_list_changed()
+                if prompts:
+                    await session.send_prompt_list_changed()
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                # the client disconnected
+                self.sessions.discard(session)
+            except Exception as e:
+                logger.warning(f"Failed to send list changed notification: {e}")
+
+        async with anyio.create_task_group() as tg:
+            for session in list(self.sessions):
+                tg.start_soon(notify, session)
@@ -1,9 +1,10 @@
 """Comprehensive logging middleware for FastMCP servers."""
 
-import json
 import logging
 from typing import Any
 
+from fastmcp.utilities import json_backend
+
 from .middleware import CallNext, Middleware, MiddlewareContext
 
 
@@ -59,7 +60,7 @@ class LoggingMiddleware(Middleware):
 
         if self.include_payloads and hasattr(context.message, "__dict__"):
             try:
-                payload = json.dumps(context.message.__dict__, default=str)
+                payload = json_backend.dumps(context.message.__dict__, fallback=str)
                 if len(payload) > self.max_payload_length:
                     payload = payload[: self.max_payload_length] + "..."
                 parts.append(f"payload={payload}")
@@ -152,7 +153,7 @@ class StructuredLoggingMiddleware(Middleware):
         if self.methods and context.method not in self.methods:
             return await call_next(context)
 
-        self.logger.log(self.log_level, json.dumps(start_entry))
+        self.logger.log(self.log_level, json_backend.dumps(start_entry))
 
         try:
             result = await call_next(context)
@@ -162,7 +163,7 @@ class StructuredLoggingMiddleware(Middleware):
                 "request_success",
                 result_type=type(result).__name__ if result else None,
             )
-            self.logger.log(self.log_level, json.dumps(success_entry))
+            self.logger.log(self.log_level, json_backend.dumps(success_entry))
 
             return result
         except Exception as e:
@@ -172,5 +173,5 @@ class StructuredLoggingMiddleware(Middleware):
                 error_type=type(e).__name__,
                 error_message=str(e),
             )
-            self.logger.log(logging.ERROR, json.dumps(error_entry))
+            self.logger.log(logging.ERROR, json_backend.dumps(error_entry))
             raise
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from functools import partial
@@ -120,6 +120,46 @@ def make_middleware_wrapper(
     return wrapper
 
 
+# the hook each kind of message is dispatched to, besides on_message
+_METHOD_HOOKS = {
+    "tools/call": "on_call_tool",
+    "resources/read": "on_read_resource",
+    "prompts/get": "on_get_prompt",
+    "tools/list": "on_list_tools",
+    "resources/list": "on_list_resources",
+    "resources/templates/list": "on_list_resource_templates",
+    "prompts/list": "on_list_prompts",
+}
+_TYPE_HOOKS = {"request": "on_request", "notification": "on_notification"}
+
+
+def compile_middleware(
+    middleware: Sequence[Middleware],
+    method: str | None,
+    message_type: str,
+    call_next: CallNext[Any, Any],
+) -> CallNext[Any, Any]:
+    """
+    Builds the chain of middleware hooks for one kind of message, ending in
+    `call_next`. The chain can be reused for every message with the same method
+    and type, so the hooks are not dispatched again for each message.
+
+    Middleware that overrides `__call__` is called as a whole.
+    """
+    handler: CallNext[Any, Any] = call_next
+    for mw in reversed(middleware):
+        if (
+            not isinstance(mw, Middleware)
+            or type(mw).__call__ is not Middleware.__call__
+            or type(mw)._dispatch_handler is not Middleware._dispatch_handler
+        ):
+            handler = partial(mw, call_next=handler)
+            continue
+        for hook in reversed(mw._get_hooks(method, message_type)):
+            handler = partial(hook, call_next=handler)
+    return handler
+
+
 class Middleware:
     """Base class for FastMCP middleware with dispatching hooks."""
 
@@ -140,33 +180,32 @@ class Middleware:
     ) -> CallNext[Any, Any]:
         """Builds a chain of handlers for a given message."""
         handler = call_next
-
-        match context.method:
-            case "tools/call":
-                handler = partial(self.on_call_tool, call_next=handler)
-            case "resources/read":
-                handler = partial(self.on_read_resource, call_next=handler)
-            case "prompts/get":
-                handler = partial(self.on_get_prompt, call_next=handler)
-            case "tools/list":
-                handler = partial(self.on_list_tools, call_next=handler)
-            case "resources/list":
-                handler = partial(self.on_list_resources, call_next=handler)
-            case "resources/templates/list":
-                handler = partial(self.on_list_resource_templates, call_next=handler)
-            case "prompts/list":
-                handler = partial(self.on_list_prompts, call_next=handler)
-
-        match context.type:
-            case "request":
-                handler = partial(self.on_request, call_next=handler)
-            case "notification":
-                handler = partial(self.on_notification, call_next=handler)
-
-        handler = partial(self.on_message, call_next=handler)
-
+        for hook in reversed(self._get_hooks(context.method, context.type)):
+            handler = partial(hook, call_next=handler)
         return handler
 
+    def _get_hooks(
+        self, method: str | None, message_type: str
+    ) -> list[Callable[..., Awaitable[Any]]]:
+        """
+        Returns the hooks this middleware overrides for a kind of message,
+        outermost first. Hooks that are not overridden only call the next
+        handler, so they are left out of the chain.
+        """
+        names = (
+            "on_message",
+            _TYPE_HOOKS.get(message_type),
+            _METHOD_HOOKS.get(method) if method is not None else None,
+        )
+        hooks: list[Callable[..., Awaitable[Any]]] = []
+        for name in names:
+            if name is None:
+                continue
+            hook = getattr(self, name)
+            if getattr(hook, "__func__", None) is not getattr(Middleware, name):
+                hooks.append(hook)
+        return hooks
+
     async def on_message(
         self,
         context: MiddlewareContext[Any],
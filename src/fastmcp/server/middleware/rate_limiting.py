@@ -1,10 +1,11 @@
 """Rate limiting middleware for protecting FastMCP servers from abuse."""
 
-import asyncio
+import abc
+import math
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Generic, Protocol, TypeVar
 
 from mcp import McpError
 from mcp.types import ErrorData
@@ -12,6 +13,13 @@ from mcp.types import ErrorData
 from .middleware import CallNext, Middleware, MiddlewareContext
 
 
+class _RateLimiter(Protocol):
+    def is_idle(self, now: float) -> bool: ...
+
+
+LimiterT = TypeVar("LimiterT", bound=_RateLimiter)
+
+
 class RateLimitError(McpError):
     """Error raised when rate limit is exceeded."""
 
@@ -20,7 +28,11 @@ class RateLimitError(McpError):
 
 
 class TokenBucketRateLimiter:
-    """Token bucket implementation for rate limiting."""
+    """Token bucket implementation for rate limiting.
+
+    Consuming tokens never awaits, so a bucket used from a single event loop
+    needs no lock.
+    """
 
     def __init__(self, capacity: int, refill_rate: float):
         """Initialize token bucket.
@@ -31,37 +43,113 @@ class TokenBucketRateLimiter:
         """
         self.capacity = capacity
         self.refill_rate = refill_rate
-        self.tokens = capacity
-        self.last_refill = time.time()
-        self._lock = asyncio.Lock()
+        self.tokens: float = capacity
+        self.last_refill = time.monotonic()
 
-    async def consume(self, tokens: int = 1) -> bool:
+    def try_consume(self, tokens: float = 1, now: float | None = None) -> bool:
         """Try to consume tokens from the bucket.
 
         Args:
             tokens: Number of tokens to consume
+            now: The current time.monotonic() value, if the caller has it
 
         Returns:
             True if tokens were available and consumed, False otherwise
         """
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_refill
+        if now is None:
+            now = time.monotonic()
+        elapsed = now - self.last_refill
 
-            # Add tokens based on elapsed time
+        # Add tokens based on elapsed time. `now` may predate the bucket if it
+        # was read before the bucket was created.
+        if elapsed > 0:
             self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
             self.last_refill = now
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            return False
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    async def consume(self, tokens: float = 1) -> bool:
+        """Try to consume tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            True if tokens were available and consumed, False otherwise
+        """
+        return self.try_consume(tokens)
+
+    def is_idle(self, now: float) -> bool:
+        """Whether the bucket has refilled, so it is the same as a new bucket."""
+        elapsed = now - self.last_refill
+        return self.tokens + elapsed * self.refill_rate >= self.capacity
+
+
+class RateLimiterStore(Generic[LimiterT]):
+    """
+    Rate limiters by client ID, created on first use.
+
+    Limiters that have been idle long enough to behave like new ones are
+    evicted as the store is used. If the store still holds `max_size`
+    limiters, the least recently used one is evicted, which resets that
+    client's limit.
+    """
+
+    def __init__(self, factory: Callable[[], LimiterT], max_size: int = 10_000):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.factory = factory
+        self.max_size = max_size
+        self._limiters: OrderedDict[str, LimiterT] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def __contains__(self, client_id: str) -> bool:
+        return client_id in self._limiters
+
+    def __getitem__(self, client_id: str) -> LimiterT:
+        return self.get(client_id)
+
+    def get(self, client_id: str, now: float | None = None) -> LimiterT:
+        """Returns the limiter for a client, creating it if needed."""
+        if now is None:
+            now = time.monotonic()
+        limiters = self._limiters
+        limiter = limiters.get(client_id)
+        if limiter is not None:
+            limiters.move_to_end(client_id)
+        else:
+            limiter = limiters[client_id] = self.factory()
+            if len(limiters) > self.max_size:
+                limiters.popitem(last=False)
+
+        # evict a few of the least recently used limiters if they are idle, so
+        # eviction keeps up with the rate new clients are added
+        for _ in range(2):
+            oldest_id, oldest = next(iter(limiters.items()))
+            if oldest is limiter or not oldest.is_idle(now):
+                break
+            del limiters[oldest_id]
+        return limiter
+
+    def clear(self) -> None:
+        self._limiters.clear()
 
 
 class SlidingWindowRateLimiter:
-    """Sliding window rate limiter implementation."""
+    """Sliding window rate limiter implementation.
+
+    Approximates a sliding window with request counts for the current and
+    previous fixed windows: the previous window's count is weighted by how
+    much of it the sliding window still covers. Memory use is constant, no
+    matter how many requests are allowed per window.
+    """
 
-    def __init__(self, max_requests: int, window_seconds: int):
+    def __init__(self, max_requests: int, window_seconds: float):
         """Initialize sliding window rate limiter.
 
         Args:
@@ -70,23 +158,167 @@ class SlidingWindowRateLimiter:
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = deque()
-        self._lock = asyncio.Lock()
+        self.window = int(time.monotonic() // window_seconds)
+        self.current_count = 0
+        self.previous_count = 0
+
+    def _advance(self, now: float) -> None:
+        """Moves the counts forward to the window containing `now`."""
+        window = int(now // self.window_seconds)
+        if window > self.window:
+            if window == self.window + 1:
+                self.previous_count = self.current_count
+            else:
+                self.previous_count = 0
+            self.current_count = 0
+            self.window = window
+
+    def count(self, now: float) -> float:
+        """The estimated number of requests in the window ending at `now`."""
+        self._advance(now)
+        elapsed = max(now / self.window_seconds - self.window, 0)
+        return self.previous_count * (1 - elapsed) + self.current_count
+
+    def try_acquire(self, cost: int = 1, now: float | None = None) -> bool:
+        """Allow a request if it fits in the window, and count it.
+
+        Args:
+            cost: Number of requests to count. A cost above `max_requests` is
+                never allowed.
+            now: The current time.monotonic() value, if the caller has it
+        """
+        if now is None:
+            now = time.monotonic()
+        if self.count(now) + cost > self.max_requests:
+            return False
+        self.current_count += cost
+        return True
 
     async def is_allowed(self) -> bool:
         """Check if a request is allowed."""
-        async with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
+        return self.try_acquire()
+
+    def is_idle(self, now: float) -> bool:
+        """Whether no requests are counted in the window ending at `now`."""
+        return self.count(now) == 0
 
-            # Remove old requests outside the window
-            while self.requests and self.requests[0] < cutoff:
-                self.requests.popleft()
 
-            if len(self.requests) < self.max_requests:
-                self.requests.append(now)
-                return True
+class RateLimitStorage(abc.ABC):
+    """
+    Storage for sliding window rate limits by key.
+
+    Limits kept in a storage shared by several processes, such as
+    RedisRateLimitStorage, apply to all of them together.
+    """
+
+    @abc.abstractmethod
+    async def acquire(
+        self, key: str, max_requests: int, window_seconds: float, cost: int = 1
+    ) -> bool:
+        """
+        Allow a request for a key if it fits in the window, and count it. A
+        request costing more than `max_requests` is never allowed.
+        """
+        raise NotImplementedError
+
+
+class MemoryRateLimitStorage(RateLimitStorage):
+    """Keeps sliding window rate limits in memory, for a single process."""
+
+    def __init__(self, max_keys: int = 10_000):
+        """
+        Args:
+            max_keys: Maximum number of keys tracked at once for each limit.
+                Idle keys are forgotten first.
+        """
+        self.max_keys = max_keys
+        self._stores: dict[
+            tuple[int, float], RateLimiterStore[SlidingWindowRateLimiter]
+        ] = {}
+
+    def store(
+        self, max_requests: int, window_seconds: float
+    ) -> RateLimiterStore[SlidingWindowRateLimiter]:
+        """Returns the limiters by key for a limit."""
+        store = self._stores.get((max_requests, window_seconds))
+        if store is None:
+            store = self._stores[(max_requests, window_seconds)] = RateLimiterStore(
+                lambda: SlidingWindowRateLimiter(max_requests, window_seconds),
+                max_size=self.max_keys,
+            )
+        return store
+
+    async def acquire(
+        self, key: str, max_requests: int, window_seconds: float, cost: int = 1
+    ) -> bool:
+        now = time.monotonic()
+        store = self.store(max_requests, window_seconds)
+        return store.get(key, now).try_acquire(cost, now)
+
+
+class RedisRateLimitStorage(RateLimitStorage):
+    """
+    Keeps sliding window rate limits in Redis, so that processes sharing a
+    Redis server share their limits.
+
+    Each window's count is a Redis key that expires once it can no longer
+    affect the limit. The key is created with its expiry, counted, and read
+    together with the previous window's count in a single transaction.
+    Requests are counted before they are checked, and uncounted if they are
+    rejected, so concurrent processes cannot exceed the limit together.
+
+    Example:
+        ```python
+        from redis.asyncio import Redis
+
+        rate_limiter = SlidingWindowRateLimitingMiddleware(
+            max_requests=100,
+            storage=RedisRateLimitStorage(Redis()),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        prefix: str = "fastmcp:rate_limit",
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            redis: An asyncio Redis client, such as `redis.asyncio.Redis`, or
+                any object with the same `pipeline` and async `decrby` methods
+            prefix: Prefix of the Redis keys
+            clock: Returns the current time in seconds. Windows are aligned to
+                it, so processes sharing limits should use the same clock; the
+                default, wall clock time, is shared by synchronized hosts.
+        """
+        self.redis = redis
+        self.prefix = prefix
+        self.clock = clock
+
+    async def acquire(
+        self, key: str, max_requests: int, window_seconds: float, cost: int = 1
+    ) -> bool:
+        if cost > max_requests:
+            return False
+        now = self.clock()
+        window = int(now // window_seconds)
+        current_key = f"{self.prefix}:{key}:{window}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            # create the count with its expiry, so it cannot outlive it
+            pipe.set(current_key, 0, nx=True, ex=math.ceil(window_seconds * 2))
+            pipe.incrby(current_key, cost)
+            pipe.get(f"{self.prefix}:{key}:{window - 1}")
+            _, current_count, previous_count = await pipe.execute()
+        previous_count = int(previous_count or 0)
+
+        elapsed = now / window_seconds - window
+        if previous_count * (1 - elapsed) + current_count > max_requests:
+            await self.redis.decrby(current_key, cost)
             return False
+        return True
 
 
 class RateLimitingMiddleware(Middleware):
@@ -116,6 +348,9 @@ class RateLimitingMiddleware(Middleware):
         burst_capacity: int | None = None,
         get_client_id: Callable[[MiddlewareContext], str] | None = None,
         global_limit: bool = False,
+        method_costs: dict[str, float] | None = None,
+        tool_costs: dict[str, float] | None = None,
+        max_clients: int = 10_000,
     ):
         """Initialize rate limiting middleware.
 
@@ -124,17 +359,37 @@ class RateLimitingMiddleware(Middleware):
             burst_capacity: Maximum burst capacity. If None, defaults to 2x max_requests_per_second
             get_client_id: Function to extract client ID from context. If None, uses global limiting
             global_limit: If True, apply limit globally; if False, per-client
+            method_costs: Tokens consumed by requests for each method (e.g.
+                "tools/list"). Other requests consume one token.
+            tool_costs: Tokens consumed by calls to each tool, by tool name.
+                These take precedence over the cost of "tools/call".
+            max_clients: Maximum number of clients whose limits are tracked at
+                once. Idle clients are forgotten first.
+
+        Raises:
+            ValueError: If a method or tool costs more tokens than
+                `burst_capacity`, since such requests could never be allowed.
         """
         self.max_requests_per_second = max_requests_per_second
         self.burst_capacity = burst_capacity or int(max_requests_per_second * 2)
         self.get_client_id = get_client_id
         self.global_limit = global_limit
+        self.method_costs = method_costs or {}
+        self.tool_costs = tool_costs or {}
+
+        for name, cost in {**self.method_costs, **self.tool_costs}.items():
+            if cost > self.burst_capacity:
+                raise ValueError(
+                    f"The cost of {name!r} ({cost}) exceeds the burst capacity "
+                    f"({self.burst_capacity}), so it could never be allowed"
+                )
 
         # Storage for rate limiters per client
-        self.limiters: dict[str, TokenBucketRateLimiter] = defaultdict(
+        self.limiters = RateLimiterStore(
             lambda: TokenBucketRateLimiter(
                 self.burst_capacity, self.max_requests_per_second
-            )
+            ),
+            max_size=max_clients,
         )
 
         # Global rate limiter
@@ -149,18 +404,30 @@ class RateLimitingMiddleware(Middleware):
             return self.get_client_id(context)
         return "global"
 
+    def _get_cost(self, context: MiddlewareContext) -> float:
+        """Get the number of tokens a request consumes."""
+        if context.method is None:
+            return 1
+        if self.tool_costs and context.method == "tools/call":
+            name = getattr(context.message, "name", None)
+            if name is not None and (cost := self.tool_costs.get(name)) is not None:
+                return cost
+        return self.method_costs.get(context.method, 1)
+
     async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
         """Apply rate limiting to requests."""
+        now = time.monotonic()
+        cost = self._get_cost(context)
         if self.global_limit:
             # Global rate limiting
-            allowed = await self.global_limiter.consume()
+            allowed = self.global_limiter.try_consume(cost, now)
             if not allowed:
                 raise RateLimitError("Global rate limit exceeded")
         else:
             # Per-client rate limiting
             client_id = self._get_client_identifier(context)
-            limiter = self.limiters[client_id]
-            allowed = await limiter.consume()
+            limiter = self.limiters.get(client_id, now)
+            allowed = limiter.try_consume(cost, now)
             if not allowed:
                 raise RateLimitError(f"Rate limit exceeded for client: {client_id}")
 
@@ -170,8 +437,10 @@ class RateLimitingMiddleware(Middleware):
 class SlidingWindowRateLimitingMiddleware(Middleware):
     """Middleware that implements sliding window rate limiting.
 
-    Uses a sliding window approach which provides more precise rate limiting
-    but uses more memory to track individual request timestamps.
+    Uses a sliding window approach, which limits the number of requests in
+    any window of time rather than allowing bursts. Limits are kept in memory
+    by default; pass a shared storage such as RedisRateLimitStorage to apply
+    them across processes.
 
     Example:
         ```python
@@ -193,6 +462,7 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
         max_requests: int,
         window_minutes: int = 1,
         get_client_id: Callable[[MiddlewareContext], str] | None = None,
+        storage: RateLimitStorage | None = None,
     ):
         """Initialize sliding window rate limiting middleware.
 
@@ -200,15 +470,24 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
             max_requests: Maximum requests allowed in the time window
             window_minutes: Time window in minutes
             get_client_id: Function to extract client ID from context
+            storage: Where the limits are kept. If None, they are kept in memory.
         """
         self.max_requests = max_requests
         self.window_seconds = window_minutes * 60
         self.get_client_id = get_client_id
+        self.storage = storage or MemoryRateLimitStorage()
 
-        # Storage for rate limiters per client
-        self.limiters: dict[str, SlidingWindowRateLimiter] = defaultdict(
-            lambda: SlidingWindowRateLimiter(self.max_requests, self.window_seconds)
-        )
+    @property
+    def limiters(self) -> RateLimiterStore[SlidingWindowRateLimiter]:
+        """
+        The limiters by client ID, if the limits are kept in a
+        MemoryRateLimitStorage.
+        """
+        if not isinstance(self.storage, MemoryRateLimitStorage):
+            raise AttributeError(
+                f"Limiters are kept in {type(self.storage).__name__}, not in memory"
+            )
+        return self.storage.store(self.max_requests, self.window_seconds)
 
     def _get_client_identifier(self, context: MiddlewareContext) -> str:
         """Get client identifier for rate limiting."""
@@ -219,9 +498,10 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
     async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
         """Apply sliding window rate limiting to requests."""
         client_id = self._get_client_identifier(context)
-        limiter = self.limiters[client_id]
 
-        allowed = await limiter.is_allowed()
+        allowed = await self.storage.acquire(
+            client_id, self.max_requests, self.window_seconds
+        )
         if not allowed:
             raise RateLimitError(
                 f"Rate limit exceeded: {self.max_requests} requests per "
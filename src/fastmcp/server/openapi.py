@@ -3,32 +3,45 @@
 from __future__ import annotations
 
 import enum
+import hashlib
 import json
 import re
+import time
 import warnings
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from pathlib import Path
 from re import Pattern
 from typing import TYPE_CHECKING, Any, Literal
 
+import anyio
 import httpx
 from mcp.types import ToolAnnotations
 from pydantic.networks import AnyUrl
 
 import fastmcp
-from fastmcp.exceptions import ToolError
+from fastmcp.exceptions import ResourceError, ToolError
 from fastmcp.resources import Resource, ResourceTemplate
 from fastmcp.server.dependencies import get_http_headers
 from fastmcp.server.server import FastMCP
 from fastmcp.tools.tool import Tool, ToolResult
-from fastmcp.utilities import openapi
+from fastmcp.utilities import json_backend, openapi
+from fastmcp.utilities.http import (
+    HTTPPoolConfig,
+    HTTPPoolStats,
+    PooledAsyncClient,
+    send_with_limit,
+    truncate_response,
+)
+from fastmcp.utilities.http_cache import HTTPCache, request_key
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.openapi import (
     HTTPRoute,
     _combine_schemas,
     format_description_with_responses,
 )
+from fastmcp.utilities.types import NotSet, NotSetT
 
 if TYPE_CHECKING:
     from fastmcp.server import Context
@@ -125,6 +138,12 @@ class RouteMap:
             "description": "A set of tags to apply to the generated FastMCP component."
         },
     )
+    cache: HTTPCache | None = field(
+        default=None,
+        metadata={
+            "description": "An HTTP cache for the GET requests of the generated FastMCP component."
+        },
+    )
 
     def __post_init__(self):
         """Validate and process the route map after initialization."""
@@ -178,6 +197,82 @@ DEFAULT_ROUTE_MAPPINGS = [
 ]
 
 
+class RouteMapIndex:
+    """
+    Classifies routes against a list of RouteMaps.
+
+    Patterns are compiled once and route maps are indexed by HTTP method, so
+    each route is only checked against the route maps that apply to its
+    method. Route maps keep their priority order (first match wins).
+    """
+
+    def __init__(self, mappings: list[RouteMap]):
+        self.mappings = mappings
+        compiled = [
+            (route_map, re.compile(route_map.pattern)) for route_map in mappings
+        ]
+        # route maps for methods that no route map lists explicitly
+        self._wildcard = [
+            (route_map, pattern)
+            for route_map, pattern in compiled
+            if route_map.methods == "*"
+        ]
+        methods = {
+            method
+            for route_map in mappings
+            if route_map.methods != "*"
+            for method in route_map.methods
+        }
+        self._by_method = {
+            method: [
+                (route_map, pattern)
+                for route_map, pattern in compiled
+                if route_map.methods == "*" or method in route_map.methods
+            ]
+            for method in methods
+        }
+
+        self.routes_classified = 0
+        self.classification_time = 0.0
+
+    def match(self, route: openapi.HTTPRoute) -> RouteMap:
+        """
+        Returns the first RouteMap that matches the route, or a catchall "Tool"
+        RouteMap if no match is found.
+        """
+        start = time.perf_counter()
+        try:
+            return self._match(route)
+        finally:
+            self.routes_classified += 1
+            self.classification_time += time.perf_counter() - start
+
+    def _match(self, route: openapi.HTTPRoute) -> RouteMap:
+        candidates = self._by_method.get(route.method, self._wildcard)
+        route_tags: set[str] | None = None
+        for route_map, pattern in candidates:
+            if not pattern.search(route.path):
+                continue
+
+            # If route_map.tags is non-empty, all tags must be present in
+            # route.tags (AND condition)
+            if route_map.tags:
+                if route_tags is None:
+                    route_tags = set(route.tags or [])
+                if not route_map.tags.issubset(route_tags):
+                    continue
+
+            # We know mcp_type is not None here due to post_init validation
+            assert route_map.mcp_type is not None
+            logger.debug(
+                f"Route {route.method} {route.path} matched mapping to {route_map.mcp_type.name}"
+            )
+            return route_map
+
+        # Default fallback
+        return RouteMap(mcp_type=MCPType.TOOL)
+
+
 def _determine_route_type(
     route: openapi.HTTPRoute,
     mappings: list[RouteMap],
@@ -192,35 +287,424 @@ def _determine_route_type(
     Returns:
         The RouteMap that matches the route, or a catchall "Tool" RouteMap if no match is found.
     """
-    # Check mappings in priority order (first match wins)
-    for route_map in mappings:
-        # Check if the HTTP method matches
-        if route_map.methods == "*" or route.method in route_map.methods:
-            # Handle both string patterns and compiled Pattern objects
-            if isinstance(route_map.pattern, Pattern):
-                pattern_matches = route_map.pattern.search(route.path)
-            else:
-                pattern_matches = re.search(route_map.pattern, route.path)
-
-            if pattern_matches:
-                # Check if tags match (if specified)
-                # If route_map.tags is empty, tags are not matched
-                # If route_map.tags is non-empty, all tags must be present in route.tags (AND condition)
-                if route_map.tags:
-                    route_tags_set = set(route.tags or [])
-                    if not route_map.tags.issubset(route_tags_set):
-                        # Tags don't match, continue to next mapping
-                        continue
-
-                # We know mcp_type is not None here due to post_init validation
-                assert route_map.mcp_type is not None
-                logger.debug(
-                    f"Route {route.method} {route.path} matched mapping to {route_map.mcp_type.name}"
+    return RouteMapIndex(mappings).match(route)
+
+
+def _get_server_url(openapi_spec: dict[str, Any]) -> str:
+    """Returns the URL of the first server listed in an OpenAPI spec."""
+    servers = openapi_spec.get("servers") or []
+    if not servers or not servers[0].get("url"):
+        raise ValueError(
+            "The OpenAPI spec does not list a server URL; provide a client "
+            "configured with a base_url"
+        )
+    return servers[0]["url"]
+
+
+def spec_hash(openapi_spec: dict[str, Any]) -> str:
+    """
+    Returns a hash identifying the contents of an OpenAPI spec. Values that
+    are not JSON types, such as dates in specs loaded from YAML, are hashed as
+    strings.
+    """
+    canonical = json.dumps(
+        openapi_spec, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class _RouteSnapshot:
+    """A route, together with the parts of its components derived from it."""
+
+    route: HTTPRoute
+    # the combined input schema of the route's tool
+    parameters: dict[str, Any] | None = None
+    # formatted descriptions, keyed by component type
+    descriptions: dict[str, str] = field(default_factory=dict)
+    changed: bool = True
+
+    def input_schema(self) -> dict[str, Any]:
+        if self.parameters is None:
+            self.parameters = _combine_schemas(self.route)
+            self.changed = True
+        return self.parameters
+
+    def description(self, component_type: str, fallback: str) -> str:
+        if component_type not in self.descriptions:
+            self.descriptions[component_type] = format_description_with_responses(
+                base_description=self.route.description
+                or self.route.summary
+                or fallback,
+                responses=self.route.responses,
+                parameters=self.route.parameters,
+                request_body=self.route.request_body,
+            )
+            self.changed = True
+        return self.descriptions[component_type]
+
+
+def _pack_definitions(
+    schema: dict[str, Any] | None, definitions: dict[str, Any]
+) -> dict[str, Any] | None:
+    """
+    Replaces the definitions of an input schema that are unchanged from the
+    spec's with None, so that each is stored only once.
+    """
+    if schema is None or "$defs" not in schema:
+        return schema
+    return {
+        **schema,
+        "$defs": {
+            name: None if definitions.get(name) == value else value
+            for name, value in schema["$defs"].items()
+        },
+    }
+
+
+def _unpack_definitions(
+    schema: dict[str, Any] | None, definitions: dict[str, Any]
+) -> dict[str, Any] | None:
+    if schema is None or "$defs" not in schema:
+        return schema
+    schema["$defs"] = {
+        name: definitions[name] if value is None else value
+        for name, value in schema["$defs"].items()
+    }
+    return schema
+
+
+class OpenAPISnapshot:
+    """
+    The routes parsed from an OpenAPI spec, along with the input schemas and
+    descriptions derived from them, so that a server can be rebuilt from the
+    same spec without parsing it again.
+
+    Snapshots are keyed by the hash of the spec they were built from. Only
+    the route-derived parts of components are stored; route maps, names,
+    tags and `mcp_component_fn` are applied again when a server is built, so
+    they may change without invalidating the snapshot.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        spec_hash: str | None,
+        routes: list[_RouteSnapshot],
+        openapi_spec: dict[str, Any] | None = None,
+    ):
+        if spec_hash is None and openapi_spec is None:
+            raise ValueError("Provide either a spec hash or the spec")
+        self._spec_hash = spec_hash
+        self._openapi_spec = openapi_spec
+        self.routes = routes
+
+    @classmethod
+    def from_spec(cls, openapi_spec: dict[str, Any]) -> OpenAPISnapshot:
+        """
+        Parses a spec into a snapshot whose components are derived lazily. The
+        spec is hashed only when the hash is first needed.
+        """
+        return cls(
+            spec_hash=None,
+            routes=[
+                _RouteSnapshot(route)
+                for route in openapi.parse_openapi_to_http_routes(openapi_spec)
+            ],
+            openapi_spec=openapi_spec,
+        )
+
+    @property
+    def spec_hash(self) -> str:
+        """The hash of the spec the snapshot was built from."""
+        if self._spec_hash is None:
+            assert self._openapi_spec is not None
+            self._spec_hash = spec_hash(self._openapi_spec)
+            self._openapi_spec = None
+        return self._spec_hash
+
+    @property
+    def changed(self) -> bool:
+        """Whether anything was derived since the snapshot was loaded."""
+        return any(route.changed for route in self.routes)
+
+    def to_json(self) -> str:
+        # all routes of a spec share its schema definitions, so they are
+        # stored once
+        definitions = self.routes[0].route.schema_definitions if self.routes else {}
+        return json_backend.dumps(
+            {
+                "version": self.VERSION,
+                "spec_hash": self.spec_hash,
+                "schema_definitions": definitions,
+                "routes": [
+                    {
+                        "route": entry.route.model_dump(
+                            mode="json", by_alias=True, exclude={"schema_definitions"}
+                        ),
+                        "parameters": _pack_definitions(entry.parameters, definitions),
+                        "descriptions": entry.descriptions,
+                    }
+                    for entry in self.routes
+                ],
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> OpenAPISnapshot:
+        data = json_backend.loads(text)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported snapshot version: {data.get('version')}")
+        definitions = data["schema_definitions"]
+        routes = []
+        for entry in data["routes"]:
+            route = HTTPRoute.model_validate(entry["route"])
+            route.schema_definitions = definitions
+            routes.append(
+                _RouteSnapshot(
+                    route=route,
+                    parameters=_unpack_definitions(entry["parameters"], definitions),
+                    descriptions=entry["descriptions"],
+                    changed=False,
+                )
+            )
+        return cls(spec_hash=data["spec_hash"], routes=routes)
+
+    def save(self, path: str | Path) -> None:
+        """Writes the snapshot to a file, replacing it atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(self.to_json())
+        tmp_path.replace(path)
+        for entry in self.routes:
+            entry.changed = False
+
+    @classmethod
+    def load(
+        cls, path: str | Path, openapi_spec: dict[str, Any]
+    ) -> OpenAPISnapshot | None:
+        """
+        Reads a snapshot from a file. Returns None if there is no usable
+        snapshot for the spec.
+        """
+        path = Path(path)
+        try:
+            snapshot = cls.from_json(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable OpenAPI snapshot {path}: {e}")
+            return None
+
+        if snapshot.spec_hash != spec_hash(openapi_spec):
+            logger.info(f"Ignoring OpenAPI snapshot {path} built from another spec")
+            return None
+        return snapshot
+
+
+class _InFlightRequest:
+    def __init__(self):
+        self.done = anyio.Event()
+        self.response: httpx.Response | None = None
+        self.error: Exception | None = None
+
+
+class RequestCoalescer:
+    """
+    Deduplicates identical concurrent GET requests, so that when several
+    components send the same request (same URL, query, and headers) while it is
+    in flight, only one is sent upstream and its response is shared.
+
+    Responses are fully read before they are shared. If the request that is
+    being waited on is cancelled, the waiting requests are sent again rather
+    than cancelled with it.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, _InFlightRequest] = {}
+        self.coalesced = 0
+
+    async def send(
+        self,
+        request: httpx.Request,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        key = request_key(request)
+        while (in_flight := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+            await in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            if in_flight.response is not None:
+                return in_flight.response
+            # the request was cancelled, so send it again
+
+        in_flight = self._in_flight[key] = _InFlightRequest()
+        try:
+            in_flight.response = await send()
+            return in_flight.response
+        except Exception as e:
+            in_flight.error = e
+            raise
+        finally:
+            del self._in_flight[key]
+            in_flight.done.set()
+
+
+async def _send_request(
+    client: httpx.AsyncClient,
+    cache: HTTPCache | None,
+    coalescer: RequestCoalescer | None,
+    method: str,
+    url: str,
+    params: dict[str, Any],
+    headers: dict[str, str],
+    timeout: float | httpx.Timeout | None,
+    json: Any = None,
+    max_size: int | None = None,
+) -> httpx.Response:
+    """
+    Sends a request. GET requests go through the HTTP cache and are coalesced
+    with identical in-flight requests, if configured.
+
+    If `max_size` is set, response bodies are truncated to that many bytes, and
+    the response's "truncated" extension says whether they were. They are
+    streamed so that larger bodies are not downloaded, unless they pass through
+    the HTTP cache, which stores complete responses.
+    """
+    # only GET requests without a body may share responses
+    shareable = method == "GET" and json is None
+    if max_size is None and not (shareable and (cache or coalescer)):
+        return await client.request(
+            method=method,
+            url=url,
+            params=params,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+        )
+
+    request = client.build_request(
+        method, url, params=params, headers=headers, json=json, timeout=timeout
+    )
+
+    async def send() -> httpx.Response:
+        if shareable and cache is not None:
+            response = await cache.send_request(client, request)
+            if max_size is not None:
+                response = truncate_response(response, max_size)
+            return response
+        if max_size is not None:
+            return await send_with_limit(client, request, max_size)
+        return await client.send(request)
+
+    if shareable and coalescer is not None:
+        return await coalescer.send(request, send)
+    return await send()
+
+
+def _format_array_value(value: list[Any]) -> str:
+    """
+    Formats an array parameter as a comma-separated string, following the
+    OpenAPI 'simple' and non-exploded 'form' styles.
+    """
+    # Handle simple array types
+    if all(isinstance(item, str | int | float | bool) for item in value):
+        return ",".join(str(v) for v in value)
+
+    # Handle complex array types (containing objects/dicts), creating a simple
+    # representation without Python syntax artifacts
+    formatted_parts = []
+    for item in value:
+        if isinstance(item, dict):
+            # For objects, serialize key-value pairs
+            formatted_parts.append(".".join(f"{k}:{v}" for k, v in item.items()))
+        else:
+            # Fallback for other complex types
+            formatted_parts.append(str(item))
+    return ",".join(formatted_parts)
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """
+    Precomputed instructions for building the HTTP request of a route from tool
+    arguments, so that individual calls don't re-scan the route's parameters.
+    """
+
+    # the route path split around its parameters; odd items are parameter names
+    path_parts: tuple[str, ...]
+    # (name, is_array) for each path parameter
+    path_params: tuple[tuple[str, bool], ...]
+    required_path_params: frozenset[str]
+    # (name, is_array, explode) for each query parameter
+    query_params: tuple[tuple[str, bool, bool], ...]
+    # (name, header name) for each header parameter
+    header_params: tuple[tuple[str, str], ...]
+    # arguments that are not sent in the request body, or None if the route
+    # has no body
+    non_body_args: frozenset[str] | None
+
+    @classmethod
+    def from_route(cls, route: openapi.HTTPRoute) -> RequestPlan:
+        # array handling of path parameters follows the schema of the first
+        # parameter with a given name
+        schemas_by_name: dict[str, dict[str, Any]] = {}
+        for p in route.parameters:
+            schemas_by_name.setdefault(p.name, p.schema_)
+
+        non_body_args = None
+        if route.request_body and route.request_body.content_schema:
+            non_body_args = frozenset(
+                [
+                    *(
+                        p.name
+                        for p in route.parameters
+                        if p.location in ("path", "query", "header")
+                    ),
+                    "context",
+                ]
+            )
+
+        return cls(
+            path_parts=tuple(re.split(r"\{([^}]+)\}", route.path)),
+            path_params=tuple(
+                (p.name, schemas_by_name[p.name].get("type") == "array")
+                for p in route.parameters
+                if p.location == "path"
+            ),
+            required_path_params=frozenset(
+                p.name for p in route.parameters if p.location == "path" and p.required
+            ),
+            query_params=tuple(
+                (
+                    p.name,
+                    p.schema_.get("type") == "array",
+                    # explode defaults to True for query parameters
+                    p.schema_.get("explode", True),
                 )
-                return route_map
+                for p in route.parameters
+                if p.location == "query"
+            ),
+            header_params=tuple(
+                (p.name, p.name.lower())
+                for p in route.parameters
+                if p.location == "header"
+            ),
+            non_body_args=non_body_args,
+        )
 
-    # Default fallback
-    return RouteMap(mcp_type=MCPType.TOOL)
+    def format_path(self, path_values: dict[str, str]) -> str:
+        """Substitutes path parameter values into the route path."""
+        if len(self.path_parts) == 1:
+            return self.path_parts[0]
+        parts = list(self.path_parts)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = path_values.get(name, f"{{{name}}}")
+        return "".join(parts)
 
 
 class OpenAPITool(Tool):
@@ -234,9 +718,11 @@ class OpenAPITool(Tool):
         description: str,
         parameters: dict[str, Any],
         tags: set[str] | None = None,
-        timeout: float | None = None,
+        timeout: float | httpx.Timeout | None = None,
         annotations: ToolAnnotations | None = None,
         serializer: Callable[[Any], str] | None = None,
+        cache: HTTPCache | None = None,
+        coalescer: RequestCoalescer | None = None,
     ):
         super().__init__(
             name=name,
@@ -249,6 +735,9 @@ class OpenAPITool(Tool):
         self._client = client
         self._route = route
         self._timeout = timeout
+        self._cache = cache
+        self._coalescer = coalescer
+        self._plan = RequestPlan.from_route(route)
 
     def __repr__(self) -> str:
         """Custom representation to prevent recursion errors when printing."""
@@ -256,178 +745,84 @@ class OpenAPITool(Tool):
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Execute the HTTP request based on the route configuration."""
-
-        # Prepare URL
-        path = self._route.path
-
-        # Replace path parameters with values from kwargs
-        # Path parameters should never be None as they're typically required
-        # but we'll handle that case anyway
-        path_params = {
-            p.name: arguments.get(p.name)
-            for p in self._route.parameters
-            if p.location == "path"
-            and p.name in arguments
-            and arguments.get(p.name) is not None
-        }
+        plan = self._plan
+
+        # Format path parameters. Path parameters should never be None as
+        # they're typically required, but we'll handle that case anyway
+        path_values: dict[str, str] = {}
+        for name, is_array in plan.path_params:
+            param_value = arguments.get(name)
+            if param_value is None:
+                continue
+
+            # Format array values as comma-separated string
+            # This follows the OpenAPI 'simple' style (default for path)
+            if is_array and isinstance(param_value, list):
+                try:
+                    path_values[name] = _format_array_value(param_value)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to format complex array path parameter '{name}': {e}"
+                    )
+                    # Fallback to string representation, but remove Python syntax artifacts
+                    path_values[name] = (
+                        str(param_value)
+                        .replace("[", "")
+                        .replace("]", "")
+                        .replace("'", "")
+                        .replace('"', "")
+                    )
+            else:
+                path_values[name] = str(param_value)
 
         # Ensure all path parameters are provided
-        required_path_params = {
-            p.name
-            for p in self._route.parameters
-            if p.location == "path" and p.required
-        }
-        missing_params = required_path_params - path_params.keys()
+        missing_params = plan.required_path_params - path_values.keys()
         if missing_params:
             raise ToolError(f"Missing required path parameters: {missing_params}")
 
-        for param_name, param_value in path_params.items():
-            # Handle array path parameters with style 'simple' (comma-separated)
-            # In OpenAPI, 'simple' is the default style for path parameters
-            param_info = next(
-                (p for p in self._route.parameters if p.name == param_name), None
-            )
-
-            if param_info and isinstance(param_value, list):
-                # Check if schema indicates an array type
-                schema = param_info.schema_
-                is_array = schema.get("type") == "array"
-
-                if is_array:
-                    # Format array values as comma-separated string
-                    # This follows the OpenAPI 'simple' style (default for path)
-                    if all(
-                        isinstance(item, str | int | float | bool)
-                        for item in param_value
-                    ):
-                        # Handle simple array types
-                        path = path.replace(
-                            f"{{{param_name}}}", ",".join(str(v) for v in param_value)
-                        )
-                    else:
-                        # Handle complex array types (containing objects/dicts)
-                        try:
-                            # Try to create a simple representation without Python syntax artifacts
-                            formatted_parts = []
-                            for item in param_value:
-                                if isinstance(item, dict):
-                                    # For objects, serialize key-value pairs
-                                    item_parts = []
-                                    for k, v in item.items():
-                                        item_parts.append(f"{k}:{v}")
-                                    formatted_parts.append(".".join(item_parts))
-                                else:
-                                    # Fallback for other complex types
-                                    formatted_parts.append(str(item))
-
-                            # Join parts with commas
-                            formatted_value = ",".join(formatted_parts)
-                            path = path.replace(f"{{{param_name}}}", formatted_value)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to format complex array path parameter '{param_name}': {e}"
-                            )
-                            # Fallback to string representation, but remove Python syntax artifacts
-                            str_value = (
-                                str(param_value)
-                                .replace("[", "")
-                                .replace("]", "")
-                                .replace("'", "")
-                                .replace('"', "")
-                            )
-                            path = path.replace(f"{{{param_name}}}", str_value)
-                    continue
-
-            # Default handling for non-array parameters or non-array schemas
-            path = path.replace(f"{{{param_name}}}", str(param_value))
+        path = plan.format_path(path_values)
 
         # Prepare query parameters - filter out None and empty strings
         query_params = {}
-        for p in self._route.parameters:
-            if (
-                p.location == "query"
-                and p.name in arguments
-                and arguments.get(p.name) is not None
-                and arguments.get(p.name) != ""
-            ):
-                param_value = arguments.get(p.name)
-
-                # Format array query parameters as comma-separated strings
-                # following OpenAPI form style (default for query parameters)
-                if isinstance(param_value, list) and p.schema_.get("type") == "array":
-                    # Get explode parameter from schema, default is True for query parameters
-                    # If explode is True, the array is serialized as separate parameters
-                    # If explode is False, the array is serialized as a comma-separated string
-                    explode = p.schema_.get("explode", True)
-
-                    if explode:
-                        # When explode=True, we pass the array directly, which HTTPX will serialize
-                        # as multiple parameters with the same name
-                        query_params[p.name] = param_value
-                    else:
-                        # For arrays of simple types (strings, numbers, etc.), join with commas
-                        if all(
-                            isinstance(item, str | int | float | bool)
-                            for item in param_value
-                        ):
-                            query_params[p.name] = ",".join(str(v) for v in param_value)
-                        else:
-                            # For complex types, try to create a simpler representation
-                            try:
-                                # Try to create a simple string representation
-                                formatted_parts = []
-                                for item in param_value:
-                                    if isinstance(item, dict):
-                                        # For objects, serialize key-value pairs
-                                        item_parts = []
-                                        for k, v in item.items():
-                                            item_parts.append(f"{k}:{v}")
-                                        formatted_parts.append(".".join(item_parts))
-                                    else:
-                                        formatted_parts.append(str(item))
-
-                                query_params[p.name] = ",".join(formatted_parts)
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to format complex array query parameter '{p.name}': {e}"
-                                )
-                                # Fallback to string representation
-                                query_params[p.name] = param_value
-                else:
-                    # Non-array parameters are passed as is
-                    query_params[p.name] = param_value
-
-        # Prepare headers - fix typing by ensuring all values are strings
-        headers = {}
+        for name, is_array, explode in plan.query_params:
+            param_value = arguments.get(name)
+            if param_value is None or param_value == "":
+                continue
+
+            if is_array and isinstance(param_value, list) and not explode:
+                # When explode=False, arrays are serialized as comma-separated
+                # strings following the OpenAPI form style
+                try:
+                    query_params[name] = _format_array_value(param_value)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to format complex array query parameter '{name}': {e}"
+                    )
+                    # Fallback to string representation
+                    query_params[name] = param_value
+            else:
+                # Non-array parameters and exploded arrays are passed as is;
+                # HTTPX serializes lists as repeated parameters
+                query_params[name] = param_value
 
-        # Start with OpenAPI-defined header parameters
-        openapi_headers = {}
-        for p in self._route.parameters:
-            if (
-                p.location == "header"
-                and p.name in arguments
-                and arguments[p.name] is not None
-            ):
-                openapi_headers[p.name.lower()] = str(arguments[p.name])
-        headers.update(openapi_headers)
+        # Prepare headers - fix typing by ensuring all values are strings,
+        # starting with OpenAPI-defined header parameters
+        headers = {}
+        for name, header_name in plan.header_params:
+            param_value = arguments.get(name)
+            if param_value is not None:
+                headers[header_name] = str(param_value)
 
         # Add headers from the current MCP client HTTP request (these take precedence)
         mcp_headers = get_http_headers()
         headers.update(mcp_headers)
 
-        # Prepare request body
+        # Prepare request body from the arguments that were not already used
+        # as path, query, or header parameters
         json_data = None
-        if self._route.request_body and self._route.request_body.content_schema:
-            # Extract body parameters, excluding path/query/header params that were already used
-            path_query_header_params = {
-                p.name
-                for p in self._route.parameters
-                if p.location in ("path", "query", "header")
-            }
+        if plan.non_body_args is not None:
             body_params = {
-                k: v
-                for k, v in arguments.items()
-                if k not in path_query_header_params and k != "context"
+                k: v for k, v in arguments.items() if k not in plan.non_body_args
             }
 
             if body_params:
@@ -435,7 +830,10 @@ class OpenAPITool(Tool):
 
         # Execute the request
         try:
-            response = await self._client.request(
+            response = await _send_request(
+                self._client,
+                self._cache,
+                self._coalescer,
                 method=self._route.method,
                 url=path,
                 params=query_params,
@@ -449,11 +847,11 @@ class OpenAPITool(Tool):
 
             # Try to parse as JSON first
             try:
-                result = response.json()
+                result = json_backend.loads(response.content)
                 if not isinstance(result, dict):
                     result = {"result": result}
                 return ToolResult(structured_content=result)
-            except json.JSONDecodeError:
+            except ValueError:
                 return ToolResult(content=response.text)
 
         except httpx.HTTPStatusError as e:
@@ -462,9 +860,9 @@ class OpenAPITool(Tool):
                 f"HTTP error {e.response.status_code}: {e.response.reason_phrase}"
             )
             try:
-                error_data = e.response.json()
+                error_data = json_backend.loads(e.response.content)
                 error_message += f" - {error_data}"
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:
                 if e.response.text:
                     error_message += f" - {e.response.text}"
 
@@ -487,7 +885,10 @@ class OpenAPIResource(Resource):
         description: str,
         mime_type: str = "application/json",
         tags: set[str] = set(),
-        timeout: float | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        cache: HTTPCache | None = None,
+        coalescer: RequestCoalescer | None = None,
+        max_size: int | None = None,
     ):
         super().__init__(
             uri=AnyUrl(uri),  # Convert string to AnyUrl
@@ -499,6 +900,9 @@ class OpenAPIResource(Resource):
         self._client = client
         self._route = route
         self._timeout = timeout
+        self._cache = cache
+        self._coalescer = coalescer
+        self._max_size = max_size
 
     def __repr__(self) -> str:
         """Custom representation to prevent recursion errors when printing."""
@@ -553,23 +957,34 @@ class OpenAPIResource(Resource):
             mcp_headers = get_http_headers()
             headers.update(mcp_headers)
 
-            response = await self._client.request(
+            response = await _send_request(
+                self._client,
+                self._cache,
+                self._coalescer,
                 method=self._route.method,
                 url=path,
                 params=query_params,
                 headers=headers,
                 timeout=self._timeout,
+                max_size=self._max_size,
             )
 
             # Raise for 4xx/5xx responses
             response.raise_for_status()
 
+            # a cut-off body, e.g. half a JSON document, is not returned as data
+            if response.extensions.get("truncated"):
+                raise ResourceError(
+                    f"Response for resource {str(self.uri)!r} exceeded the "
+                    f"maximum size of {self._max_size} bytes"
+                )
+
             # Determine content type and return appropriate format
             content_type = response.headers.get("content-type", "").lower()
 
+            # JSON is passed through as is, rather than parsed and re-encoded
             if "application/json" in content_type:
-                result = response.json()
-                return json.dumps(result)
+                return response.text
             elif any(ct in content_type for ct in ["text/", "application/xml"]):
                 return response.text
             else:
@@ -581,9 +996,9 @@ class OpenAPIResource(Resource):
                 f"HTTP error {e.response.status_code}: {e.response.reason_phrase}"
             )
             try:
-                error_data = e.response.json()
+                error_data = json_backend.loads(e.response.content)
                 error_message += f" - {error_data}"
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:
                 if e.response.text:
                     error_message += f" - {e.response.text}"
 
@@ -606,7 +1021,10 @@ class OpenAPIResourceTemplate(ResourceTemplate):
         description: str,
         parameters: dict[str, Any],
         tags: set[str] = set(),
-        timeout: float | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        cache: HTTPCache | None = None,
+        coalescer: RequestCoalescer | None = None,
+        max_size: int | None = None,
     ):
         super().__init__(
             uri_template=uri_template,
@@ -618,6 +1036,9 @@ class OpenAPIResourceTemplate(ResourceTemplate):
         self._client = client
         self._route = route
         self._timeout = timeout
+        self._cache = cache
+        self._coalescer = coalescer
+        self._max_size = max_size
 
     def __repr__(self) -> str:
         """Custom representation to prevent recursion errors when printing."""
@@ -645,9 +1066,28 @@ class OpenAPIResourceTemplate(ResourceTemplate):
             mime_type="application/json",
             tags=set(self._route.tags or []),
             timeout=self._timeout,
+            cache=self._cache,
+            coalescer=self._coalescer,
+            max_size=self._max_size,
         )
 
 
+@dataclass(frozen=True)
+class OpenAPIRouteChanges:
+    """The keys of the components added and removed by a spec update."""
+
+    added: list[str]
+    removed: list[str]
+
+
+@dataclass(frozen=True)
+class _RouteComponent:
+    component_type: Literal["tool", "resource", "resource_template"]
+    key: str
+    # the name the component was created with, before deduplication
+    name: str
+
+
 class FastMCPOpenAPI(FastMCP):
     """
     FastMCP server implementation that creates components from an OpenAPI schema.
@@ -689,14 +1129,18 @@ class FastMCPOpenAPI(FastMCP):
     def __init__(
         self,
         openapi_spec: dict[str, Any],
-        client: httpx.AsyncClient,
+        client: httpx.AsyncClient | None = None,
         name: str | None = None,
         route_maps: list[RouteMap] | None = None,
         route_map_fn: RouteMapFn | None = None,
         mcp_component_fn: ComponentFn | None = None,
         mcp_names: dict[str, str] | None = None,
         tags: set[str] | None = None,
-        timeout: float | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        http_pool: HTTPPoolConfig | None = None,
+        coalesce_requests: bool = False,
+        max_resource_size: int | None | NotSetT = NotSet,
+        snapshot_path: str | Path | None = None,
         **settings: Any,
     ):
         """
@@ -704,7 +1148,9 @@ class FastMCPOpenAPI(FastMCP):
 
         Args:
             openapi_spec: OpenAPI schema as a dictionary or file path
-            client: httpx AsyncClient for making HTTP requests
+            client: httpx AsyncClient for making HTTP requests. If not provided,
+                a PooledAsyncClient is created for the spec's first server URL,
+                configured by `http_pool`.
             name: Optional name for the server
             route_maps: Optional list of RouteMap objects defining route mappings
             route_map_fn: Optional callable for advanced route type mapping.
@@ -720,14 +1166,39 @@ class FastMCPOpenAPI(FastMCP):
                 All names are truncated to 56 characters maximum.
             tags: Optional set of tags to add to all components. Components always receive any tags
                 from the route.
-            timeout: Optional timeout (in seconds) for all requests
+            timeout: Optional timeout (in seconds) for all requests. Defaults to
+                the client's own timeouts if it is a PooledAsyncClient.
+            http_pool: Optional connection pool settings for the client created
+                when `client` is not provided.
+            coalesce_requests: Whether identical concurrent GET requests share a
+                single upstream request. Defaults to False.
+            max_resource_size: Optional maximum size, in bytes, of the response
+                bodies read by resources. Responses are streamed, and reading a
+                larger one raises a ResourceError. Defaults to the
+                `openapi_max_resource_size` setting; None disables the limit.
+            snapshot_path: Optional path of an OpenAPISnapshot. If it holds a
+                snapshot of this spec, the server is built from it instead of
+                parsing the spec; otherwise one is written there.
             **settings: Additional settings for FastMCP
         """
         super().__init__(name=name or "OpenAPI FastMCP", **settings)
 
+        if client is None:
+            client = PooledAsyncClient(
+                http_pool, base_url=_get_server_url(openapi_spec)
+            )
+        elif http_pool is not None:
+            raise ValueError("Provide either a client or http_pool, not both")
+        if timeout is None and isinstance(client, PooledAsyncClient):
+            timeout = client.timeout
+
         self._client = client
         self._timeout = timeout
         self._mcp_component_fn = mcp_component_fn
+        self._coalescer = RequestCoalescer() if coalesce_requests else None
+        if isinstance(max_resource_size, NotSetT):
+            max_resource_size = fastmcp.settings.openapi_max_resource_size
+        self._max_resource_size = max_resource_size
 
         # Keep track of names to detect collisions
         self._used_names = {
@@ -736,50 +1207,239 @@ class FastMCPOpenAPI(FastMCP):
             "resource_template": Counter(),
             "prompt": Counter(),
         }
+        # the number of live route components created with each name, so that
+        # a name is only freed once none of them remain
+        self._live_names: dict[str, Counter[str]] = {
+            "tool": Counter(),
+            "resource": Counter(),
+            "resource_template": Counter(),
+        }
 
-        http_routes = openapi.parse_openapi_to_http_routes(openapi_spec)
+        snapshot = None
+        if snapshot_path is not None:
+            snapshot = OpenAPISnapshot.load(snapshot_path, openapi_spec)
+        if snapshot is None:
+            snapshot = OpenAPISnapshot.from_spec(openapi_spec)
+        else:
+            logger.debug(f"Loaded OpenAPI snapshot from {snapshot_path}")
+        self._snapshot = snapshot
+        http_routes = [entry.route for entry in snapshot.routes]
 
         # Process routes
-        route_maps = (route_maps or []) + DEFAULT_ROUTE_MAPPINGS
-        for route in http_routes:
-            # Determine route type based on mappings or default rules
-            route_map = _determine_route_type(route, route_maps)
+        self._route_map_index = route_map_index = RouteMapIndex(
+            (route_maps or []) + DEFAULT_ROUTE_MAPPINGS
+        )
+        self._route_map_fn = route_map_fn
+        self._mcp_names = mcp_names
+        self._tags = tags
+        self._snapshot_path = snapshot_path
+        # the component created for each route, keyed by method and path
+        self._route_components: dict[tuple[str, str], _RouteComponent] = {}
+        for entry in snapshot.routes:
+            self._add_route(entry)
 
-            # TODO: remove this once RouteType is removed and mcp_type is typed as MCPType without | None
-            assert route_map.mcp_type is not None
-            route_type = route_map.mcp_type
+        logger.debug(
+            f"Classified {route_map_index.routes_classified} routes against "
+            f"{len(route_map_index.mappings)} route maps in "
+            f"{route_map_index.classification_time * 1000:.1f}ms"
+        )
+        logger.info(f"Created FastMCP OpenAPI server with {len(http_routes)} routes")
 
-            # Call route_map_fn if provided
-            if route_map_fn is not None:
-                try:
-                    result = route_map_fn(route, route_type)
-                    if result is not None:
-                        route_type = result
-                        logger.debug(
-                            f"Route {route.method} {route.path} mapping customized by route_map_fn: "
-                            f"type={route_type.name}"
-                        )
-                except Exception as e:
-                    logger.warning(
-                        f"Error in route_map_fn for {route.method} {route.path}: {e}. "
-                        f"Using default values."
+        if snapshot_path is not None and snapshot.changed:
+            try:
+                snapshot.save(snapshot_path)
+            except OSError as e:
+                logger.warning(f"Failed to write OpenAPI snapshot: {e}")
+
+    def export_snapshot(self, path: str | Path) -> None:
+        """
+        Writes a snapshot of the server's routes, input schemas and
+        descriptions, from which a server for the same spec can be built
+        without parsing it again (see `snapshot_path`).
+        """
+        self._snapshot.save(path)
+
+    def update_spec(self, openapi_spec: dict[str, Any]) -> OpenAPIRouteChanges:
+        """
+        Updates the server's components to match a new version of its spec,
+        without restarting it. Components of unchanged routes are kept, those
+        of removed or changed routes are removed, and components are created
+        for new or changed routes.
+
+        Returns the keys of the added and removed components.
+        """
+        old_snapshot = self._snapshot
+        new_snapshot = OpenAPISnapshot.from_spec(openapi_spec)
+        if new_snapshot.spec_hash == old_snapshot.spec_hash:
+            return OpenAPIRouteChanges(added=[], removed=[])
+
+        old_definitions = (
+            old_snapshot.routes[0].route.schema_definitions
+            if old_snapshot.routes
+            else {}
+        )
+        new_definitions = (
+            new_snapshot.routes[0].route.schema_definitions
+            if new_snapshot.routes
+            else {}
+        )
+        # routes may refer to any definition, so if any changed, all routes are
+        # considered changed
+        definitions_changed = old_definitions != new_definitions
+
+        old_entries = {
+            (entry.route.method, entry.route.path): entry
+            for entry in old_snapshot.routes
+        }
+        unchanged: set[tuple[str, str]] = set()
+        for i, entry in enumerate(new_snapshot.routes):
+            key = (entry.route.method, entry.route.path)
+            old_entry = old_entries.get(key)
+            if (
+                old_entry is not None
+                and not definitions_changed
+                and old_entry.route.model_dump(exclude={"schema_definitions"})
+                == entry.route.model_dump(exclude={"schema_definitions"})
+            ):
+                # keep the old entry, along with the parts derived from it
+                old_entry.route.schema_definitions = new_definitions
+                new_snapshot.routes[i] = old_entry
+                unchanged.add(key)
+
+        removed = []
+        for key in old_entries:
+            if key not in unchanged:
+                component_key = self._remove_route(key)
+                if component_key is not None:
+                    removed.append(component_key)
+
+        self._snapshot = new_snapshot
+        added = []
+        for entry in new_snapshot.routes:
+            key = (entry.route.method, entry.route.path)
+            if key not in unchanged:
+                component_key = self._add_route(entry)
+                if component_key is not None:
+                    added.append(component_key)
+
+        self._tool_manager._invalidate()
+        self._resource_manager._invalidate()
+        self._cache.clear()
+        logger.info(
+            f"Updated FastMCP OpenAPI server: added {len(added)} and removed "
+            f"{len(removed)} components"
+        )
+
+        if self._snapshot_path is not None and new_snapshot.changed:
+            try:
+                new_snapshot.save(self._snapshot_path)
+            except OSError as e:
+                logger.warning(f"Failed to write OpenAPI snapshot: {e}")
+
+        return OpenAPIRouteChanges(added=added, removed=removed)
+
+    def _add_route(self, entry: _RouteSnapshot) -> str | None:
+        """
+        Creates and registers the component for a route. Returns its key, or
+        None if the route is excluded.
+        """
+        route = entry.route
+        # Determine route type based on mappings or default rules
+        route_map = self._route_map_index.match(route)
+
+        # TODO: remove this once RouteType is removed and mcp_type is typed as MCPType without | None
+        assert route_map.mcp_type is not None
+        route_type = route_map.mcp_type
+
+        # Call route_map_fn if provided
+        if self._route_map_fn is not None:
+            try:
+                result = self._route_map_fn(route, route_type)
+                if result is not None:
+                    route_type = result
+                    logger.debug(
+                        f"Route {route.method} {route.path} mapping customized by route_map_fn: "
+                        f"type={route_type.name}"
                     )
+            except Exception as e:
+                logger.warning(
+                    f"Error in route_map_fn for {route.method} {route.path}: {e}. "
+                    f"Using default values."
+                )
 
-            # Generate a default name from the route
-            component_name = self._generate_default_name(route, mcp_names)
+        # Generate a default name from the route
+        component_name = self._generate_default_name(route, self._mcp_names)
 
-            route_tags = set(route.tags) | route_map.mcp_tags | (tags or set())
+        route_tags = set(route.tags) | route_map.mcp_tags | (self._tags or set())
 
-            if route_type == MCPType.TOOL:
-                self._create_openapi_tool(route, component_name, tags=route_tags)
-            elif route_type == MCPType.RESOURCE:
-                self._create_openapi_resource(route, component_name, tags=route_tags)
-            elif route_type == MCPType.RESOURCE_TEMPLATE:
-                self._create_openapi_template(route, component_name, tags=route_tags)
-            elif route_type == MCPType.EXCLUDE:
+        if route_type == MCPType.TOOL:
+            component_type = "tool"
+            key = self._create_openapi_tool(
+                route,
+                component_name,
+                tags=route_tags,
+                cache=route_map.cache,
+                snapshot=entry,
+            )
+        elif route_type == MCPType.RESOURCE:
+            component_type = "resource"
+            key = self._create_openapi_resource(
+                route,
+                component_name,
+                tags=route_tags,
+                cache=route_map.cache,
+                snapshot=entry,
+            )
+        elif route_type == MCPType.RESOURCE_TEMPLATE:
+            component_type = "resource_template"
+            key = self._create_openapi_template(
+                route,
+                component_name,
+                tags=route_tags,
+                cache=route_map.cache,
+                snapshot=entry,
+            )
+        else:
+            if route_type == MCPType.EXCLUDE:
                 logger.info(f"Excluding route: {route.method} {route.path}")
+            return None
 
-        logger.info(f"Created FastMCP OpenAPI server with {len(http_routes)} routes")
+        self._route_components[(route.method, route.path)] = _RouteComponent(
+            component_type=component_type, key=key, name=component_name
+        )
+        self._live_names[component_type][component_name] += 1
+        return key
+
+    def _remove_route(self, route_key: tuple[str, str]) -> str | None:
+        """Removes the component of a route. Returns its key, if it had one."""
+        component = self._route_components.pop(route_key, None)
+        if component is None:
+            return None
+
+        if component.component_type == "tool":
+            self._tool_manager._tools.pop(component.key, None)
+        elif component.component_type == "resource":
+            self._resource_manager._resources.pop(component.key, None)
+        else:
+            self._resource_manager._templates.pop(component.key, None)
+        # deduplicated names are numbered by how often the name was used, so a
+        # name is only freed once no component created with it remains;
+        # otherwise a new component could take a suffix that is still in use
+        live_names = self._live_names[component.component_type]
+        live_names[component.name] -= 1
+        if live_names[component.name] == 0:
+            del live_names[component.name]
+            del self._used_names[component.component_type][component.name]
+        return component.key
+
+    def http_pool_stats(self) -> HTTPPoolStats | None:
+        """
+        Returns request counts and connection pool utilization for the server's
+        HTTP client, or None if it is not a PooledAsyncClient.
+        """
+        if isinstance(self._client, PooledAsyncClient):
+            return self._client.pool_stats()
+        return None
 
     def _generate_default_name(
         self, route: openapi.HTTPRoute, mcp_names_map: dict[str, str] | None = None
@@ -841,25 +1501,20 @@ class FastMCPOpenAPI(FastMCP):
         route: openapi.HTTPRoute,
         name: str,
         tags: set[str],
-    ):
+        cache: HTTPCache | None = None,
+        snapshot: _RouteSnapshot | None = None,
+    ) -> str:
         """Creates and registers an OpenAPITool with enhanced description."""
-        combined_schema = _combine_schemas(route)
+        if snapshot is None:
+            snapshot = _RouteSnapshot(route)
+        combined_schema = snapshot.input_schema()
 
         # Get a unique tool name
         tool_name = self._get_unique_name(name, "tool")
 
-        base_description = (
-            route.description
-            or route.summary
-            or f"Executes {route.method} {route.path}"
-        )
-
         # Format enhanced description with parameters and request body
-        enhanced_description = format_description_with_responses(
-            base_description=base_description,
-            responses=route.responses,
-            parameters=route.parameters,
-            request_body=route.request_body,
+        enhanced_description = snapshot.description(
+            "tool", f"Executes {route.method} {route.path}"
         )
 
         tool = OpenAPITool(
@@ -870,6 +1525,8 @@ class FastMCPOpenAPI(FastMCP):
             parameters=combined_schema,
             tags=set(route.tags or []) | tags,
             timeout=self._timeout,
+            cache=cache,
+            coalescer=self._coalescer,
         )
 
         # Call component_fn if provided
@@ -888,28 +1545,27 @@ class FastMCPOpenAPI(FastMCP):
         logger.debug(
             f"Registered TOOL: {tool_name} ({route.method} {route.path}) with tags: {route.tags}"
         )
+        return tool_name
 
     def _create_openapi_resource(
         self,
         route: openapi.HTTPRoute,
         name: str,
         tags: set[str],
-    ):
+        cache: HTTPCache | None = None,
+        snapshot: _RouteSnapshot | None = None,
+    ) -> str:
         """Creates and registers an OpenAPIResource with enhanced description."""
         # Get a unique resource name
         resource_name = self._get_unique_name(name, "resource")
 
         resource_uri = f"resource://{resource_name}"
-        base_description = (
-            route.description or route.summary or f"Represents {route.path}"
-        )
 
         # Format enhanced description with parameters and request body
-        enhanced_description = format_description_with_responses(
-            base_description=base_description,
-            responses=route.responses,
-            parameters=route.parameters,
-            request_body=route.request_body,
+        if snapshot is None:
+            snapshot = _RouteSnapshot(route)
+        enhanced_description = snapshot.description(
+            "resource", f"Represents {route.path}"
         )
 
         resource = OpenAPIResource(
@@ -920,6 +1576,9 @@ class FastMCPOpenAPI(FastMCP):
             description=enhanced_description,
             tags=set(route.tags or []) | tags,
             timeout=self._timeout,
+            cache=cache,
+            coalescer=self._coalescer,
+            max_size=self._max_resource_size,
         )
 
         # Call component_fn if provided
@@ -938,13 +1597,16 @@ class FastMCPOpenAPI(FastMCP):
         logger.debug(
             f"Registered RESOURCE: {resource_uri} ({route.method} {route.path}) with tags: {route.tags}"
         )
+        return str(resource.uri)
 
     def _create_openapi_template(
         self,
         route: openapi.HTTPRoute,
         name: str,
         tags: set[str],
-    ):
+        cache: HTTPCache | None = None,
+        snapshot: _RouteSnapshot | None = None,
+    ) -> str:
         """Creates and registers an OpenAPIResourceTemplate with enhanced description."""
         # Get a unique template name
         template_name = self._get_unique_name(name, "resource_template")
@@ -956,16 +1618,11 @@ class FastMCPOpenAPI(FastMCP):
         if path_params:
             uri_template_str += "/" + "/".join(f"{{{p}}}" for p in path_params)
 
-        base_description = (
-            route.description or route.summary or f"Template for {route.path}"
-        )
-
         # Format enhanced description with parameters and request body
-        enhanced_description = format_description_with_responses(
-            base_description=base_description,
-            responses=route.responses,
-            parameters=route.parameters,
-            request_body=route.request_body,
+        if snapshot is None:
+            snapshot = _RouteSnapshot(route)
+        enhanced_description = snapshot.description(
+            "resource_template", f"Template for {route.path}"
         )
 
         template_params_schema = {
@@ -999,6 +1656,9 @@ class FastMCPOpenAPI(FastMCP):
             parameters=template_params_schema,
             tags=set(route.tags or []) | tags,
             timeout=self._timeout,
+            cache=cache,
+            coalescer=self._coalescer,
+            max_size=self._max_resource_size,
         )
 
         # Call component_fn if provided
@@ -1017,3 +1677,4 @@ class FastMCPOpenAPI(FastMCP):
         logger.debug(
             f"Registered TEMPLATE: {uri_template_str} ({route.method} {route.path}) with tags: {route.tags}"
         )
+        return uri_template_str
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import datetime
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import quote
 
+import anyio
+import httpx
 import mcp.types
 from mcp.shared.exceptions import McpError
 from mcp.types import (
+    CONNECTION_CLOSED,
     METHOD_NOT_FOUND,
     BlobResourceContents,
     GetPromptResult,
@@ -13,7 +20,9 @@ from mcp.types import (
 )
 from pydantic.networks import AnyUrl
 
+import fastmcp
 from fastmcp.client import Client
+from fastmcp.client.messages import Message, MessageHandler, MessageHandlerT
 from fastmcp.exceptions import NotFoundError, ResourceError, ToolError
 from fastmcp.prompts import Prompt, PromptMessage
 from fastmcp.prompts.prompt import PromptArgument
@@ -24,6 +33,7 @@ from fastmcp.server.context import Context
 from fastmcp.server.server import FastMCP
 from fastmcp.tools.tool import Tool, ToolResult
 from fastmcp.tools.tool_manager import ToolManager
+from fastmcp.utilities.cache import TimedCache
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -31,13 +41,190 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# keys of the remote lists in a proxy's inventory cache
+TOOLS_CACHE_KEY = "tools"
+RESOURCES_CACHE_KEY = "resources"
+TEMPLATES_CACHE_KEY = "resource_templates"
+PROMPTS_CACHE_KEY = "prompts"
+
+# errors that mean a pooled session's connection to the backend is unusable
+CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    httpx.TransportError,
+)
+
+
+class _PooledSession:
+    """A long-lived backend client and the number of requests using it."""
+
+    def __init__(self, client: Client):
+        self.client = client
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+
+
+class ProxySessionPool:
+    """
+    Hands out connected backend clients for proxied requests.
+
+    With a size of 0, every request enters the backend client's context, which
+    connects and initializes a new session unless one is already open. With a
+    positive size, the pool keeps up to `size` long-lived sessions, each on its
+    own copy of the client (see `Client.new`), so that stdio backends run one
+    subprocess per session, and gives every request the least busy one. A new
+    session is only opened when all existing ones are in use. Sessions whose
+    connection has dropped are replaced the next time they are needed, and
+    sessions that have been idle for `ping_idle_after` seconds are pinged
+    before they are reused, and replaced if the ping fails.
+
+    The pool's sessions are closed when the last server session using the
+    pool (see `open`) ends.
+    """
+
+    def __init__(self, client: Client, size: int = 0, ping_idle_after: float = 5):
+        if size < 0:
+            raise ValueError(f"Invalid session pool size: {size}")
+        self.client = client
+        self.size = size
+        self.ping_idle_after = ping_idle_after
+        self._sessions: list[_PooledSession] = []
+        self._lock = anyio.Lock()
+        self._users = 0
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[None]:
+        """
+        Keeps the pool open for the duration of a server session. When the
+        last one ends, the pooled sessions are closed.
+        """
+        self._users += 1
+        try:
+            yield
+        finally:
+            self._users -= 1
+            if not self._users:
+                with anyio.CancelScope(shield=True):
+                    await self.close()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Client]:
+        """Yields a connected client for the duration of one request."""
+        if not self.size:
+            async with self.client:
+                yield self.client
+            return
+
+        pooled = await self._acquire()
+        try:
+            # the pool holds its own reference to every session, so entering
+            # the client only reconnects if the session has stopped
+            async with pooled.client:
+                yield pooled.client
+        except CONNECTION_ERRORS:
+            await self._discard(pooled)
+            raise
+        except McpError as e:
+            if e.error.code == CONNECTION_CLOSED:
+                await self._discard(pooled)
+            raise
+        finally:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+
+    async def _acquire(self) -> _PooledSession:
+        while True:
+            async with self._lock:
+                pooled = min(self._sessions, key=lambda s: s.in_flight, default=None)
+                if pooled is None or (pooled.in_flight and len(self) < self.size):
+                    pooled = _PooledSession(self.client.new())
+                    self._sessions.append(pooled)
+                    new, check = True, False
+                else:
+                    new = False
+                    # sessions in use are known to work; only idle ones are
+                    # checked
+                    check = (
+                        not pooled.in_flight
+                        and time.monotonic() - pooled.last_used >= self.ping_idle_after
+                    )
+                pooled.in_flight += 1
+
+            if new:
+                # connect outside the lock, so that a slow connection does
+                # not hold up requests that other sessions can serve; requests
+                # given this session meanwhile wait for it in the client
+                try:
+                    await pooled.client.__aenter__()
+                except Exception:
+                    pooled.in_flight -= 1
+                    async with self._lock:
+                        if pooled in self._sessions:
+                            self._sessions.remove(pooled)
+                    await self._close_session(pooled, force=True)
+                    raise
+                return pooled
+            if not check or await self._ping(pooled):
+                return pooled
+            pooled.in_flight -= 1
+            await self._discard(pooled)
+
+    async def _ping(self, pooled: _PooledSession) -> bool:
+        """Checks that an idle session still reaches the backend."""
+        try:
+            async with pooled.client:
+                return await pooled.client.ping()
+        except (*CONNECTION_ERRORS, McpError) as e:
+            logger.debug(f"Ping of idle proxy backend session failed: {e}")
+            return False
+
+    async def _discard(self, pooled: _PooledSession) -> None:
+        """Removes a broken session so later requests open a fresh one."""
+        async with self._lock:
+            if pooled not in self._sessions:
+                return
+            self._sessions.remove(pooled)
+        logger.debug("Discarding broken proxy backend session")
+        # release the pool's reference; requests still using the session
+        # close it when they exit
+        await self._close_session(pooled)
+
+    async def _close_session(self, pooled: _PooledSession, force: bool = False):
+        await pooled.client._disconnect(force=force)
+        if pooled.client.transport is not self.client.transport:
+            # the session's own transport, e.g. a stdio subprocess
+            await pooled.client.transport.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def close(self) -> None:
+        """Closes all pooled sessions."""
+        async with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for pooled in sessions:
+            await self._close_session(pooled, force=True)
+
 
 class ProxyToolManager(ToolManager):
     """A ToolManager that sources its tools from a remote client in addition to local and mounted tools."""
 
-    def __init__(self, client: Client, **kwargs):
+    # the remote inventory can change at any time
+    _cacheable = False
+
+    def __init__(
+        self,
+        client: Client,
+        inventory_cache: TimedCache | None = None,
+        sessions: ProxySessionPool | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.client = client
+        if inventory_cache is None:
+            inventory_cache = TimedCache(expiration=datetime.timedelta(0))
+        self.inventory_cache = inventory_cache
+        self.sessions = sessions if sessions is not None else ProxySessionPool(client)
 
     async def get_tools(self) -> dict[str, Tool]:
         """Gets the unfiltered tool inventory including local, mounted, and proxy tools."""
@@ -45,21 +232,33 @@ class ProxyToolManager(ToolManager):
         all_tools = await super().get_tools()
 
         # Then add proxy tools, but don't overwrite existing ones
+        for tool in await self._get_proxy_tools():
+            if tool.name not in all_tools:
+                all_tools[tool.name] = tool
+
+        return all_tools
+
+    async def _get_proxy_tools(self) -> list[ProxyTool]:
+        """Lists the remote tools, reusing the cached list if it is still fresh."""
+        cached = self.inventory_cache.get(TOOLS_CACHE_KEY)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
         try:
-            async with self.client:
-                client_tools = await self.client.list_tools()
-                for tool in client_tools:
-                    if tool.name not in all_tools:
-                        all_tools[tool.name] = ProxyTool.from_mcp_tool(
-                            self.client, tool
-                        )
+            async with self.sessions.session() as client:
+                client_tools = await client.list_tools()
+            tools = [
+                ProxyTool.from_mcp_tool(self.client, tool, sessions=self.sessions)
+                for tool in client_tools
+            ]
         except McpError as e:
             if e.error.code == METHOD_NOT_FOUND:
-                pass  # No tools available from proxy
+                tools = []  # No tools available from proxy
             else:
                 raise e
 
-        return all_tools
+        self.inventory_cache.set(TOOLS_CACHE_KEY, tools)
+        return tools
 
     async def list_tools(self) -> list[Tool]:
         """Gets the filtered list of tools including local, mounted, and proxy tools."""
@@ -73,8 +272,8 @@ class ProxyToolManager(ToolManager):
             return await super().call_tool(key, arguments)
         except NotFoundError:
             # If not found locally, try proxy
-            async with self.client:
-                result = await self.client.call_tool(key, arguments)
+            async with self.sessions.session() as client:
+                result = await client.call_tool(key, arguments)
                 return ToolResult(
                     content=result.content,
                     structured_content=result.structured_content,
@@ -84,9 +283,22 @@ class ProxyToolManager(ToolManager):
 class ProxyResourceManager(ResourceManager):
     """A ResourceManager that sources its resources from a remote client in addition to local and mounted resources."""
 
-    def __init__(self, client: Client, **kwargs):
+    # the remote inventory can change at any time
+    _cacheable = False
+
+    def __init__(
+        self,
+        client: Client,
+        inventory_cache: TimedCache | None = None,
+        sessions: ProxySessionPool | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.client = client
+        if inventory_cache is None:
+            inventory_cache = TimedCache(expiration=datetime.timedelta(0))
+        self.inventory_cache = inventory_cache
+        self.sessions = sessions if sessions is not None else ProxySessionPool(client)
 
     async def get_resources(self) -> dict[str, Resource]:
         """Gets the unfiltered resource inventory including local, mounted, and proxy resources."""
@@ -94,19 +306,9 @@ class ProxyResourceManager(ResourceManager):
         all_resources = await super().get_resources()
 
         # Then add proxy resources, but don't overwrite existing ones
-        try:
-            async with self.client:
-                client_resources = await self.client.list_resources()
-                for resource in client_resources:
-                    if str(resource.uri) not in all_resources:
-                        all_resources[str(resource.uri)] = (
-                            ProxyResource.from_mcp_resource(self.client, resource)
-                        )
-        except McpError as e:
-            if e.error.code == METHOD_NOT_FOUND:
-                pass  # No resources available from proxy
-            else:
-                raise e
+        for resource in await self._get_proxy_resources():
+            if str(resource.uri) not in all_resources:
+                all_resources[str(resource.uri)] = resource
 
         return all_resources
 
@@ -116,21 +318,59 @@ class ProxyResourceManager(ResourceManager):
         all_templates = await super().get_resource_templates()
 
         # Then add proxy templates, but don't overwrite existing ones
+        for template in await self._get_proxy_templates():
+            if template.uri_template not in all_templates:
+                all_templates[template.uri_template] = template
+
+        return all_templates
+
+    async def _get_proxy_resources(self) -> list[ProxyResource]:
+        """Lists the remote resources, reusing the cached list if it is still fresh."""
+        cached = self.inventory_cache.get(RESOURCES_CACHE_KEY)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
         try:
-            async with self.client:
-                client_templates = await self.client.list_resource_templates()
-                for template in client_templates:
-                    if template.uriTemplate not in all_templates:
-                        all_templates[template.uriTemplate] = (
-                            ProxyTemplate.from_mcp_template(self.client, template)
-                        )
+            async with self.sessions.session() as client:
+                client_resources = await client.list_resources()
+            resources = [
+                ProxyResource.from_mcp_resource(
+                    self.client, resource, sessions=self.sessions
+                )
+                for resource in client_resources
+            ]
         except McpError as e:
             if e.error.code == METHOD_NOT_FOUND:
-                pass  # No templates available from proxy
+                resources = []  # No resources available from proxy
             else:
                 raise e
 
-        return all_templates
+        self.inventory_cache.set(RESOURCES_CACHE_KEY, resources)
+        return resources
+
+    async def _get_proxy_templates(self) -> list[ProxyTemplate]:
+        """Lists the remote templates, reusing the cached list if it is still fresh."""
+        cached = self.inventory_cache.get(TEMPLATES_CACHE_KEY)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
+        try:
+            async with self.sessions.session() as client:
+                client_templates = await client.list_resource_templates()
+            templates = [
+                ProxyTemplate.from_mcp_template(
+                    self.client, template, sessions=self.sessions
+                )
+                for template in client_templates
+            ]
+        except McpError as e:
+            if e.error.code == METHOD_NOT_FOUND:
+                templates = []  # No templates available from proxy
+            else:
+                raise e
+
+        self.inventory_cache.set(TEMPLATES_CACHE_KEY, templates)
+        return templates
 
     async def list_resources(self) -> list[Resource]:
         """Gets the filtered list of resources including local, mounted, and proxy resources."""
@@ -149,8 +389,8 @@ class ProxyResourceManager(ResourceManager):
             return await super().read_resource(uri)
         except NotFoundError:
             # If not found locally, try proxy
-            async with self.client:
-                result = await self.client.read_resource(uri)
+            async with self.sessions.session() as client:
+                result = await client.read_resource(uri)
                 if isinstance(result[0], TextResourceContents):
                     return result[0].text
                 elif isinstance(result[0], BlobResourceContents):
@@ -162,9 +402,22 @@ class ProxyResourceManager(ResourceManager):
 class ProxyPromptManager(PromptManager):
     """A PromptManager that sources its prompts from a remote client in addition to local and mounted prompts."""
 
-    def __init__(self, client: Client, **kwargs):
+    # the remote inventory can change at any time
+    _cacheable = False
+
+    def __init__(
+        self,
+        client: Client,
+        inventory_cache: TimedCache | None = None,
+        sessions: ProxySessionPool | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.client = client
+        if inventory_cache is None:
+            inventory_cache = TimedCache(expiration=datetime.timedelta(0))
+        self.inventory_cache = inventory_cache
+        self.sessions = sessions if sessions is not None else ProxySessionPool(client)
 
     async def get_prompts(self) -> dict[str, Prompt]:
         """Gets the unfiltered prompt inventory including local, mounted, and proxy prompts."""
@@ -172,21 +425,33 @@ class ProxyPromptManager(PromptManager):
         all_prompts = await super().get_prompts()
 
         # Then add proxy prompts, but don't overwrite existing ones
+        for prompt in await self._get_proxy_prompts():
+            if prompt.name not in all_prompts:
+                all_prompts[prompt.name] = prompt
+
+        return all_prompts
+
+    async def _get_proxy_prompts(self) -> list[ProxyPrompt]:
+        """Lists the remote prompts, reusing the cached list if it is still fresh."""
+        cached = self.inventory_cache.get(PROMPTS_CACHE_KEY)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
         try:
-            async with self.client:
-                client_prompts = await self.client.list_prompts()
-                for prompt in client_prompts:
-                    if prompt.name not in all_prompts:
-                        all_prompts[prompt.name] = ProxyPrompt.from_mcp_prompt(
-                            self.client, prompt
-                        )
+            async with self.sessions.session() as client:
+                client_prompts = await client.list_prompts()
+            prompts = [
+                ProxyPrompt.from_mcp_prompt(self.client, prompt, sessions=self.sessions)
+                for prompt in client_prompts
+            ]
         except McpError as e:
             if e.error.code == METHOD_NOT_FOUND:
-                pass  # No prompts available from proxy
+                prompts = []  # No prompts available from proxy
             else:
                 raise e
 
-        return all_prompts
+        self.inventory_cache.set(PROMPTS_CACHE_KEY, prompts)
+        return prompts
 
     async def list_prompts(self) -> list[Prompt]:
         """Gets the filtered list of prompts including local, mounted, and proxy prompts."""
@@ -204,8 +469,8 @@ class ProxyPromptManager(PromptManager):
             return await super().render_prompt(name, arguments)
         except NotFoundError:
             # If not found locally, try proxy
-            async with self.client:
-                result = await self.client.get_prompt(name, arguments)
+            async with self.sessions.session() as client:
+                result = await client.get_prompt(name, arguments)
                 return result
 
 
@@ -214,15 +479,24 @@ class ProxyTool(Tool):
     A Tool that represents and executes a tool on a remote server.
     """
 
-    def __init__(self, client: Client, **kwargs):
+    def __init__(
+        self, client: Client, *, sessions: ProxySessionPool | None = None, **kwargs
+    ):
         super().__init__(**kwargs)
         self._client = client
+        self._sessions = sessions if sessions is not None else ProxySessionPool(client)
 
     @classmethod
-    def from_mcp_tool(cls, client: Client, mcp_tool: mcp.types.Tool) -> ProxyTool:
+    def from_mcp_tool(
+        cls,
+        client: Client,
+        mcp_tool: mcp.types.Tool,
+        sessions: ProxySessionPool | None = None,
+    ) -> ProxyTool:
         """Factory method to create a ProxyTool from a raw MCP tool schema."""
         return cls(
             client=client,
+            sessions=sessions,
             name=mcp_tool.name,
             description=mcp_tool.description,
             parameters=mcp_tool.inputSchema,
@@ -237,8 +511,8 @@ class ProxyTool(Tool):
     ) -> ToolResult:
         """Executes the tool by making a call through the client."""
         # This is where the remote execution logic lives.
-        async with self._client:
-            result = await self._client.call_tool_mcp(
+        async with self._sessions.session() as client:
+            result = await client.call_tool_mcp(
                 name=self.name,
                 arguments=arguments,
             )
@@ -256,20 +530,33 @@ class ProxyResource(Resource):
     """
 
     _client: Client
+    _sessions: ProxySessionPool
     _value: str | bytes | None = None
 
-    def __init__(self, client: Client, *, _value: str | bytes | None = None, **kwargs):
+    def __init__(
+        self,
+        client: Client,
+        *,
+        sessions: ProxySessionPool | None = None,
+        _value: str | bytes | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._client = client
+        self._sessions = sessions if sessions is not None else ProxySessionPool(client)
         self._value = _value
 
     @classmethod
     def from_mcp_resource(
-        cls, client: Client, mcp_resource: mcp.types.Resource
+        cls,
+        client: Client,
+        mcp_resource: mcp.types.Resource,
+        sessions: ProxySessionPool | None = None,
     ) -> ProxyResource:
         """Factory method to create a ProxyResource from a raw MCP resource schema."""
         return cls(
             client=client,
+            sessions=sessions,
             uri=mcp_resource.uri,
             name=mcp_resource.name,
             description=mcp_resource.description,
@@ -281,8 +568,8 @@ class ProxyResource(Resource):
         if self._value is not None:
             return self._value
 
-        async with self._client:
-            result = await self._client.read_resource(self.uri)
+        async with self._sessions.session() as client:
+            result = await client.read_resource(self.uri)
         if isinstance(result[0], TextResourceContents):
             return result[0].text
         elif isinstance(result[0], BlobResourceContents):
@@ -296,17 +583,24 @@ class ProxyTemplate(ResourceTemplate):
     A ResourceTemplate that represents and creates resources from a remote server template.
     """
 
-    def __init__(self, client: Client, **kwargs):
+    def __init__(
+        self, client: Client, *, sessions: ProxySessionPool | None = None, **kwargs
+    ):
         super().__init__(**kwargs)
         self._client = client
+        self._sessions = sessions if sessions is not None else ProxySessionPool(client)
 
     @classmethod
     def from_mcp_template(
-        cls, client: Client, mcp_template: mcp.types.ResourceTemplate
+        cls,
+        client: Client,
+        mcp_template: mcp.types.ResourceTemplate,
+        sessions: ProxySessionPool | None = None,
     ) -> ProxyTemplate:
         """Factory method to create a ProxyTemplate from a raw MCP template schema."""
         return cls(
             client=client,
+            sessions=sessions,
             uri_template=mcp_template.uriTemplate,
             name=mcp_template.name,
             description=mcp_template.description,
@@ -327,8 +621,8 @@ class ProxyTemplate(ResourceTemplate):
         parameterized_uri = self.uri_template.format(
             **{k: quote(v, safe="") for k, v in params.items()}
         )
-        async with self._client:
-            result = await self._client.read_resource(parameterized_uri)
+        async with self._sessions.session() as client:
+            result = await client.read_resource(parameterized_uri)
 
         if isinstance(result[0], TextResourceContents):
             value = result[0].text
@@ -339,6 +633,7 @@ class ProxyTemplate(ResourceTemplate):
 
         return ProxyResource(
             client=self._client,
+            sessions=self._sessions,
             uri=parameterized_uri,
             name=self.name,
             description=self.description,
@@ -353,14 +648,21 @@ class ProxyPrompt(Prompt):
     """
 
     _client: Client
+    _sessions: ProxySessionPool
 
-    def __init__(self, client: Client, **kwargs):
+    def __init__(
+        self, client: Client, *, sessions: ProxySessionPool | None = None, **kwargs
+    ):
         super().__init__(**kwargs)
         self._client = client
+        self._sessions = sessions if sessions is not None else ProxySessionPool(client)
 
     @classmethod
     def from_mcp_prompt(
-        cls, client: Client, mcp_prompt: mcp.types.Prompt
+        cls,
+        client: Client,
+        mcp_prompt: mcp.types.Prompt,
+        sessions: ProxySessionPool | None = None,
     ) -> ProxyPrompt:
         """Factory method to create a ProxyPrompt from a raw MCP prompt schema."""
         arguments = [
@@ -373,6 +675,7 @@ class ProxyPrompt(Prompt):
         ]
         return cls(
             client=client,
+            sessions=sessions,
             name=mcp_prompt.name,
             description=mcp_prompt.description,
             arguments=arguments,
@@ -380,29 +683,129 @@ class ProxyPrompt(Prompt):
 
     async def render(self, arguments: dict[str, Any]) -> list[PromptMessage]:
         """Render the prompt by making a call through the client."""
-        async with self._client:
-            result = await self._client.get_prompt(self.name, arguments)
+        async with self._sessions.session() as client:
+            result = await client.get_prompt(self.name, arguments)
         return result.messages
 
 
+class ProxyInventoryMessageHandler(MessageHandler):
+    """
+    Discards a proxy's cached remote lists when the backend reports that they
+    changed, then forwards every message to the client's original handler.
+    """
+
+    def __init__(
+        self,
+        inventory_cache: TimedCache,
+        handler: MessageHandlerT | MessageHandler | None = None,
+    ):
+        self.inventory_cache = inventory_cache
+        self.handler = handler
+
+    async def dispatch(self, message: Message) -> None:
+        await super().dispatch(message)
+        if self.handler is not None:
+            await self.handler(message)
+
+    async def on_tool_list_changed(
+        self, message: mcp.types.ToolListChangedNotification
+    ) -> None:
+        self.inventory_cache.delete(TOOLS_CACHE_KEY)
+
+    async def on_resource_list_changed(
+        self, message: mcp.types.ResourceListChangedNotification
+    ) -> None:
+        self.inventory_cache.delete(RESOURCES_CACHE_KEY)
+        self.inventory_cache.delete(TEMPLATES_CACHE_KEY)
+
+    async def on_prompt_list_changed(
+        self, message: mcp.types.PromptListChangedNotification
+    ) -> None:
+        self.inventory_cache.delete(PROMPTS_CACHE_KEY)
+
+
 class FastMCPProxy(FastMCP):
     """
     A FastMCP server that acts as a proxy to a remote MCP-compliant server.
     It uses specialized managers that fulfill requests via an HTTP client.
     """
 
-    def __init__(self, client: Client, **kwargs):
+    def __init__(
+        self,
+        client: Client,
+        *,
+        inventory_cache_ttl: float | None = None,
+        session_pool_size: int | None = None,
+        session_ping_idle_after: float | None = None,
+        **kwargs,
+    ):
         """
         Initializes the proxy server.
 
         Args:
             client: The FastMCP client connected to the backend server.
+            inventory_cache_ttl: How long, in seconds, the tool, resource,
+                template, and prompt lists fetched from the backend may be
+                reused. Cached lists are also discarded when the backend sends a
+                list_changed notification. Defaults to the
+                `proxy_inventory_cache_ttl` setting; 0 disables caching.
+            session_pool_size: The maximum number of long-lived backend
+                sessions shared by proxied requests. Defaults to the
+                `proxy_session_pool_size` setting; 0 connects per request.
+            session_ping_idle_after: How long, in seconds, a pooled session
+                may be idle before it is pinged ahead of its next use. Defaults
+                to the `proxy_session_ping_idle_after` setting.
             **kwargs: Additional settings for the FastMCP server.
         """
         super().__init__(**kwargs)
         self.client = client
 
+        if inventory_cache_ttl is None:
+            inventory_cache_ttl = fastmcp.settings.proxy_inventory_cache_ttl
+        self._inventory_cache = TimedCache(
+            expiration=datetime.timedelta(seconds=inventory_cache_ttl)
+        )
+        if inventory_cache_ttl:
+            # listen for list_changed notifications on future backend sessions
+            self.client._session_kwargs["message_handler"] = (
+                ProxyInventoryMessageHandler(
+                    self._inventory_cache,
+                    handler=self.client._session_kwargs.get("message_handler"),
+                )
+            )
+
+        if session_pool_size is None:
+            session_pool_size = fastmcp.settings.proxy_session_pool_size
+        if session_ping_idle_after is None:
+            session_ping_idle_after = fastmcp.settings.proxy_session_ping_idle_after
+        self.sessions = ProxySessionPool(
+            self.client,
+            size=session_pool_size,
+            ping_idle_after=session_ping_idle_after,
+        )
+        # close the pooled backend sessions once no server session needs them
+        server_lifespan = self._mcp_server.lifespan
+
+        @asynccontextmanager
+        async def lifespan(server: Any) -> AsyncIterator[Any]:
+            async with self.sessions.open(), server_lifespan(server) as context:
+                yield context
+
+        self._mcp_server.lifespan = lifespan
+
         # Replace the default managers with our specialized proxy managers.
-        self._tool_manager = ProxyToolManager(client=self.client)
-        self._resource_manager = ProxyResourceManager(client=self.client)
-        self._prompt_manager = ProxyPromptManager(client=self.client)
+        self._tool_manager = ProxyToolManager(
+            client=self.client,
+            inventory_cache=self._inventory_cache,
+            sessions=self.sessions,
+        )
+        self._resource_manager = ProxyResourceManager(
+            client=self.client,
+            inventory_cache=self._inventory_cache,
+            sessions=self.sessions,
+        )
+        self._prompt_manager = ProxyPromptManager(
+            client=self.client,
+            inventory_cache=self._inventory_cache,
+            sessions=self.sessions,
+        )
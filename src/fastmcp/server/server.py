@@ -6,13 +6,13 @@ import datetime
 import inspect
 import re
 import warnings
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
 from contextlib import (
     AbstractAsyncContextManager,
     AsyncExitStack,
     asynccontextmanager,
 )
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Literal, cast, overload
@@ -55,12 +55,16 @@ from fastmcp.server.http import (
     create_streamable_http_app,
 )
 from fastmcp.server.low_level import LowLevelServer
-from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.server.middleware.middleware import compile_middleware
 from fastmcp.settings import Settings
 from fastmcp.tools import ToolManager
 from fastmcp.tools.tool import FunctionTool, Tool, ToolResult
 from fastmcp.utilities.cache import TimedCache
-from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.components import (
+    FastMCPComponent,
+    get_component_state_generation,
+)
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.mcp_config import MCPConfig
 from fastmcp.utilities.types import NotSet, NotSetT
@@ -72,6 +76,7 @@ if TYPE_CHECKING:
     from fastmcp.server.openapi import FastMCPOpenAPI, RouteMap
     from fastmcp.server.openapi import RouteMapFn as OpenAPIRouteMapFn
     from fastmcp.server.proxy import FastMCPProxy
+    from fastmcp.utilities.http import HTTPPoolConfig
 logger = get_logger(__name__)
 
 DuplicateBehavior = Literal["warn", "error", "replace", "ignore"]
@@ -203,6 +208,10 @@ class FastMCP(Generic[LifespanResultT]):
         self.exclude_tags = exclude_tags
 
         self.middleware = middleware or []
+        self._compiled_middleware: list[Middleware] = []
+        self._middleware_chains: dict[
+            tuple[str | None, str, Callable[..., Any]], CallNext[Any, Any]
+        ] = {}
 
         # Set up MCP protocol handlers
         self._setup_handlers()
@@ -319,23 +328,44 @@ class FastMCP(Generic[LifespanResultT]):
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
-        self._mcp_server.list_tools()(self._mcp_list_tools)
-        self._mcp_server.list_resources()(self._mcp_list_resources)
-        self._mcp_server.list_resource_templates()(self._mcp_list_resource_templates)
-        self._mcp_server.list_prompts()(self._mcp_list_prompts)
-        self._mcp_server.call_tool()(self._mcp_call_tool)
-        self._mcp_server.read_resource()(self._mcp_read_resource)
-        self._mcp_server.get_prompt()(self._mcp_get_prompt)
+        # record the sessions of requests, so that they can be notified of
+        # changes outside of a request
+        track = self._mcp_server.track_sessions
+        self._mcp_server.list_tools()(track(self._mcp_list_tools))
+        self._mcp_server.list_resources()(track(self._mcp_list_resources))
+        self._mcp_server.list_resource_templates()(
+            track(self._mcp_list_resource_templates)
+        )
+        self._mcp_server.list_prompts()(track(self._mcp_list_prompts))
+        self._mcp_server.call_tool()(track(self._mcp_call_tool))
+        self._mcp_server.read_resource()(track(self._mcp_read_resource))
+        self._mcp_server.get_prompt()(track(self._mcp_get_prompt))
 
     async def _apply_middleware(
         self,
         context: MiddlewareContext[Any],
-        call_next: Callable[[MiddlewareContext[Any]], Awaitable[Any]],
+        call_next: CallNext[Any, Any],
     ) -> Any:
-        """Builds and executes the middleware chain."""
-        chain = call_next
-        for mw in reversed(self.middleware):
-            chain = partial(mw, call_next=chain)
+        """
+        Runs a message through the middleware chain. Chains ending in one of
+        this server's handlers are compiled once for each kind of message and
+        reused until the middleware changes.
+        """
+        if self._compiled_middleware != self.middleware:
+            self._middleware_chains.clear()
+            self._compiled_middleware = list(self.middleware)
+
+        if getattr(call_next, "__self__", None) is not self:
+            chain = compile_middleware(
+                self.middleware, context.method, context.type, call_next
+            )
+        else:
+            key = (context.method, context.type, call_next)
+            chain = self._middleware_chains.get(key)
+            if chain is None:
+                chain = self._middleware_chains[key] = compile_middleware(
+                    self.middleware, context.method, context.type, call_next
+                )
         return await chain(context)
 
     def add_middleware(self, middleware: Middleware) -> None:
@@ -346,10 +376,10 @@ class FastMCP(Generic[LifespanResultT]):
         return await self._tool_manager.get_tools()
 
     async def get_tool(self, key: str) -> Tool:
-        tools = await self.get_tools()
-        if key not in tools:
+        try:
+            return await self._tool_manager.get_tool(key)
+        except NotFoundError:
             raise NotFoundError(f"Unknown tool: {key}")
-        return tools[key]
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, indexed by registered key."""
@@ -431,12 +461,54 @@ class FastMCP(Generic[LifespanResultT]):
 
         return decorator
 
+    def _has_middleware(self) -> bool:
+        """Whether this server or any server mounted on it has middleware."""
+        return bool(self.middleware) or any(
+            mounted.server._has_middleware()
+            for mounted in self._tool_manager.mounted_servers
+        )
+
+    def _get_list_cache_state(
+        self, manager: ToolManager | ResourceManager | PromptManager
+    ) -> tuple[int, int] | None:
+        """
+        Returns the state that a cached list response from `manager` must have
+        been built in to still be valid, or None if list responses from it
+        can't be cached. Responses are only cached when caching is enabled,
+        every mounted manager tracks its changes, and no middleware could alter
+        the response per request.
+        """
+        if (
+            self._cache.expiration <= datetime.timedelta(0)
+            or not manager.is_cacheable()
+            or self._has_middleware()
+        ):
+            return None
+        return (manager.generation, get_component_state_generation())
+
+    def _get_cached_list(self, method: str, state: tuple[int, int] | None) -> Any:
+        """Returns the cached response to a list request, or NOT_FOUND."""
+        if state is not None:
+            cached = self._cache.get(method)
+            if cached is not TimedCache.NOT_FOUND and cached[0] == state:
+                return list(cached[1])
+        return TimedCache.NOT_FOUND
+
     async def _mcp_list_tools(self) -> list[MCPTool]:
         logger.debug("Handler called: list_tools")
 
+        state = self._get_list_cache_state(self._tool_manager)
+        cached = self._get_cached_list("tools/list", state)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
         async with fastmcp.server.context.Context(fastmcp=self):
             tools = await self._list_tools()
-            return [tool.to_mcp_tool(name=tool.key) for tool in tools]
+            mcp_tools = [tool.to_mcp_tool(name=tool.key) for tool in tools]
+
+        if state is not None:
+            self._cache.set("tools/list", (state, mcp_tools))
+        return list(mcp_tools)
 
     async def _list_tools(self) -> list[Tool]:
         """
@@ -444,18 +516,6 @@ class FastMCP(Generic[LifespanResultT]):
         server.
         """
 
-        async def _handler(
-            context: MiddlewareContext[mcp.types.ListToolsRequest],
-        ) -> list[Tool]:
-            tools = await self._tool_manager.list_tools()  # type: ignore[reportPrivateUsage]
-
-            mcp_tools: list[Tool] = []
-            for tool in tools:
-                if self._should_enable_component(tool):
-                    mcp_tools.append(tool)
-
-            return mcp_tools
-
         async with fastmcp.server.context.Context(fastmcp=self) as fastmcp_ctx:
             # Create the middleware context.
             mw_context = MiddlewareContext(
@@ -467,17 +527,40 @@ class FastMCP(Generic[LifespanResultT]):
             )
 
             # Apply the middleware chain.
-            return await self._apply_middleware(mw_context, _handler)
+            return await self._apply_middleware(mw_context, self._list_tools_handler)
+
+    async def _list_tools_handler(
+        self,
+        context: MiddlewareContext[mcp.types.ListToolsRequest],
+    ) -> list[Tool]:
+        """Lists the enabled tools once the middleware has run."""
+        tools = await self._tool_manager.list_tools()  # type: ignore[reportPrivateUsage]
+
+        mcp_tools: list[Tool] = []
+        for tool in tools:
+            if self._should_enable_component(tool):
+                mcp_tools.append(tool)
+
+        return mcp_tools
 
     async def _mcp_list_resources(self) -> list[MCPResource]:
         logger.debug("Handler called: list_resources")
 
+        state = self._get_list_cache_state(self._resource_manager)
+        cached = self._get_cached_list("resources/list", state)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
         async with fastmcp.server.context.Context(fastmcp=self):
             resources = await self._list_resources()
-            return [
+            mcp_resources = [
                 resource.to_mcp_resource(uri=resource.key) for resource in resources
             ]
 
+        if state is not None:
+            self._cache.set("resources/list", (state, mcp_resources))
+        return list(mcp_resources)
+
     async def _list_resources(self) -> list[Resource]:
         """
         List all available resources, in the format expected by the low-level MCP
@@ -485,21 +568,9 @@ class FastMCP(Generic[LifespanResultT]):
 
         """
 
-        async def _handler(
-            context: MiddlewareContext[dict[str, Any]],
-        ) -> list[Resource]:
-            resources = await self._resource_manager.list_resources()  # type: ignore[reportPrivateUsage]
-
-            mcp_resources: list[Resource] = []
-            for resource in resources:
-                if self._should_enable_component(resource):
-                    mcp_resources.append(resource)
-
-            return mcp_resources
-
         async with fastmcp.server.context.Context(fastmcp=self) as fastmcp_ctx:
             # Create the middleware context.
-            mw_context = MiddlewareContext(
+            mw_context: MiddlewareContext[dict[str, Any]] = MiddlewareContext(
                 message={},  # List resources doesn't have parameters
                 source="client",
                 type="request",
@@ -508,18 +579,43 @@ class FastMCP(Generic[LifespanResultT]):
             )
 
             # Apply the middleware chain.
-            return await self._apply_middleware(mw_context, _handler)
+            return await self._apply_middleware(
+                mw_context, self._list_resources_handler
+            )
+
+    async def _list_resources_handler(
+        self,
+        context: MiddlewareContext[dict[str, Any]],
+    ) -> list[Resource]:
+        """Lists the enabled resources once the middleware has run."""
+        resources = await self._resource_manager.list_resources()  # type: ignore[reportPrivateUsage]
+
+        mcp_resources: list[Resource] = []
+        for resource in resources:
+            if self._should_enable_component(resource):
+                mcp_resources.append(resource)
+
+        return mcp_resources
 
     async def _mcp_list_resource_templates(self) -> list[MCPResourceTemplate]:
         logger.debug("Handler called: list_resource_templates")
 
+        state = self._get_list_cache_state(self._resource_manager)
+        cached = self._get_cached_list("resources/templates/list", state)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
         async with fastmcp.server.context.Context(fastmcp=self):
             templates = await self._list_resource_templates()
-            return [
+            mcp_templates = [
                 template.to_mcp_template(uriTemplate=template.key)
                 for template in templates
             ]
 
+        if state is not None:
+            self._cache.set("resources/templates/list", (state, mcp_templates))
+        return list(mcp_templates)
+
     async def _list_resource_templates(self) -> list[ResourceTemplate]:
         """
         List all available resource templates, in the format expected by the low-level MCP
@@ -527,21 +623,9 @@ class FastMCP(Generic[LifespanResultT]):
 
         """
 
-        async def _handler(
-            context: MiddlewareContext[dict[str, Any]],
-        ) -> list[ResourceTemplate]:
-            templates = await self._resource_manager.list_resource_templates()
-
-            mcp_templates: list[ResourceTemplate] = []
-            for template in templates:
-                if self._should_enable_component(template):
-                    mcp_templates.append(template)
-
-            return mcp_templates
-
         async with fastmcp.server.context.Context(fastmcp=self) as fastmcp_ctx:
             # Create the middleware context.
-            mw_context = MiddlewareContext(
+            mw_context: MiddlewareContext[dict[str, Any]] = MiddlewareContext(
                 message={},  # List resource templates doesn't have parameters
                 source="client",
                 type="request",
@@ -550,14 +634,39 @@ class FastMCP(Generic[LifespanResultT]):
             )
 
             # Apply the middleware chain.
-            return await self._apply_middleware(mw_context, _handler)
+            return await self._apply_middleware(
+                mw_context, self._list_resource_templates_handler
+            )
+
+    async def _list_resource_templates_handler(
+        self,
+        context: MiddlewareContext[dict[str, Any]],
+    ) -> list[ResourceTemplate]:
+        """Lists the enabled resource templates once the middleware has run."""
+        templates = await self._resource_manager.list_resource_templates()
+
+        mcp_templates: list[ResourceTemplate] = []
+        for template in templates:
+            if self._should_enable_component(template):
+                mcp_templates.append(template)
+
+        return mcp_templates
 
     async def _mcp_list_prompts(self) -> list[MCPPrompt]:
         logger.debug("Handler called: list_prompts")
 
+        state = self._get_list_cache_state(self._prompt_manager)
+        cached = self._get_cached_list("prompts/list", state)
+        if cached is not TimedCache.NOT_FOUND:
+            return cached
+
         async with fastmcp.server.context.Context(fastmcp=self):
             prompts = await self._list_prompts()
-            return [prompt.to_mcp_prompt(name=prompt.key) for prompt in prompts]
+            mcp_prompts = [prompt.to_mcp_prompt(name=prompt.key) for prompt in prompts]
+
+        if state is not None:
+            self._cache.set("prompts/list", (state, mcp_prompts))
+        return list(mcp_prompts)
 
     async def _list_prompts(self) -> list[Prompt]:
         """
@@ -566,18 +675,6 @@ class FastMCP(Generic[LifespanResultT]):
 
         """
 
-        async def _handler(
-            context: MiddlewareContext[mcp.types.ListPromptsRequest],
-        ) -> list[Prompt]:
-            prompts = await self._prompt_manager.list_prompts()  # type: ignore[reportPrivateUsage]
-
-            mcp_prompts: list[Prompt] = []
-            for prompt in prompts:
-                if self._should_enable_component(prompt):
-                    mcp_prompts.append(prompt)
-
-            return mcp_prompts
-
         async with fastmcp.server.context.Context(fastmcp=self) as fastmcp_ctx:
             # Create the middleware context.
             mw_context = MiddlewareContext(
@@ -589,7 +686,21 @@ class FastMCP(Generic[LifespanResultT]):
             )
 
             # Apply the middleware chain.
-            return await self._apply_middleware(mw_context, _handler)
+            return await self._apply_middleware(mw_context, self._list_prompts_handler)
+
+    async def _list_prompts_handler(
+        self,
+        context: MiddlewareContext[mcp.types.ListPromptsRequest],
+    ) -> list[Prompt]:
+        """Lists the enabled prompts once the middleware has run."""
+        prompts = await self._prompt_manager.list_prompts()  # type: ignore[reportPrivateUsage]
+
+        mcp_prompts: list[Prompt] = []
+        for prompt in prompts:
+            if self._should_enable_component(prompt):
+                mcp_prompts.append(prompt)
+
+        return mcp_prompts
 
     async def _mcp_call_tool(
         self, key: str, arguments: dict[str, Any]
@@ -622,17 +733,6 @@ class FastMCP(Generic[LifespanResultT]):
         Applies this server's middleware and delegates the filtered call to the manager.
         """
 
-        async def _handler(
-            context: MiddlewareContext[mcp.types.CallToolRequestParams],
-        ) -> ToolResult:
-            tool = await self._tool_manager.get_tool(context.message.name)
-            if not self._should_enable_component(tool):
-                raise NotFoundError(f"Unknown tool: {context.message.name!r}")
-
-            return await self._tool_manager.call_tool(
-                key=context.message.name, arguments=context.message.arguments or {}
-            )
-
         mw_context = MiddlewareContext(
             message=mcp.types.CallToolRequestParams(name=key, arguments=arguments),
             source="client",
@@ -640,7 +740,20 @@ class FastMCP(Generic[LifespanResultT]):
             method="tools/call",
             fastmcp_context=fastmcp.server.dependencies.get_context(),
         )
-        return await self._apply_middleware(mw_context, _handler)
+        return await self._apply_middleware(mw_context, self._call_tool_handler)
+
+    async def _call_tool_handler(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+    ) -> ToolResult:
+        """Calls an enabled tool once the middleware has run."""
+        tool = await self._tool_manager.get_tool(context.message.name)
+        if not self._should_enable_component(tool):
+            raise NotFoundError(f"Unknown tool: {context.message.name!r}")
+
+        return await self._tool_manager.call_tool(
+            key=context.message.name, arguments=context.message.arguments or {}
+        )
 
     async def _mcp_read_resource(self, uri: AnyUrl | str) -> list[ReadResourceContents]:
         """
@@ -665,21 +778,6 @@ class FastMCP(Generic[LifespanResultT]):
         Applies this server's middleware and delegates the filtered call to the manager.
         """
 
-        async def _handler(
-            context: MiddlewareContext[mcp.types.ReadResourceRequestParams],
-        ) -> list[ReadResourceContents]:
-            resource = await self._resource_manager.get_resource(context.message.uri)
-            if not self._should_enable_component(resource):
-                raise NotFoundError(f"Unknown resource: {str(context.message.uri)!r}")
-
-            content = await self._resource_manager.read_resource(context.message.uri)
-            return [
-                ReadResourceContents(
-                    content=content,
-                    mime_type=resource.mime_type,
-                )
-            ]
-
         # Convert string URI to AnyUrl if needed
         if isinstance(uri, str):
             uri_param = AnyUrl(uri)
@@ -693,7 +791,24 @@ class FastMCP(Generic[LifespanResultT]):
             method="resources/read",
             fastmcp_context=fastmcp.server.dependencies.get_context(),
         )
-        return await self._apply_middleware(mw_context, _handler)
+        return await self._apply_middleware(mw_context, self._read_resource_handler)
+
+    async def _read_resource_handler(
+        self,
+        context: MiddlewareContext[mcp.types.ReadResourceRequestParams],
+    ) -> list[ReadResourceContents]:
+        """Reads an enabled resource once the middleware has run."""
+        resource = await self._resource_manager.get_resource(context.message.uri)
+        if not self._should_enable_component(resource):
+            raise NotFoundError(f"Unknown resource: {str(context.message.uri)!r}")
+
+        content = await self._resource_manager.read_resource(context.message.uri)
+        return [
+            ReadResourceContents(
+                content=content,
+                mime_type=resource.mime_type,
+            )
+        ]
 
     async def _mcp_get_prompt(
         self, name: str, arguments: dict[str, Any] | None = None
@@ -722,17 +837,6 @@ class FastMCP(Generic[LifespanResultT]):
         Applies this server's middleware and delegates the filtered call to the manager.
         """
 
-        async def _handler(
-            context: MiddlewareContext[mcp.types.GetPromptRequestParams],
-        ) -> GetPromptResult:
-            prompt = await self._prompt_manager.get_prompt(context.message.name)
-            if not self._should_enable_component(prompt):
-                raise NotFoundError(f"Unknown prompt: {context.message.name!r}")
-
-            return await self._prompt_manager.render_prompt(
-                name=context.message.name, arguments=context.message.arguments
-            )
-
         mw_context = MiddlewareContext(
             message=mcp.types.GetPromptRequestParams(name=name, arguments=arguments),
             source="client",
@@ -740,7 +844,20 @@ class FastMCP(Generic[LifespanResultT]):
             method="prompts/get",
             fastmcp_context=fastmcp.server.dependencies.get_context(),
         )
-        return await self._apply_middleware(mw_context, _handler)
+        return await self._apply_middleware(mw_context, self._get_prompt_handler)
+
+    async def _get_prompt_handler(
+        self,
+        context: MiddlewareContext[mcp.types.GetPromptRequestParams],
+    ) -> GetPromptResult:
+        """Renders an enabled prompt once the middleware has run."""
+        prompt = await self._prompt_manager.get_prompt(context.message.name)
+        if not self._should_enable_component(prompt):
+            raise NotFoundError(f"Unknown prompt: {context.message.name!r}")
+
+        return await self._prompt_manager.render_prompt(
+            name=context.message.name, arguments=context.message.arguments
+        )
 
     def add_tool(self, tool: Tool) -> None:
         """Add a tool to the server.
@@ -1659,6 +1776,77 @@ class FastMCP(Generic[LifespanResultT]):
 
         self._cache.clear()
 
+    async def replace_mount(
+        self,
+        prefix: str | None,
+        server: FastMCP[LifespanResultT],
+        as_proxy: bool | None = None,
+    ) -> FastMCP[Any]:
+        """Replace the server mounted with a prefix by another server.
+
+        The swap is atomic: each request is routed to either the old or the new
+        server, and requests already routed to the old server finish on it.
+        Connected clients are then notified that the tool list changed (and the
+        resource and prompt lists, if they changed), and the call waits until
+        the requests in flight on the old server have finished. It must
+        therefore not be awaited from a request handled by the old server.
+
+        Args:
+            prefix: The prefix the server to replace was mounted with.
+            server: The FastMCP server to mount in its place.
+            as_proxy: Whether to treat the new server as a proxy, as in `mount`.
+
+        Returns:
+            The server that was replaced, with no requests in flight, so that it
+            can be shut down.
+
+        Raises:
+            ValueError: If no server is mounted with the prefix.
+        """
+        from fastmcp import Client
+        from fastmcp.client.transports import FastMCPTransport
+        from fastmcp.server.proxy import FastMCPProxy
+
+        # the most recently mounted server takes precedence, so replace it
+        mounted_server = next(
+            (
+                mounted
+                for mounted in reversed(self._tool_manager.mounted_servers)
+                if mounted.prefix == prefix
+            ),
+            None,
+        )
+        if mounted_server is None:
+            raise ValueError(f"No server is mounted with prefix {prefix!r}")
+
+        if as_proxy is None:
+            as_proxy = server._has_lifespan
+        if as_proxy and not isinstance(server, FastMCPProxy):
+            server = FastMCPProxy(Client(transport=FastMCPTransport(server)))
+
+        resources_before = await self._get_resource_keys()
+        prompts_before = set(await self.get_prompts())
+
+        old_server = mounted_server.server
+        # all managers share the MountedServer, so this swaps the server for
+        # tools, resources and prompts at once
+        mounted_server.server = server
+        self._tool_manager.remount(old_server, server)
+        self._resource_manager.remount(old_server, server)
+        self._prompt_manager.remount(old_server, server)
+        self._cache.clear()
+
+        await self._mcp_server.broadcast_list_changed(
+            tools=True,
+            resources=await self._get_resource_keys() != resources_before,
+            prompts=set(await self.get_prompts()) != prompts_before,
+        )
+        await mounted_server.wait_drained(old_server)
+        return old_server
+
+    async def _get_resource_keys(self) -> tuple[set[str], set[str]]:
+        return set(await self.get_resources()), set(await self.get_resource_templates())
+
     async def import_server(
         self,
         server: FastMCP[LifespanResultT],
@@ -1787,22 +1975,27 @@ class FastMCP(Generic[LifespanResultT]):
     def from_openapi(
         cls,
         openapi_spec: dict[str, Any],
-        client: httpx.AsyncClient,
+        client: httpx.AsyncClient | None = None,
         route_maps: list[RouteMap] | None = None,
         route_map_fn: OpenAPIRouteMapFn | None = None,
         mcp_component_fn: OpenAPIComponentFn | None = None,
         mcp_names: dict[str, str] | None = None,
         tags: set[str] | None = None,
+        http_pool: HTTPPoolConfig | None = None,
         **settings: Any,
     ) -> FastMCPOpenAPI:
         """
         Create a FastMCP server from an OpenAPI specification.
+
+        If no client is provided, one is created for the spec's first server
+        URL, with connection pooling configured by `http_pool`.
         """
         from .openapi import FastMCPOpenAPI
 
         return FastMCPOpenAPI(
             openapi_spec=openapi_spec,
             client=client,
+            http_pool=http_pool,
             route_maps=route_maps,
             route_map_fn=route_map_fn,
             mcp_component_fn=mcp_component_fn,
@@ -1941,6 +2134,38 @@ class MountedServer:
     prefix: str | None
     server: FastMCP[Any]
     resource_prefix_format: Literal["protocol", "path"] | None = None
+    # unfinished calls routed through this mount, by the server they went to
+    _calls: dict[FastMCP[Any], int] = field(
+        default_factory=dict[FastMCP[Any], int], init=False, repr=False, compare=False
+    )
+    _drained: dict[FastMCP[Any], anyio.Event] = field(
+        default_factory=dict[FastMCP[Any], anyio.Event],
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @asynccontextmanager
+    async def track_call(self) -> AsyncGenerator[FastMCP[Any], None]:
+        """
+        Yields the mounted server to call, counting the call as in flight on
+        that server until it finishes, even if the server is replaced meanwhile.
+        """
+        server = self.server
+        self._calls[server] = self._calls.get(server, 0) + 1
+        try:
+            yield server
+        finally:
+            self._calls[server] -= 1
+            if not self._calls[server]:
+                del self._calls[server]
+                if (drained := self._drained.pop(server, None)) is not None:
+                    drained.set()
+
+    async def wait_drained(self, server: FastMCP[Any]) -> None:
+        """Waits until no call routed to `server` through this mount is in flight."""
+        while server in self._calls:
+            await self._drained.setdefault(server, anyio.Event()).wait()
 
 
 def add_resource_prefix(
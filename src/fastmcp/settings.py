@@ -22,6 +22,8 @@ LOG_LEVEL = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 DuplicateBehavior = Literal["warn", "error", "replace", "ignore"]
 
+JSONBackendName = Literal["auto", "stdlib", "pydantic_core", "orjson"]
+
 
 class ExtendedEnvSettingsSource(EnvSettingsSource):
     """
@@ -180,6 +182,69 @@ class Settings(BaseSettings):
     streamable_http_path: str = "/mcp/"
     debug: bool = False
 
+    proxy_inventory_cache_ttl: Annotated[
+        float,
+        Field(
+            default=0,
+            description=inspect.cleandoc(
+                """
+                How long, in seconds, FastMCP proxy servers may reuse the tool,
+                resource, template, and prompt lists fetched from their backend
+                before listing them again. Cached lists are also discarded when the
+                backend sends a list_changed notification. Set to 0 to disable.
+                """
+            ),
+        ),
+    ] = 0
+
+    proxy_session_pool_size: Annotated[
+        int,
+        Field(
+            default=0,
+            ge=0,
+            description=inspect.cleandoc(
+                """
+                The maximum number of long-lived sessions a FastMCP proxy server
+                keeps open to its backend. Concurrent proxied requests are spread
+                across these sessions instead of connecting for each request. Set
+                to 0 to connect per request.
+                """
+            ),
+        ),
+    ] = 0
+
+    proxy_session_ping_idle_after: Annotated[
+        float,
+        Field(
+            default=5,
+            ge=0,
+            description=inspect.cleandoc(
+                """
+                How long, in seconds, a pooled FastMCP proxy backend session may
+                be idle before it is pinged ahead of its next use. Sessions that
+                fail the ping are replaced. Set to 0 to ping every idle session
+                before reuse.
+                """
+            ),
+        ),
+    ] = 5
+
+    openapi_max_resource_size: Annotated[
+        int | None,
+        Field(
+            default=10 * 1024 * 1024,
+            ge=1,
+            description=inspect.cleandoc(
+                """
+                The default maximum size, in bytes, of the response bodies read
+                by FastMCP OpenAPI resources. Responses are streamed, and reading
+                a larger one fails without downloading the rest. Set to None to
+                read responses of any size in full.
+                """
+            ),
+        ),
+    ] = 10 * 1024 * 1024
+
     # error handling
     mask_error_details: Annotated[
         bool,
@@ -197,6 +262,34 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    tool_result_indent: Annotated[
+        int | None,
+        Field(
+            default=None,
+            description=inspect.cleandoc(
+                """
+                The indentation of the JSON text that tool results which are not
+                strings are serialized to. If None (default), the JSON is compact.
+                """
+            ),
+        ),
+    ] = None
+
+    json_backend: Annotated[
+        JSONBackendName,
+        Field(
+            default="auto",
+            description=inspect.cleandoc(
+                """
+                The library used to encode and decode JSON: "stdlib",
+                "pydantic_core", or "orjson" (requires the orjson package). If
+                "auto" (default), orjson is used if it is installed, and
+                pydantic_core otherwise.
+                """
+            ),
+        ),
+    ] = "auto"
+
     server_dependencies: Annotated[
         list[str],
         Field(
@@ -1,10 +1,131 @@
 # src/fastmcp/tool_loader.py
+from __future__ import annotations
+
 import os
-from supabase import create_client
-import httpx
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
+import anyio
+
+from fastmcp.utilities.http import HTTPPoolConfig, PooledAsyncClient
+from fastmcp.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    import asyncpg
+
+    from fastmcp.server.openapi import FastMCPOpenAPI, OpenAPIRouteChanges
+
+logger = get_logger(__name__)
+
+JSON_SCHEMA_TYPES = {"string", "number", "integer", "boolean", "array", "object"}
+
+# All enabled tools with their endpoint and parameters, one row per parameter
+# (or a single row with NULL parameter columns for tools without parameters)
+TOOL_CATALOG_QUERY = """
+    SELECT t.tool_name, t.tool_description, e.id AS endpoint_id, e.url, e.method,
+           p.parameter_name, p.parameter_type, p.is_required
+    FROM mcp_tools t
+    JOIN api_endpoints e ON e.endpoint_id = t.id
+    LEFT JOIN endpoint_parameters p ON p.endpoint_id = e.id
+    WHERE t.is_enabled = true
+    ORDER BY t.tool_name, e.id, p.parameter_name
+"""
+
+TOOL_CATALOG_TABLES = ("mcp_tools", "api_endpoints", "endpoint_parameters")
+
+# The catalog tables that have an `updated_at` column
+UPDATED_AT_TABLES_QUERY = """
+    SELECT table_name FROM information_schema.columns
+    WHERE column_name = 'updated_at' AND table_name = ANY($1::text[])
+"""
+
+
+def catalog_version_query(updated_at_tables: set[str]) -> str:
+    """
+    Returns a query whose result changes whenever a row of the catalog tables
+    is added or removed, or updated in a table with an `updated_at` column.
+    """
+    columns = []
+    for table in TOOL_CATALOG_TABLES:
+        columns.append(f"(SELECT count(*) FROM {table})")
+        if table in updated_at_tables:
+            columns.append(f"(SELECT max(updated_at) FROM {table})")
+    return f"SELECT {', '.join(columns)}"
+
+
+def empty_openapi_spec() -> dict:
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Supabase Dynamic Tools", "version": "1.0.0"},
+        "paths": {},
+    }
+
+
+def add_tool_to_spec(
+    openapi_spec: dict,
+    tool_name: str,
+    tool_description: str,
+    url: str,
+    method: str,
+    params: list[dict[str, Any]],
+) -> None:
+    """Adds the operation of a tool to an OpenAPI spec."""
+    path = urlparse(url).path
+    method = method.lower()
+
+    if path not in openapi_spec["paths"]:
+        openapi_spec["paths"][path] = {}
+
+    path_item = {
+        "summary": tool_description,
+        "operationId": tool_name,
+        "parameters": [],
+        "responses": {"200": {"description": "Successful Response"}}
+    }
+
+    body_properties = {}
+    body_required_fields = []
+
+    for p in params:
+        param_type = str(p.get("parameter_type") or "string").lower()
+        if param_type not in JSON_SCHEMA_TYPES:
+            param_type = "string"
+
+        if f'{{{p["parameter_name"]}}}' in path:
+            path_item["parameters"].append({
+                "name": p["parameter_name"], "in": "path", "required": True,
+                "schema": {"type": param_type}
+            })
+        elif method == "get":
+            path_item["parameters"].append({
+                "name": p["parameter_name"], "in": "query",
+                "required": bool(p.get("is_required")), "schema": {"type": param_type}
+            })
+        else:
+            body_properties[p["parameter_name"]] = {"type": param_type}
+            if p.get("is_required"):
+                body_required_fields.append(p["parameter_name"])
+
+    if body_properties:
+        path_item["requestBody"] = {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": body_properties,
+                        "required": body_required_fields
+                    }
+                }
+            }
+        }
+
+    openapi_spec["paths"][path][method] = path_item
+
+
 def generate_openapi_spec_from_supabase() -> dict:
+    from supabase import create_client
+
     SUPABASE_URL = os.environ.get("SUPABASE_URL")
     SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
 
@@ -25,11 +146,7 @@ def generate_openapi_spec_from_supabase() -> dict:
 
     if not response.data:
         print("Warning: No enabled tools with linked endpoints found.")
-        return {
-            "openapi": "3.0.0",
-            "info": {"title": "Supabase Dynamic Tools", "version": "1.0.0"},
-            "paths": {},
-        }
+        return empty_openapi_spec()
 
     tools_with_endpoints = response.data
     all_params = params_response.data
@@ -38,13 +155,7 @@ def generate_openapi_spec_from_supabase() -> dict:
     for p in all_params:
         params_map.setdefault(p["endpoint_id"], []).append(p)
 
-    openapi_spec = {
-        "openapi": "3.0.0",
-        "info": {"title": "Supabase Dynamic Tools", "version": "1.0.0"},
-        "paths": {},
-    }
-
-    json_schema_types = {"string", "number", "integer", "boolean", "array", "object"}
+    openapi_spec = empty_openapi_spec()
 
     for item in tools_with_endpoints:
         endpoints_list = item.get("api_endpoints")
@@ -53,63 +164,197 @@ def generate_openapi_spec_from_supabase() -> dict:
             continue
 
         endpoint = endpoints_list[0]
-        path = urlparse(endpoint["url"]).path
-        method = endpoint["method"].lower()
+        add_tool_to_spec(
+            openapi_spec,
+            tool_name=item["tool_name"],
+            tool_description=item["tool_description"],
+            url=endpoint["url"],
+            method=endpoint["method"],
+            params=params_map.get(endpoint["id"], []),
+        )
+        print(f"  + Added tool '{item['tool_name']}' with path '{urlparse(endpoint['url']).path}'")
 
-        if path not in openapi_spec["paths"]:
-            openapi_spec["paths"][path] = {}
+    return openapi_spec
 
-        path_item = {
-            "summary": item["tool_description"],
-            "operationId": item["tool_name"],
-            "parameters": [],
-            "responses": {"200": {"description": "Successful Response"}}
-        }
 
-        tool_params = params_map.get(endpoint["id"], [])
-        body_properties = {}
-        body_required_fields = []
-
-        for p in tool_params:
-            param_type = str(p.get("data_type", "string")).lower()
-            if param_type not in json_schema_types:
-                param_type = "string"
-
-            if f'{{{p["parameter_name"]}}}' in path:
-                path_item["parameters"].append({
-                    "name": p["parameter_name"], "in": "path", "required": True,
-                    "schema": {"type": param_type}
-                })
-            elif method == "get":
-                path_item["parameters"].append({
-                    "name": p["parameter_name"], "in": "query",
-                    "required": p.get("is_required", False), "schema": {"type": param_type}
-                })
-            else:
-                body_properties[p["parameter_name"]] = {"type": param_type}
-                if p.get("is_required", False):
-                    body_required_fields.append(p["parameter_name"])
-
-        if body_properties:
-            path_item["requestBody"] = {
-                "required": True,
-                "content": {
-                    "application/json": {
-                        "schema": {
-                            "type": "object",
-                            "properties": body_properties,
-                            "required": body_required_fields
-                        }
-                    }
-                }
+def build_openapi_spec(rows: list[Any]) -> dict:
+    """
+    Builds an OpenAPI spec from the rows of TOOL_CATALOG_QUERY. Rows may be
+    asyncpg Records or dicts.
+    """
+    tools: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        tool = tools.get(row["tool_name"])
+        if tool is None:
+            tool = tools[row["tool_name"]] = {
+                "endpoint_id": row["endpoint_id"],
+                "tool_name": row["tool_name"],
+                "tool_description": row["tool_description"],
+                "url": row["url"],
+                "method": row["method"],
+                "params": [],
             }
+        elif row["endpoint_id"] != tool["endpoint_id"]:
+            # like the Supabase loader, only a tool's first endpoint is used
+            continue
+        if row["parameter_name"] is not None:
+            tool["params"].append(
+                {
+                    "parameter_name": row["parameter_name"],
+                    "parameter_type": row["parameter_type"],
+                    "is_required": row["is_required"],
+                }
+            )
 
-        openapi_spec["paths"][path][method] = path_item
-        print(f"  + Added tool '{item['tool_name']}' with path '{path}'")
-
+    openapi_spec = empty_openapi_spec()
+    for tool in tools.values():
+        tool.pop("endpoint_id")
+        add_tool_to_spec(openapi_spec, **tool)
     return openapi_spec
 
-def create_client_for_tools() -> httpx.AsyncClient:
+
+async def create_tool_db_pool(
+    dsn: str | None = None, min_size: int = 1, max_size: int = 5
+) -> asyncpg.Pool:
+    """
+    Creates a connection pool for the tool registry database, by default at
+    the SUPABASE_DB_URL environment variable.
+    """
+    try:
+        import asyncpg
+    except ImportError:
+        raise ImportError(
+            "The tool registry database is not available. Please install "
+            "fastmcp[asyncpg] or install the asyncpg package manually."
+        )
+
+    dsn = dsn or os.environ.get("SUPABASE_DB_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL environment variable not set.")
+    return await asyncpg.create_pool(dsn=dsn, min_size=min_size, max_size=max_size)
+
+
+async def fetch_openapi_spec(pool: asyncpg.Pool) -> dict:
+    """Builds the OpenAPI spec of all enabled tools with a single query."""
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(TOOL_CATALOG_QUERY)
+    return build_openapi_spec(rows)
+
+
+class ToolCatalogWatcher:
+    """
+    Keeps an OpenAPI server's tools in sync with the tool registry database.
+
+    Every `interval` seconds, the watcher checks whether any catalog table
+    changed (by row counts and `updated_at`), and if so, reloads the catalog
+    and updates the server, adding and removing tools without a restart.
+    Tables without an `updated_at` column are only checked by row count, so
+    rows updated in place there are not noticed by polling. If `channel` is
+    set, the watcher also LISTENs on it and refreshes as soon as a
+    notification arrives, e.g. from a trigger calling `pg_notify`.
+
+    Example:
+        ```python
+        pool = await create_tool_db_pool()
+        server = FastMCP.from_openapi(await fetch_openapi_spec(pool), client=client)
+        watcher = ToolCatalogWatcher(pool, server, channel="mcp_tools_changed")
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(watcher.run)
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        server: FastMCPOpenAPI,
+        interval: float = 30.0,
+        channel: str | None = None,
+    ):
+        self.pool = pool
+        self.server = server
+        self.interval = interval
+        self.channel = channel
+        self._version: tuple | None = None
+        self._version_query: str | None = None
+        self._notified = anyio.Event()
+
+    async def _catalog_version(self) -> tuple:
+        async with self.pool.acquire() as conn:
+            if self._version_query is None:
+                rows = await conn.fetch(
+                    UPDATED_AT_TABLES_QUERY, list(TOOL_CATALOG_TABLES)
+                )
+                updated_at_tables = {row["table_name"] for row in rows}
+                for table in set(TOOL_CATALOG_TABLES) - updated_at_tables:
+                    logger.warning(
+                        f"{table} has no updated_at column; only added and "
+                        "removed rows are detected"
+                    )
+                self._version_query = catalog_version_query(updated_at_tables)
+            return tuple(await conn.fetchrow(self._version_query))
+
+    async def refresh(self, force: bool = False) -> OpenAPIRouteChanges | None:
+        """
+        Updates the server if the catalog changed since the last refresh.
+        Returns the changes, or None if the catalog was unchanged.
+        """
+        version = await self._catalog_version()
+        if not force and version == self._version:
+            return None
+        self._version = version
+
+        changes = self.server.update_spec(await fetch_openapi_spec(self.pool))
+        for name in changes.added:
+            logger.info(f"Loaded tool {name!r}")
+        for name in changes.removed:
+            logger.info(f"Unloaded tool {name!r}")
+        return changes
+
+    def _on_notification(self, *args: Any) -> None:
+        self._notified.set()
+
+    async def run(self) -> None:
+        """
+        Refreshes the server until cancelled. Errors are reported instead of
+        raised, so that they do not stop the server the watcher runs
+        alongside: a failed check is retried after `interval`, and if the
+        listener cannot be set up, the watcher only polls.
+        """
+        try:
+            self._version = await self._catalog_version()
+        except Exception as e:
+            logger.warning(f"Failed to check the tool catalog: {e}")
+        listener = None
+        if self.channel is not None:
+            try:
+                listener = await self.pool.acquire()
+                await listener.add_listener(self.channel, self._on_notification)
+            except Exception as e:
+                logger.warning(f"Failed to listen for tool changes: {e}")
+                if listener is not None:
+                    await self.pool.release(listener)
+                    listener = None
+        try:
+            while True:
+                with anyio.move_on_after(self.interval):
+                    await self._notified.wait()
+                # a notification means the catalog changed, even if its
+                # version did not
+                notified = self._notified.is_set()
+                self._notified = anyio.Event()
+                try:
+                    await self.refresh(force=notified)
+                except Exception as e:
+                    logger.warning(f"Failed to refresh tools: {e}")
+        finally:
+            if listener is not None:
+                with anyio.CancelScope(shield=True):
+                    await listener.remove_listener(self.channel, self._on_notification)
+                    await self.pool.release(listener)
+
+
+def create_client_for_tools(pool: HTTPPoolConfig | None = None) -> PooledAsyncClient:
     API_BASE_URL = os.environ.get("TOOL_API_BASE_URL", "https://autocab-api.azure-api.net")
     SUBSCRIPTION_KEY = os.environ.get("OCP_APIM_SUBSCRIPTION_KEY")
 
@@ -120,4 +365,10 @@ def create_client_for_tools() -> httpx.AsyncClient:
         "Ocp-Apim-Subscription-Key": SUBSCRIPTION_KEY
     }
 
-    return httpx.AsyncClient(base_url=API_BASE_URL, headers=headers)
+    if pool is None:
+        pool = HTTPPoolConfig(
+            max_connections=int(os.environ.get("TOOL_API_MAX_CONNECTIONS", "100")),
+            http2=os.environ.get("TOOL_API_HTTP2", "").lower() in ("1", "true", "yes"),
+        )
+
+    return PooledAsyncClient(pool, base_url=API_BASE_URL, headers=headers)
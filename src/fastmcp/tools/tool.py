@@ -9,9 +9,11 @@ import mcp.types
 import pydantic_core
 from mcp.types import ContentBlock, TextContent, ToolAnnotations
 from mcp.types import Tool as MCPTool
-from pydantic import Field, PydanticSchemaGenerationError
+from pydantic import Field, PrivateAttr, PydanticSchemaGenerationError, TypeAdapter
 
+import fastmcp
 from fastmcp.server.dependencies import get_context
+from fastmcp.utilities import json_backend
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
@@ -46,7 +48,9 @@ class _UnserializableType:
 
 
 def default_serializer(data: Any) -> str:
-    return pydantic_core.to_json(data, fallback=str, indent=2).decode()
+    return json_backend.dumps(
+        data, fallback=str, indent=fastmcp.settings.tool_result_indent
+    )
 
 
 class ToolResult:
@@ -80,6 +84,19 @@ class ToolResult:
                 )
         self.structured_content: dict[str, Any] | None = structured_content
 
+    @classmethod
+    def _from_serialized(
+        cls, content: list[ContentBlock], structured_content: dict[str, Any] | None
+    ) -> ToolResult:
+        """
+        Creates a result from content blocks and JSON-compatible structured
+        content, without converting them again.
+        """
+        result = cls.__new__(cls)
+        result.content = content
+        result.structured_content = structured_content
+        return result
+
     def to_mcp_result(
         self,
     ) -> list[ContentBlock] | tuple[list[ContentBlock], dict[str, Any]]:
@@ -209,9 +226,40 @@ class Tool(FastMCPComponent):
         )
 
 
+@dataclass(frozen=True)
+class _CallPlan:
+    """The introspection of a tool function that is needed to call it."""
+
+    fn: Callable[..., Any]
+    context_kwarg: str | None
+    type_adapter: TypeAdapter[Any]
+
+    @classmethod
+    def from_function(cls, fn: Callable[..., Any]) -> _CallPlan:
+        from fastmcp.server.context import Context
+
+        return cls(
+            fn=fn,
+            context_kwarg=find_kwarg_by_type(fn, kwarg_type=Context),
+            type_adapter=get_cached_typeadapter(fn),
+        )
+
+
 class FunctionTool(Tool):
     fn: Callable[..., Any]
 
+    _call_plan: _CallPlan | None = PrivateAttr(default=None)
+
+    def _get_call_plan(self) -> _CallPlan:
+        """
+        Returns the call plan for the tool's function, introspecting it only if
+        it has not been already.
+        """
+        plan = self._call_plan
+        if plan is None or plan.fn is not self.fn:
+            plan = self._call_plan = _CallPlan.from_function(self.fn)
+        return plan
+
     @classmethod
     def from_function(
         cls,
@@ -246,7 +294,7 @@ class FunctionTool(Tool):
                     f'Output schemas must have "type" set to "object" due to MCP spec limitations. Received: {output_schema!r}'
                 )
 
-        return cls(
+        tool = cls(
             fn=parsed_fn.fn,
             name=name or parsed_fn.name,
             title=title,
@@ -258,19 +306,18 @@ class FunctionTool(Tool):
             serializer=serializer,
             enabled=enabled if enabled is not None else True,
         )
+        tool._get_call_plan()
+        return tool
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Run the tool with arguments."""
-        from fastmcp.server.context import Context
+        plan = self._get_call_plan()
 
-        arguments = arguments.copy()
-
-        context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
+        context_kwarg = plan.context_kwarg
         if context_kwarg and context_kwarg not in arguments:
-            arguments[context_kwarg] = get_context()
+            arguments = {**arguments, context_kwarg: get_context()}
 
-        type_adapter = get_cached_typeadapter(self.fn)
-        result = type_adapter.validate_python(arguments)
+        result = plan.type_adapter.validate_python(arguments)
 
         if inspect.isawaitable(result):
             result = await result
@@ -278,29 +325,8 @@ class FunctionTool(Tool):
         if isinstance(result, ToolResult):
             return result
 
-        unstructured_result = _convert_to_content(result, serializer=self.serializer)
-
-        structured_output = None
-        # First handle structured content based on output schema, if any
-        if self.output_schema is not None:
-            if self.output_schema.get("x-fastmcp-wrap-result"):
-                # Schema says wrap - always wrap in result key
-                structured_output = {"result": result}
-            else:
-                structured_output = result
-        # If no output schema, try to serialize the result. If it is a dict, use
-        # it as structured content. If it is not a dict, ignore it.
-        if structured_output is None:
-            try:
-                structured_output = pydantic_core.to_jsonable_python(result)
-                if not isinstance(structured_output, dict):
-                    structured_output = None
-            except Exception:
-                pass
-
-        return ToolResult(
-            content=unstructured_result,
-            structured_content=structured_output,
+        return _make_tool_result(
+            result, serializer=self.serializer, output_schema=self.output_schema
         )
 
 
@@ -428,6 +454,82 @@ class ParsedFunction:
         )
 
 
+def _is_data_result(result: Any) -> bool:
+    """
+    Whether a result is plain data, which is sent as JSON text, rather than
+    content or a list with content in it.
+    """
+    if result is None or isinstance(result, str | ContentBlock | Image | Audio | File):
+        return False
+    if isinstance(result, list | tuple):
+        # lists of one item are sent as that item
+        return len(result) > 1 and not any(
+            isinstance(item, ContentBlock | Image | Audio | File) for item in result
+        )
+    return True
+
+
+def _make_tool_result(
+    result: Any,
+    serializer: Callable[[Any], str] | None = None,
+    output_schema: dict[str, Any] | None = None,
+) -> ToolResult:
+    """
+    Converts the return value of a tool to a ToolResult.
+
+    Plain data is converted to its JSON-compatible form once, which is used
+    both for the text content and for the structured content.
+    """
+    jsonable: Any = None
+    serialized = False
+    if _is_data_result(result):
+        try:
+            jsonable = pydantic_core.to_jsonable_python(result)
+            serialized = True
+        except pydantic_core.PydanticSerializationError:
+            pass
+
+    if serialized and serializer is None:
+        content: list[ContentBlock] = [
+            TextContent(
+                type="text",
+                text=json_backend.dumps(
+                    jsonable, indent=fastmcp.settings.tool_result_indent
+                ),
+            )
+        ]
+    else:
+        content = _convert_to_content(result, serializer=serializer)
+
+    structured_output = None
+    # First handle structured content based on output schema, if any
+    if output_schema is not None:
+        if output_schema.get("x-fastmcp-wrap-result"):
+            # Schema says wrap - always wrap in result key
+            structured_output = {"result": jsonable if serialized else result}
+        elif not serialized or not isinstance(jsonable, dict):
+            # let ToolResult convert and validate the result
+            return ToolResult(content=content, structured_content=result)
+        else:
+            structured_output = jsonable
+    # If no output schema, try to serialize the result. If it is a dict, use
+    # it as structured content. If it is not a dict, ignore it.
+    elif serialized:
+        if isinstance(jsonable, dict):
+            structured_output = jsonable
+    elif result is not None:
+        try:
+            structured_output = pydantic_core.to_jsonable_python(result)
+            if not isinstance(structured_output, dict):
+                structured_output = None
+        except Exception:
+            pass
+
+    if structured_output is not None and not serialized:
+        return ToolResult(content=content, structured_content=structured_output)
+    return ToolResult._from_serialized(content, structured_output)
+
+
 def _convert_to_content(
     result: Any,
     serializer: Callable[[Any], str] | None = None,
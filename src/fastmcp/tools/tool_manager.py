@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from mcp.types import ToolAnnotations
 
@@ -10,10 +10,12 @@ from fastmcp import settings
 from fastmcp.exceptions import NotFoundError, ToolError
 from fastmcp.settings import DuplicateBehavior
 from fastmcp.tools.tool import Tool, ToolResult
+from fastmcp.utilities.components import get_component_state_generation
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.routing import PrefixRouter
 
 if TYPE_CHECKING:
-    from fastmcp.server.server import MountedServer
+    from fastmcp.server.server import FastMCP, MountedServer
 
 logger = get_logger(__name__)
 
@@ -21,6 +23,11 @@ logger = get_logger(__name__)
 class ToolManager:
     """Manages FastMCP tools."""
 
+    # Whether this manager's inventory only changes through its own mutation
+    # methods. Managers that source tools from elsewhere (e.g. a remote server)
+    # set this to False, which prevents them and their parents from caching.
+    _cacheable: ClassVar[bool] = True
+
     def __init__(
         self,
         duplicate_behavior: DuplicateBehavior | None = None,
@@ -28,6 +35,16 @@ class ToolManager:
     ):
         self._tools: dict[str, Tool] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._mount_router: PrefixRouter[MountedServer] = PrefixRouter()
+        self._parent_managers: list[ToolManager] = []
+
+        # Cached, unfiltered inventory of local and mounted tools. It is rebuilt
+        # lazily after this manager or any mounted manager changes, or after any
+        # component is enabled or disabled.
+        self._tool_index: dict[str, Tool] | None = None
+        self._tool_index_state: int = -1
+        self._generation: int = 0
+
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
         # Default to "warn" if None is provided
@@ -45,6 +62,86 @@ class ToolManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for tools."""
         self._mounted_servers.append(server)
+        self._mount_router.add(server.prefix, server)
+        server.server._tool_manager._parent_managers.append(self)
+        self._invalidate()
+
+    def remount(self, old_server: FastMCP[Any], new_server: FastMCP[Any]) -> None:
+        """
+        Updates this manager after one of its mounted servers was replaced, so
+        that changes to the new server, not the old one, invalidate it.
+        """
+        old_server._tool_manager._parent_managers.remove(self)
+        new_server._tool_manager._parent_managers.append(self)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """
+        Discards the cached tool inventory of this manager and of every manager
+        this one is mounted on.
+        """
+        self._generation += 1
+        self._tool_index = None
+        for parent in self._parent_managers:
+            parent._invalidate()
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter that increases whenever the tool inventory of this manager,
+        or of a manager mounted on it, changes.
+        """
+        return self._generation
+
+    @property
+    def mounted_servers(self) -> Sequence[MountedServer]:
+        """The servers mounted on this manager, in the order they were mounted."""
+        return self._mounted_servers
+
+    def is_cacheable(self) -> bool:
+        """Whether this manager's inventory is fully tracked by invalidation."""
+        return self._cacheable and all(
+            mounted.server._tool_manager.is_cacheable()
+            for mounted in self._mounted_servers
+        )
+
+    async def _get_tool_index(self) -> dict[str, Tool]:
+        """
+        Returns the unfiltered tool inventory, rebuilding it only if it has been
+        invalidated. The returned dict is shared and must not be mutated.
+        """
+        state = get_component_state_generation()
+        if self._tool_index is not None and self._tool_index_state == state:
+            return self._tool_index
+
+        generation = self._generation
+        tools = await self._load_tools(via_server=False)
+
+        # only store the index if nothing changed while it was being built
+        if generation == self._generation and self.is_cacheable():
+            self._tool_index = tools
+            self._tool_index_state = state
+        return tools
+
+    def _is_known_missing(self, key: str) -> bool:
+        """
+        Whether the cached index proves that `key` is not served by this
+        manager. Returns False whenever there is no valid index to consult.
+        """
+        return (
+            self._tool_index is not None
+            and self._tool_index_state == get_component_state_generation()
+            and key not in self._tool_index
+        )
+
+    async def _lookup_tools(self) -> dict[str, Tool]:
+        """
+        Returns the tool inventory used for key lookups, avoiding a copy of the
+        cached index when this manager's inventory is fully tracked.
+        """
+        if self._cacheable:
+            return await self._get_tool_index()
+        return await self.get_tools()
 
     async def _load_tools(self, *, via_server: bool = False) -> dict[str, Tool]:
         """
@@ -86,12 +183,12 @@ class ToolManager:
 
     async def has_tool(self, key: str) -> bool:
         """Check if a tool exists."""
-        tools = await self.get_tools()
+        tools = await self._lookup_tools()
         return key in tools
 
     async def get_tool(self, key: str) -> Tool:
         """Get tool by key."""
-        tools = await self.get_tools()
+        tools = await self._lookup_tools()
         if key in tools:
             return tools[key]
         raise NotFoundError(f"Tool {key!r} not found")
@@ -100,7 +197,7 @@ class ToolManager:
         """
         Gets the complete, unfiltered inventory of all tools.
         """
-        return await self._load_tools(via_server=False)
+        return dict(await self._get_tool_index())
 
     async def list_tools(self) -> list[Tool]:
         """
@@ -153,6 +250,7 @@ class ToolManager:
                 return existing
         else:
             self._tools[tool.key] = tool
+        self._invalidate()
         return tool
 
     def remove_tool(self, key: str) -> None:
@@ -166,6 +264,7 @@ class ToolManager:
         """
         if key in self._tools:
             del self._tools[key]
+            self._invalidate()
         else:
             raise NotFoundError(f"Tool {key!r} not found")
 
@@ -176,9 +275,7 @@ class ToolManager:
         """
         # 1. Check local tools first. The server will have already applied its filter.
         if key in self._tools:
-            tool = await self.get_tool(key)
-            if not tool:
-                raise NotFoundError(f"Tool {key!r} not found")
+            tool = self._tools[key]
 
             try:
                 return await tool.run(arguments)
@@ -198,16 +295,14 @@ class ToolManager:
                     # Include original error details
                     raise ToolError(f"Error calling tool {key!r}: {e}") from e
 
-        # 2. Check mounted servers using the filtered protocol path.
-        for mounted in reversed(self._mounted_servers):
-            tool_key = key
-            if mounted.prefix:
-                if key.startswith(f"{mounted.prefix}_"):
-                    tool_key = key.removeprefix(f"{mounted.prefix}_")
-                else:
-                    continue
+        # 2. Check mounted servers using the filtered protocol path. The router
+        # only yields servers whose prefix matches, most recently mounted first.
+        for tool_key, mounted in self._mount_router.route(key):
+            if mounted.server._tool_manager._is_known_missing(tool_key):
+                continue
             try:
-                return await mounted.server._call_tool(tool_key, arguments)
+                async with mounted.track_call() as server:
+                    return await server._call_tool(tool_key, arguments)
             except NotFoundError:
                 continue
 
@@ -1,26 +1,116 @@
 import datetime
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
-UTC = datetime.timezone.utc
+# the default maximum number of entries in a TimedCache
+DEFAULT_MAX_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of a TimedCache's counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
 
 
 class TimedCache:
+    """
+    A bounded cache whose entries expire a fixed time after they were set.
+
+    When the cache holds more than `max_size` entries, the least recently used
+    ones are evicted. Expired entries are removed when they are looked up, and
+    all of them are swept out periodically when new entries are set, so
+    entries that are never read again do not accumulate. Expiry uses a
+    monotonic clock, so it is not affected by changes to the system time.
+    """
+
     NOT_FOUND = object()
 
-    def __init__(self, expiration: datetime.timedelta):
+    def __init__(
+        self,
+        expiration: datetime.timedelta,
+        max_size: int | None = DEFAULT_MAX_SIZE,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"Invalid cache max_size: {max_size}")
         self.expiration = expiration
-        self.cache: dict[Any, tuple[Any, datetime.datetime]] = {}
+        self.max_size = max_size
+        self.cache: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._ttl = expiration.total_seconds()
+        # sweep at most once per expiration period, since no entry can expire
+        # sooner than that after being set
+        self._sweep_interval = max(self._ttl, 1.0)
+        self._next_sweep = time.monotonic() + self._sweep_interval
+
+    def __len__(self) -> int:
+        return len(self.cache)
 
     def set(self, key: Any, value: Any) -> None:
-        expires = datetime.datetime.now(UTC) + self.expiration
-        self.cache[key] = (value, expires)
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        if self._ttl <= 0:
+            # the entry would already be expired, so don't store it
+            self.cache.pop(key, None)
+            return
+
+        self.cache[key] = (value, now + self._ttl)
+        self.cache.move_to_end(key)
+        if self.max_size is not None:
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+                self.evictions += 1
 
     def get(self, key: Any) -> Any:
-        value = self.cache.get(key)
-        if value is not None and value[1] > datetime.datetime.now(UTC):
-            return value[0]
-        else:
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return self.NOT_FOUND
+
+        value, expires = entry
+        if expires <= time.monotonic():
+            del self.cache[key]
+            self.expirations += 1
+            self.misses += 1
             return self.NOT_FOUND
 
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def delete(self, key: Any) -> None:
+        self.cache.pop(key, None)
+
     def clear(self) -> None:
         self.cache.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the cache's hit, miss, eviction and expiration counts."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            size=len(self.cache),
+        )
+
+    def _sweep(self, now: float) -> None:
+        """Removes all expired entries."""
+        expired = [key for key, (_, expires) in self.cache.items() if expires <= now]
+        for key in expired:
+            del self.cache[key]
+        self.expirations += len(expired)
+        self._next_sweep = now + self._sweep_interval
@@ -8,6 +8,21 @@ from fastmcp.utilities.types import FastMCPBaseModel
 
 T = TypeVar("T")
 
+# Incremented whenever any component is enabled or disabled. Component indexes
+# (e.g. the ToolManager's cached inventory) compare against this counter to
+# detect state changes in components they don't own directly.
+_state_generation = 0
+
+
+def get_component_state_generation() -> int:
+    """Return a counter that changes whenever any component is enabled or disabled."""
+    return _state_generation
+
+
+def _bump_component_state_generation() -> None:
+    global _state_generation
+    _state_generation += 1
+
 
 def _convert_set_default_none(maybe_set: set[T] | Sequence[T] | None) -> set[T]:
     """Convert a sequence to a set, defaulting to an empty set if None."""
@@ -73,7 +88,9 @@ class FastMCPComponent(FastMCPBaseModel):
     def enable(self) -> None:
         """Enable the component."""
         self.enabled = True
+        _bump_component_state_generation()
 
     def disable(self) -> None:
         """Disable the component."""
         self.enabled = False
+        _bump_component_state_generation()
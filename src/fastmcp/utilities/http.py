@@ -1,4 +1,22 @@
+from __future__ import annotations
+
 import socket
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# response headers that describe the encoded body, which no longer apply once
+# httpx has decoded it
+ENCODING_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
 
 
 def find_available_port() -> int:
@@ -6,3 +24,251 @@ def find_available_port() -> int:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(("127.0.0.1", 0))
         return s.getsockname()[1]
+
+
+@dataclass(frozen=True)
+class HTTPPoolConfig:
+    """
+    Connection pool settings for an HTTP client shared by many components.
+
+    Keepalive connections default to the full pool size so that a burst of
+    requests to the same upstream reuses its connections instead of
+    reconnecting. `host_limits` maps a host (e.g. "api.example.com" or
+    "*.example.com") to the maximum number of connections opened to it; each
+    listed host gets a pool of its own.
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 100
+    keepalive_expiry: float | None = 30.0
+    http2: bool = False
+    host_limits: dict[str, int] = field(default_factory=dict)
+    connect_timeout: float | None = 5.0
+    read_timeout: float | None = 30.0
+    write_timeout: float | None = 30.0
+    pool_timeout: float | None = 30.0
+
+    def __post_init__(self):
+        for host, limit in self.host_limits.items():
+            if limit < 1:
+                raise ValueError(f"Invalid connection limit for host {host!r}: {limit}")
+
+    def limits(self, max_connections: int | None = None) -> httpx.Limits:
+        """Returns the pool limits, optionally capped at `max_connections`."""
+        keepalive = self.max_keepalive_connections
+        if max_connections is None:
+            max_connections = self.max_connections
+        elif keepalive is not None:
+            keepalive = min(keepalive, max_connections)
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+@dataclass(frozen=True)
+class HTTPPoolStats:
+    """A snapshot of a PooledAsyncClient's request counters."""
+
+    requests: int
+    errors: int
+    in_flight: int
+    peak_in_flight: int
+    max_connections: int | None
+
+    @property
+    def utilization(self) -> float | None:
+        """The fraction of the pool's connections currently in use."""
+        if not self.max_connections:
+            return None
+        return min(self.in_flight / self.max_connections, 1.0)
+
+
+class _PoolMeter:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def start(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finish(self) -> None:
+        self.in_flight -= 1
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """A response stream that reports to its meter when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, meter: _PoolMeter):
+        self._stream = stream
+        self._meter = meter
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._meter.finish()
+        await self._stream.aclose()
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps a transport to count requests. A request counts as in flight until
+    its response body has been closed, since the connection is held until then.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, meter: _PoolMeter):
+        self._transport = transport
+        self._meter = meter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._meter.start()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._meter.errors += 1
+            self._meter.finish()
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_MeteredStream(response.stream, self._meter),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class PooledAsyncClient(httpx.AsyncClient):
+    """
+    An httpx AsyncClient configured from an HTTPPoolConfig, which keeps
+    request counters for its connection pool.
+
+    Example:
+        ```python
+        client = PooledAsyncClient(
+            HTTPPoolConfig(max_connections=50, http2=True),
+            base_url="https://api.example.com",
+        )
+        ...
+        print(client.pool_stats())
+        ```
+    """
+
+    def __init__(self, pool: HTTPPoolConfig | None = None, **kwargs: Any):
+        if pool is None:
+            pool = HTTPPoolConfig()
+        if "transport" in kwargs or "mounts" in kwargs:
+            raise ValueError(
+                "PooledAsyncClient builds its own transports; "
+                "use httpx.AsyncClient to provide custom ones"
+            )
+        self.pool = pool
+        self._meter = _PoolMeter()
+
+        transport_kwargs = {
+            key: kwargs[key] for key in ("verify", "cert", "trust_env") if key in kwargs
+        }
+
+        def make_transport(max_connections: int | None = None) -> _MeteredTransport:
+            transport = httpx.AsyncHTTPTransport(
+                limits=pool.limits(max_connections),
+                http2=pool.http2,
+                **transport_kwargs,
+            )
+            return _MeteredTransport(transport, self._meter)
+
+        kwargs.setdefault("timeout", pool.timeout())
+        super().__init__(
+            transport=make_transport(),
+            mounts={
+                f"all://{host}": make_transport(limit)
+                for host, limit in pool.host_limits.items()
+            },
+            **kwargs,
+        )
+
+    def pool_stats(self) -> HTTPPoolStats:
+        """Returns the client's request counts and pool utilization."""
+        return HTTPPoolStats(
+            requests=self._meter.requests,
+            errors=self._meter.errors,
+            in_flight=self._meter.in_flight,
+            peak_in_flight=self._meter.peak_in_flight,
+            max_connections=self.pool.max_connections,
+        )
+
+
+def _limited_response(
+    response: httpx.Response, content: bytes, max_size: int, truncated: bool
+) -> httpx.Response:
+    """Builds a read response from a response's decoded, possibly truncated, body."""
+    if truncated:
+        logger.warning(
+            f"Response from {response.request.method} {response.request.url} "
+            f"exceeded {max_size} bytes and was truncated"
+        )
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=[
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in ENCODING_HEADERS
+        ],
+        content=content,
+        request=response.request,
+        extensions={**response.extensions, "truncated": truncated},
+    )
+
+
+def truncate_response(response: httpx.Response, max_size: int) -> httpx.Response:
+    """Truncates the body of a read response to at most `max_size` bytes."""
+    if len(response.content) <= max_size:
+        return response
+    return _limited_response(
+        response, response.content[:max_size], max_size, truncated=True
+    )
+
+
+async def send_with_limit(
+    client: httpx.AsyncClient, request: httpx.Request, max_size: int
+) -> httpx.Response:
+    """
+    Sends a request, streaming its response body and keeping at most
+    `max_size` bytes of it. Larger bodies are truncated, and the rest is not
+    downloaded. The returned response has been read and closed.
+    """
+    response = await client.send(request, stream=True)
+    content = bytearray()
+    truncated = False
+    try:
+        async for chunk in response.aiter_bytes():
+            content += chunk
+            if len(content) > max_size:
+                del content[max_size:]
+                truncated = True
+                break
+    finally:
+        await response.aclose()
+
+    return _limited_response(response, bytes(content), max_size, truncated)
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import base64
+import datetime
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+import anyio.to_thread
+import httpx
+
+from fastmcp.utilities import json_backend
+from fastmcp.utilities.cache import DEFAULT_MAX_SIZE, TimedCache
+from fastmcp.utilities.http import ENCODING_HEADERS
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+# request headers that are set by the cache itself and so are not part of the
+# cache key
+_CONDITIONAL_HEADERS = frozenset({"if-none-match", "if-modified-since"})
+
+
+@dataclass(frozen=True)
+class HTTPCacheStats:
+    """A snapshot of an HTTPCache's counters."""
+
+    hits: int
+    revalidations: int
+    misses: int
+    size: int
+
+
+@dataclass
+class _CacheEntry:
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    # wall-clock times, since entries may be persisted across processes
+    stored_at: float
+    fresh_until: float
+
+    @property
+    def etag(self) -> str | None:
+        return self._header("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self._header("last-modified")
+
+    def _header(self, name: str) -> str | None:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["content"] = base64.b64encode(self.content).decode()
+        return json_backend.dumps(data)
+
+    @classmethod
+    def from_json(cls, text: str) -> _CacheEntry:
+        data = json_backend.loads(text)
+        data["content"] = base64.b64decode(data["content"])
+        data["headers"] = [tuple(h) for h in data["headers"]]
+        return cls(**data)
+
+
+def _parse_cache_control(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def request_key(request: httpx.Request) -> str:
+    """
+    Returns a key identifying a request by its method, URL, and headers, for
+    requests whose responses may be shared.
+    """
+    headers = sorted(
+        (name.lower(), value)
+        for name, value in request.headers.items()
+        if name.lower() not in _CONDITIONAL_HEADERS
+    )
+    return json.dumps([request.method, str(request.url), headers])
+
+
+class HTTPCache:
+    """
+    An HTTP cache for GET requests made by OpenAPI components.
+
+    Responses are cached according to their `Cache-Control` and `Expires`
+    headers. Once a response is stale, it is revalidated with a conditional
+    request if it had an `ETag` or `Last-Modified` header, and reused if the
+    server answers 304 Not Modified. Responses without freshness information
+    are considered fresh for `default_ttl` seconds.
+
+    Entries are kept in an in-memory LRU of up to `max_entries` responses for
+    at most `retention` seconds. If `directory` is set, entries are also
+    written there, so that they survive restarts and LRU eviction.
+
+    Cache keys include all request headers, so responses are never shared
+    between requests made with different credentials.
+
+    Example:
+        ```python
+        cache = HTTPCache(default_ttl=30)
+        route_maps = [
+            RouteMap(methods=["GET"], pattern=r"^/catalog/.*", mcp_type=MCPType.RESOURCE, cache=cache),
+        ]
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = DEFAULT_MAX_SIZE,
+        default_ttl: float = 0,
+        retention: float = 3600,
+        directory: str | Path | None = None,
+    ):
+        if retention <= 0:
+            raise ValueError(f"Invalid cache retention: {retention}")
+        self.default_ttl = default_ttl
+        self.retention = retention
+        self.directory = Path(directory) if directory is not None else None
+        self._entries = TimedCache(
+            expiration=datetime.timedelta(seconds=retention), max_size=max_entries
+        )
+
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def stats(self) -> HTTPCacheStats:
+        """Returns the cache's hit, revalidation and miss counts."""
+        return HTTPCacheStats(
+            hits=self.hits,
+            revalidations=self.revalidations,
+            misses=self.misses,
+            size=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        """Removes all entries from memory and from the cache directory."""
+        self._entries.clear()
+        if self.directory is not None and self.directory.exists():
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    async def send(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+    ) -> httpx.Response:
+        """Sends a GET request, answering it from the cache where possible."""
+        request = client.build_request(
+            "GET", url, params=params, headers=headers, timeout=timeout
+        )
+        return await self.send_request(client, request)
+
+    async def send_request(
+        self, client: httpx.AsyncClient, request: httpx.Request
+    ) -> httpx.Response:
+        """Sends a built GET request, answering it from the cache where possible."""
+        key = request_key(request)
+        entry = await self._get(key)
+        now = time.time()
+
+        if entry is not None and now < entry.fresh_until:
+            self.hits += 1
+            return entry.to_response(request)
+
+        if entry is not None and entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        elif entry is not None and entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = await client.send(request)
+
+        if entry is not None and response.status_code == 304:
+            self.revalidations += 1
+            # the 304 response carries the entry's new freshness information
+            fresh_until = self._fresh_until(response, now)
+            entry.fresh_until = fresh_until if fresh_until is not None else now
+            entry.stored_at = now
+            await self._set(key, entry)
+            return entry.to_response(request)
+
+        self.misses += 1
+        new_entry = self._make_entry(response, now)
+        if new_entry is not None:
+            await self._set(key, new_entry)
+        elif entry is not None:
+            await self._delete(key)
+        return response
+
+    def _fresh_until(self, response: httpx.Response, now: float) -> float | None:
+        """
+        Returns when a response stops being fresh, or None if it must not be
+        stored.
+        """
+        directives = _parse_cache_control(response.headers.get("cache-control", ""))
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return now
+
+        age = 0.0
+        try:
+            age = float(response.headers.get("age", 0))
+        except ValueError:
+            pass
+
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            try:
+                return now + float(max_age) - age
+            except ValueError:
+                return now
+
+        expires = response.headers.get("expires")
+        if expires is not None:
+            expires_at = _parse_http_date(expires)
+            if expires_at is None:
+                # invalid Expires values mean the response is already stale
+                return now
+            date = _parse_http_date(response.headers.get("date")) or now
+            return now + (expires_at - date)
+
+        return now + self.default_ttl
+
+    def _make_entry(self, response: httpx.Response, now: float) -> _CacheEntry | None:
+        if response.status_code != 200:
+            return None
+        fresh_until = self._fresh_until(response, now)
+        if fresh_until is None:
+            return None
+        has_validators = (
+            "etag" in response.headers or "last-modified" in response.headers
+        )
+        if fresh_until <= now and not has_validators:
+            # the entry could never be reused
+            return None
+
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in ENCODING_HEADERS
+        ]
+        if "date" not in response.headers:
+            headers.append(("date", formatdate(now, usegmt=True)))
+        return _CacheEntry(
+            status_code=response.status_code,
+            headers=headers,
+            content=response.content,
+            stored_at=now,
+            fresh_until=fresh_until,
+        )
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    async def _get(self, key: str) -> _CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not TimedCache.NOT_FOUND:
+            return entry
+        if self.directory is None:
+            return None
+
+        path = self._path(key)
+        try:
+            text = await anyio.to_thread.run_sync(path.read_text)
+            entry = _CacheEntry.from_json(text)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Discarding unreadable HTTP cache entry {path}: {e}")
+            await self._delete(key)
+            return None
+
+        if time.time() - entry.stored_at >= self.retention:
+            await self._delete(key)
+            return None
+        self._entries.set(key, entry)
+        return entry
+
+    async def _set(self, key: str, entry: _CacheEntry) -> None:
+        self._entries.set(key, entry)
+        if self.directory is None:
+            return
+
+        def write() -> None:
+            assert self.directory is not None
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._path(key).write_text(entry.to_json())
+
+        try:
+            await anyio.to_thread.run_sync(write)
+        except OSError as e:
+            logger.warning(f"Failed to write HTTP cache entry: {e}")
+
+    async def _delete(self, key: str) -> None:
+        self._entries.delete(key)
+        if self.directory is not None:
+            await anyio.to_thread.run_sync(
+                lambda: self._path(key).unlink(missing_ok=True)
+            )
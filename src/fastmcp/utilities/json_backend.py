@@ -0,0 +1,177 @@
+"""
+JSON encoding and decoding through the backend selected by the `json_backend`
+setting.
+
+All backends produce the same text for JSON-compatible data: compact unless an
+indent is given, with non-ASCII characters left unescaped. Values the backend
+cannot encode natively (e.g. Pydantic models) are converted with Pydantic, as
+`pydantic_core.to_json` would.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+
+import fastmcp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONBackend:
+    """Encodes and decodes JSON with the standard library."""
+
+    name = "stdlib"
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: int | None = None,
+        fallback: Callable[[Any], Any] | None = None,
+    ) -> str:
+        return json.dumps(
+            obj,
+            indent=indent,
+            separators=None if indent is not None else (",", ":"),
+            ensure_ascii=False,
+            default=_pydantic_default(fallback),
+        )
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+class PydanticCoreJSONBackend(JSONBackend):
+    """Encodes and decodes JSON with pydantic_core."""
+
+    name = "pydantic_core"
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: int | None = None,
+        fallback: Callable[[Any], Any] | None = None,
+    ) -> str:
+        return pydantic_core.to_json(obj, indent=indent, fallback=fallback).decode()
+
+    def loads(self, data: str | bytes) -> Any:
+        return pydantic_core.from_json(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    Encodes and decodes JSON with orjson, which only supports indenting by two
+    spaces; other indents are encoded with pydantic_core.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "The orjson JSON backend is not available. Please install the orjson package."
+            )
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: int | None = None,
+        fallback: Callable[[Any], Any] | None = None,
+    ) -> str:
+        assert orjson is not None
+        options = self._options
+        if indent == 2:
+            options |= orjson.OPT_INDENT_2
+        elif indent is not None:
+            return PYDANTIC_CORE_BACKEND.dumps(obj, indent=indent, fallback=fallback)
+        try:
+            return orjson.dumps(
+                obj, default=_pydantic_default(fallback), option=options
+            ).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects some values pydantic_core encodes, such as
+            # integers wider than 64 bits
+            return PYDANTIC_CORE_BACKEND.dumps(obj, indent=indent, fallback=fallback)
+
+    def loads(self, data: str | bytes) -> Any:
+        assert orjson is not None
+        return orjson.loads(data)
+
+
+def _pydantic_default(
+    fallback: Callable[[Any], Any] | None,
+) -> Callable[[Any], Any]:
+    """Returns a `default` hook converting values the way pydantic_core does."""
+
+    def default(value: Any) -> Any:
+        return pydantic_core.to_jsonable_python(value, fallback=fallback)
+
+    return default
+
+
+STDLIB_BACKEND = JSONBackend()
+PYDANTIC_CORE_BACKEND = PydanticCoreJSONBackend()
+_backends: dict[str, JSONBackend] = {
+    "stdlib": STDLIB_BACKEND,
+    "pydantic_core": PYDANTIC_CORE_BACKEND,
+}
+
+
+def get_json_backend(name: str | None = None) -> JSONBackend:
+    """
+    Returns a JSON backend by name, or the one selected by the `json_backend`
+    setting. "auto" selects orjson if it is installed, and pydantic_core
+    otherwise.
+    """
+    if name is None:
+        name = fastmcp.settings.json_backend
+    if name == "auto":
+        name = "orjson" if orjson is not None else "pydantic_core"
+
+    backend = _backends.get(name)
+    if backend is None:
+        if name != "orjson":
+            raise ValueError(f"Unknown JSON backend: {name!r}")
+        backend = _backends[name] = OrjsonBackend()
+    return backend
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: int | None = None,
+    fallback: Callable[[Any], Any] | None = None,
+) -> str:
+    """
+    Encodes a value as JSON with the configured backend.
+
+    Args:
+        obj: The value to encode
+        indent: The number of spaces to indent by, or None for compact JSON
+        fallback: Converts values that cannot otherwise be encoded; if None,
+            they raise an error
+
+    Raises:
+        TypeError or ValueError: If the value cannot be encoded
+    """
+    return get_json_backend().dumps(obj, indent=indent, fallback=fallback)
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Decodes JSON with the configured backend.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    return get_json_backend().loads(data)
@@ -196,6 +196,10 @@ class OpenAPIParser(
         self.response_cls = response_cls
         self.operation_cls = operation_cls
         self.path_item_cls = path_item_cls
+        # resolved references and the schemas extracted from them, by $ref;
+        # large specs refer to the same components from many operations
+        self._resolved_refs: dict[str, Any] = {}
+        self._extracted_schemas: dict[str, JsonSchema] = {}
 
     def _convert_to_parameter_location(self, param_in: str) -> ParameterLocation:
         """Convert string parameter location to our ParameterLocation type."""
@@ -208,6 +212,8 @@ class OpenAPIParser(
         """Resolves a reference to its target definition."""
         if isinstance(item, self.reference_cls):
             ref_str = item.ref
+            if ref_str in self._resolved_refs:
+                return self._resolved_refs[ref_str]
             try:
                 if not ref_str.startswith("#/"):
                     raise ValueError(
@@ -248,8 +254,9 @@ class OpenAPIParser(
 
                 # Handle nested references
                 if isinstance(target, self.reference_cls):
-                    return self._resolve_ref(target)
+                    target = self._resolve_ref(target)
 
+                self._resolved_refs[ref_str] = target
                 return target
             except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
                 raise ValueError(f"Failed to resolve reference '{ref_str}': {e}") from e
@@ -258,6 +265,11 @@ class OpenAPIParser(
 
     def _extract_schema_as_dict(self, schema_obj: Any) -> JsonSchema:
         """Resolves a schema and returns it as a dictionary."""
+        ref_str = schema_obj.ref if isinstance(schema_obj, self.reference_cls) else None
+        if ref_str is not None and ref_str in self._extracted_schemas:
+            # callers may add keys to the schema, so return a copy
+            return self._extracted_schemas[ref_str].copy()
+
         try:
             resolved_schema = self._resolve_ref(schema_obj)
 
@@ -274,7 +286,10 @@ class OpenAPIParser(
                 )
                 result = {}
 
-            return _replace_ref_with_defs(result)
+            result = _replace_ref_with_defs(result)
+            if ref_str is not None:
+                self._extracted_schemas[ref_str] = result.copy()
+            return result
         except ValueError as e:
             # Re-raise ValueError for external reference errors and other validation issues
             if "External or non-local reference not supported" in str(e):
@@ -610,9 +625,11 @@ class OpenAPIParser(
                             parameters=parameters,
                             request_body=request_body_info,
                             responses=responses,
-                            schema_definitions=schema_definitions,
                             extensions=extensions,
                         )
+                        # all routes share the same definitions, rather than
+                        # each getting a validated copy
+                        route.schema_definitions = schema_definitions
                         routes.append(route)
                         logger.info(
                             f"Successfully extracted route: {method_upper} {path_str}"
@@ -997,6 +1014,41 @@ def _replace_ref_with_defs(
     return schema
 
 
+def _collect_def_refs(node: Any, refs: set[str]) -> None:
+    """Adds the names of all definitions a schema refers to with #/$defs/ to refs."""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            refs.add(ref.split("/")[-1])
+        for value in node.values():
+            _collect_def_refs(value, refs)
+    elif isinstance(node, list):
+        for value in node:
+            _collect_def_refs(value, refs)
+
+
+def _referenced_definitions(
+    schema: JsonSchema, definitions: dict[str, JsonSchema]
+) -> dict[str, JsonSchema]:
+    """
+    Returns the definitions a schema refers to, directly or through other
+    definitions, in their original order.
+    """
+    found: set[str] = set()
+    pending: set[str] = set()
+    _collect_def_refs(schema, pending)
+    while pending:
+        name = pending.pop()
+        if name in found or name not in definitions:
+            continue
+        found.add(name)
+        _collect_def_refs(definitions[name], pending)
+
+    if len(found) == len(definitions):
+        return definitions
+    return {name: value for name, value in definitions.items() if name in found}
+
+
 def _combine_schemas(route: HTTPRoute) -> dict[str, Any]:
     """
     Combines parameter and request body schemas into a single schema.
@@ -1040,11 +1092,16 @@ def _combine_schemas(route: HTTPRoute) -> dict[str, Any]:
         "properties": properties,
         "required": required,
     }
-    # Add schema definitions if available
+    # Add only the schema definitions the route uses, since specs may define far
+    # more than any one route needs, and copying and pruning all of them for
+    # every route dominates the startup time of large specs
     if route.schema_definitions:
-        result["$defs"] = route.schema_definitions
+        definitions = _referenced_definitions(result, route.schema_definitions)
+        if definitions:
+            result["$defs"] = definitions
 
-    # Use compress_schema to remove unused definitions
-    result = compress_schema(result)
+    # Use compress_schema to copy the schema; unused definitions were already
+    # left out
+    result = compress_schema(result, prune_defs=False)
 
     return result
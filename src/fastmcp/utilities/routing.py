@@ -0,0 +1,60 @@
+"""Routing of prefixed component keys to mounted servers."""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class PrefixRouter(Generic[T]):
+    """
+    Dispatch table that maps keys of the form ``{prefix}{separator}{name}`` to
+    the targets registered for that prefix.
+
+    Targets registered without a prefix match every key. Lookups only inspect
+    the separator positions in the key, so their cost does not depend on the
+    number of registered targets.
+    """
+
+    def __init__(self, separator: str = "_"):
+        self.separator = separator
+        self._prefixed: dict[str, list[tuple[int, T]]] = {}
+        self._unprefixed: list[tuple[int, T]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, prefix: str | None, target: T) -> None:
+        """Register a target. Empty and None prefixes match every key."""
+        entry = (self._count, target)
+        self._count += 1
+        if prefix:
+            self._prefixed.setdefault(prefix, []).append(entry)
+        else:
+            self._unprefixed.append(entry)
+
+    def route(self, key: str) -> list[tuple[str, T]]:
+        """
+        Return ``(stripped_key, target)`` pairs for every target that may serve
+        ``key``, most recently registered first.
+        """
+        matches: list[tuple[int, str, T]] = [
+            (order, key, target) for order, target in self._unprefixed
+        ]
+
+        if self._prefixed:
+            separator = self.separator
+            start = 0
+            while (index := key.find(separator, start)) != -1:
+                if entries := self._prefixed.get(key[:index]):
+                    stripped = key[index + len(separator) :]
+                    matches.extend(
+                        (order, stripped, target) for order, target in entries
+                    )
+                start = index + 1
+
+        if len(matches) > 1:
+            matches.sort(key=lambda match: match[0], reverse=True)
+        return [(stripped, target) for _, stripped, target in matches]
@@ -472,6 +472,39 @@ async def test_client_nested_context_manager(fastmcp_server):
     assert client._session is None
 
 
+async def test_new_client_has_separate_session(fastmcp_server):
+    """Test that a client created with new() opens its own session."""
+
+    client = Client(fastmcp_server, timeout=5)
+    new_client = client.new()
+
+    assert new_client.transport is client.transport
+    assert new_client._session_kwargs == client._session_kwargs
+
+    async with client:
+        assert not new_client.is_connected()
+
+        async with new_client:
+            assert new_client._session is not client._session
+            tools = await new_client.list_tools()
+            assert len(tools) == len(await client.list_tools())
+
+        assert client.is_connected()
+        assert not new_client.is_connected()
+
+
+def test_new_client_has_own_stdio_transport():
+    """Test that new() copies transports that hold a connection."""
+    client = Client(StdioTransport(command="python", args=["server.py"]))
+    new_client = client.new()
+
+    assert new_client.transport is not client.transport
+    assert isinstance(new_client.transport, StdioTransport)
+    assert new_client.transport.args == ["server.py"]
+    assert new_client.transport._connect_task is None
+    assert new_client.transport._stop_event is not client.transport._stop_event
+
+
 async def test_concurrent_client_context_managers():
     """
     Test that concurrent client usage doesn't cause cross-task cancel scope issues.
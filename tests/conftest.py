@@ -0,0 +1,11 @@
+import pytest
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    # benchmarks are slow, so they only run when selected with `-m benchmark`
+    if "benchmark" in (config.option.markexpr or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmark; select with `-m benchmark` to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -1,5 +1,6 @@
 from typing import Any
 
+import anyio
 import pytest
 from mcp.types import TextContent
 
@@ -9,6 +10,7 @@ from fastmcp.contrib.bulk_tool_caller.bulk_tool_caller import (
     CallToolRequest,
     CallToolRequestResult,
 )
+from fastmcp.server.middleware import Middleware
 from fastmcp.tools.tool import Tool
 
 
@@ -214,3 +216,174 @@ async def test_call_tools_bulk_error_continues(bulk_caller_live: BulkToolCaller)
 
     success_result = results[1]
     assert success_result == expected_success_result
+
+
+class TestConcurrentCalls:
+    @pytest.fixture
+    def concurrency(self) -> dict[str, int]:
+        return {"running": 0, "max_running": 0}
+
+    @pytest.fixture
+    def server(self, concurrency: dict[str, int]) -> FastMCP:
+        server = FastMCP()
+        server.add_tool(Tool.from_function(echo_tool))
+        server.add_tool(Tool.from_function(error_tool))
+
+        @server.tool
+        async def slow_tool(arg1: str, delay: float) -> str:
+            concurrency["running"] += 1
+            concurrency["max_running"] = max(
+                concurrency["max_running"], concurrency["running"]
+            )
+            await anyio.sleep(delay)
+            concurrency["running"] -= 1
+            return arg1
+
+        return server
+
+    def bulk_caller(self, server: FastMCP, max_concurrency: int) -> BulkToolCaller:
+        bulk_tool_caller = BulkToolCaller(max_concurrency=max_concurrency)
+        bulk_tool_caller.register_tools(server)
+        return bulk_tool_caller
+
+    async def test_runs_calls_concurrently_in_order(
+        self, server: FastMCP, concurrency: dict[str, int]
+    ):
+        bulk_caller = self.bulk_caller(server, max_concurrency=3)
+        tool_arguments = [
+            {"arg1": f"value{i}", "delay": 0.05 * (5 - i)} for i in range(5)
+        ]
+
+        results = await bulk_caller.call_tool_bulk("slow_tool", tool_arguments)  # type: ignore[arg-type]
+
+        assert [result.arguments for result in results] == tool_arguments
+        assert [result.content[0].text for result in results] == [  # type: ignore[attr-defined]
+            f"value{i}" for i in range(5)
+        ]
+        assert concurrency["max_running"] == 3
+
+    async def test_sequential_by_default(
+        self, server: FastMCP, concurrency: dict[str, int]
+    ):
+        bulk_caller = BulkToolCaller()
+        bulk_caller.register_tools(server)
+        tool_arguments = [{"arg1": f"value{i}", "delay": 0.01} for i in range(3)]
+
+        results = await bulk_caller.call_tool_bulk("slow_tool", tool_arguments)  # type: ignore[arg-type]
+
+        assert len(results) == 3
+        assert concurrency["max_running"] == 1
+
+    async def test_error_continues(self, server: FastMCP):
+        bulk_caller = self.bulk_caller(server, max_concurrency=2)
+        tool_calls = [
+            CallToolRequest(tool=ERROR_TOOL_NAME, arguments={"arg1": "error_value"}),
+            CallToolRequest(tool=ECHO_TOOL_NAME, arguments={"arg1": "success_value"}),
+        ]
+
+        results = await bulk_caller.call_tools_bulk(tool_calls, continue_on_error=True)
+
+        assert results == [
+            error_tool_result_factory(arg1="error_value"),
+            echo_tool_result_factory(arg1="success_value"),
+        ]
+
+    async def test_error_stops(self, server: FastMCP):
+        bulk_caller = self.bulk_caller(server, max_concurrency=2)
+        tool_calls = [
+            CallToolRequest(
+                tool="slow_tool", arguments={"arg1": "first", "delay": 0.05}
+            ),
+            CallToolRequest(tool=ERROR_TOOL_NAME, arguments={"arg1": "error_value"}),
+            CallToolRequest(
+                tool="slow_tool", arguments={"arg1": "cancelled", "delay": 5}
+            ),
+            CallToolRequest(tool=ECHO_TOOL_NAME, arguments={"arg1": "skipped"}),
+        ]
+
+        with anyio.fail_after(2):
+            results = await bulk_caller.call_tools_bulk(
+                tool_calls, continue_on_error=False
+            )
+
+        assert [result.tool for result in results] == ["slow_tool", ERROR_TOOL_NAME]
+        assert results[1] == error_tool_result_factory(arg1="error_value")
+
+    @pytest.mark.parametrize("max_concurrency", [1, 2])
+    async def test_raised_errors_are_not_wrapped(
+        self, server: FastMCP, max_concurrency: int, monkeypatch: pytest.MonkeyPatch
+    ):
+        bulk_caller = self.bulk_caller(server, max_concurrency=max_concurrency)
+
+        async def call_tool(client, tool, arguments):
+            raise ConnectionError(f"lost call {arguments['arg1']}")
+
+        monkeypatch.setattr(bulk_caller, "_call_tool", call_tool)
+        tool_calls = [
+            CallToolRequest(tool=ECHO_TOOL_NAME, arguments={"arg1": "a"}),
+            CallToolRequest(tool=ECHO_TOOL_NAME, arguments={"arg1": "b"}),
+        ]
+
+        with pytest.raises(ConnectionError, match="lost call a"):
+            await bulk_caller.call_tools_bulk(tool_calls)
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="Invalid max_concurrency"):
+            BulkToolCaller(max_concurrency=0)
+
+
+class TestDirectCalls:
+    @pytest.fixture
+    def bulk_caller_direct(self, live_server_with_tool: FastMCP) -> BulkToolCaller:
+        bulk_tool_caller = BulkToolCaller(direct=True)
+        bulk_tool_caller.register_tools(live_server_with_tool)
+        return bulk_tool_caller
+
+    async def test_results_match_client_calls(
+        self, bulk_caller_direct: BulkToolCaller, bulk_caller_live: BulkToolCaller
+    ):
+        tool_calls = [
+            CallToolRequest(tool=ECHO_TOOL_NAME, arguments={"arg1": "echo_value"}),
+            CallToolRequest(tool=ERROR_TOOL_NAME, arguments={"arg1": "error_value"}),
+            CallToolRequest(tool=NO_RETURN_TOOL_NAME, arguments={"arg1": "value"}),
+            CallToolRequest(tool="missing_tool", arguments={}),
+        ]
+
+        results = await bulk_caller_direct.call_tools_bulk(tool_calls)
+
+        assert results == await bulk_caller_live.call_tools_bulk(tool_calls)
+        assert results[:3] == [
+            echo_tool_result_factory(arg1="echo_value"),
+            error_tool_result_factory(arg1="error_value"),
+            no_return_tool_result_factory(arg1="value"),
+        ]
+        assert results[3].isError
+
+    async def test_error_stops(self, bulk_caller_direct: BulkToolCaller):
+        tool_arguments = [{"arg1": "error_value"}, {"arg1": "value2"}]
+
+        results = await bulk_caller_direct.call_tool_bulk(
+            ERROR_TOOL_NAME, tool_arguments, continue_on_error=False
+        )
+
+        assert results == [error_tool_result_factory(arg1="error_value")]
+
+    async def test_applies_middleware(self):
+        server = FastMCP()
+        server.add_tool(Tool.from_function(echo_tool))
+        called: list[str] = []
+
+        class RecordingMiddleware(Middleware):
+            async def on_call_tool(self, context, call_next):
+                called.append(context.message.name)
+                return await call_next(context)
+
+        server.add_middleware(RecordingMiddleware())
+        bulk_tool_caller = BulkToolCaller(direct=True)
+        bulk_tool_caller.register_tools(server)
+
+        await bulk_tool_caller.call_tool_bulk(
+            ECHO_TOOL_NAME, [{"arg1": "value1"}, {"arg1": "value2"}]
+        )
+
+        assert called == [ECHO_TOOL_NAME, ECHO_TOOL_NAME]
@@ -301,6 +301,26 @@ class TestResourceManager:
         content = await resource.read()
         assert content == "Hello, world!"
 
+    async def test_get_resource_from_template_added_later(self):
+        """Test that templates added after a lookup are matched."""
+        manager = ResourceManager()
+
+        with pytest.raises(NotFoundError):
+            await manager.get_resource(AnyUrl("greet://world"))
+
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        manager.add_template(
+            ResourceTemplate.from_function(
+                fn=greet, uri_template="greet://{name}", name="greeter"
+            )
+        )
+
+        resource = await manager.get_resource(AnyUrl("greet://world"))
+        assert await resource.read() == "Hello, world!"
+        assert await manager.read_resource("greet://again") == "Hello, again!"
+
     async def test_get_unknown_resource(self):
         """Test getting a non-existent resource."""
         manager = ResourceManager()
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from fastmcp import Context
 from fastmcp.resources import ResourceTemplate
 from fastmcp.resources.resource import FunctionResource
-from fastmcp.resources.template import match_uri_template
+from fastmcp.resources.template import TemplateMatcher, match_uri_template
 
 
 class TestResourceTemplate:
@@ -601,6 +601,75 @@ class TestMatchUriTemplate:
         assert result == expected_params
 
 
+class TestTemplateMatcher:
+    """Test matching URIs against many templates at once."""
+
+    def test_no_templates(self):
+        matcher = TemplateMatcher([])
+        assert matcher.match("test://a") is None
+
+    def test_returns_template_and_params(self):
+        matcher = TemplateMatcher(["test://a/{x}/b", "other://{y}"])
+        assert matcher.match("test://a/1/b") == ("test://a/{x}/b", {"x": "1"})
+        assert matcher.match("other://2") == ("other://{y}", {"y": "2"})
+        assert matcher.match("test://a/1/c") is None
+        assert matcher.match("missing://1") is None
+
+    def test_first_matching_template_wins(self):
+        matcher = TemplateMatcher(["test://{x*}", "test://{a}/{b}"])
+        assert matcher.match("test://1/2") == ("test://{x*}", {"x": "1/2"})
+
+        matcher = TemplateMatcher(["test://{a}/{b}", "test://{x*}"])
+        assert matcher.match("test://1/2") == ("test://{a}/{b}", {"a": "1", "b": "2"})
+
+    def test_parameterized_scheme(self):
+        matcher = TemplateMatcher(["test://{x}", "{scheme}://fixed/{y}"])
+        assert matcher.match("other://fixed/1") == (
+            "{scheme}://fixed/{y}",
+            {"scheme": "other", "y": "1"},
+        )
+        assert matcher.match("test://fixed") == ("test://{x}", {"x": "fixed"})
+
+    def test_same_param_names_across_templates(self):
+        matcher = TemplateMatcher(["a://{id}", "b://{id}/{name}"])
+        assert matcher.match("b://1/x") == ("b://{id}/{name}", {"id": "1", "name": "x"})
+
+    def test_quoted_params(self):
+        matcher = TemplateMatcher(["test://{x}"])
+        assert matcher.match(f"test://{quote('a b', safe='')}") == (
+            "test://{x}",
+            {"x": "a b"},
+        )
+
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "test://a/b",
+            "test://a/x/b",
+            "test://a/x/y/b",
+            "resource://prefix_foo_suffix",
+            "resource://prefix__suffix",
+            "file://x/y/z.txt",
+        ],
+    )
+    def test_agrees_with_match_uri_template(self, uri: str):
+        templates = [
+            "test://a/{x}/b",
+            "test://a/{x*}/b",
+            "resource://prefix_{x}_suffix",
+            "file://{path*}.txt",
+        ]
+        expected = next(
+            (
+                (template, params)
+                for template in templates
+                if (params := match_uri_template(uri, template))
+            ),
+            None,
+        )
+        assert TemplateMatcher(templates).match(uri) == expected
+
+
 class TestContextHandling:
     """Test context handling in resource templates."""
 
@@ -76,7 +76,7 @@ class TestLoggingMiddleware:
         assert "source=client" in formatted
         assert "type=request" in formatted
         assert "method=test_method" in formatted
-        assert 'payload={"param": "value"}' in formatted
+        assert 'payload={"param":"value"}' in formatted
 
     def test_format_message_long_payload(self, mock_context):
         """Test message formatting with long payload truncation."""
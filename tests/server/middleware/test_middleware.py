@@ -5,6 +5,7 @@ from typing import Any
 import mcp.types
 import pytest
 
+import fastmcp.server.server
 from fastmcp import Client, FastMCP
 from fastmcp.server.context import Context
 from fastmcp.server.middleware import Middleware, MiddlewareContext
@@ -582,3 +583,122 @@ class TestProxyServer:
         assert recording_middleware.assert_called(hook="on_request", at_least=2)
         assert recording_middleware.assert_called(hook="on_call_tool", at_least=1)
         assert recording_middleware.assert_called(hook="on_list_tools", at_least=1)
+
+
+class ToolCallCounter(Middleware):
+    def __init__(self):
+        self.calls = 0
+
+    async def on_call_tool(self, context, call_next):
+        self.calls += 1
+        return await call_next(context)
+
+
+class TestMiddlewarePipeline:
+    """Tests for compiling middleware chains once per kind of message."""
+
+    @pytest.fixture
+    def server(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        return mcp
+
+    def test_hooks_that_are_not_overridden_are_skipped(self):
+        middleware = ToolCallCounter()
+        assert middleware._get_hooks("tools/call", "request") == [
+            middleware.on_call_tool
+        ]
+        assert middleware._get_hooks("tools/list", "request") == []
+        assert Middleware()._get_hooks("tools/call", "request") == []
+
+    async def test_chain_is_compiled_once(self, server, monkeypatch):
+        compiled = []
+        original = fastmcp.server.server.compile_middleware
+
+        def counting_compile_middleware(middleware, method, message_type, call_next):
+            compiled.append(method)
+            return original(middleware, method, message_type, call_next)
+
+        monkeypatch.setattr(
+            fastmcp.server.server, "compile_middleware", counting_compile_middleware
+        )
+        counter = ToolCallCounter()
+        server.add_middleware(counter)
+
+        async with Client(server) as client:
+            for _ in range(3):
+                await client.call_tool("add", {"a": 1, "b": 2})
+
+        assert compiled.count("tools/call") == 1
+        assert counter.calls == 3
+
+    async def test_chain_is_recompiled_when_middleware_changes(self, server):
+        first = ToolCallCounter()
+        second = ToolCallCounter()
+        server.add_middleware(first)
+
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+            server.add_middleware(second)
+            await client.call_tool("add", {"a": 1, "b": 2})
+            server.middleware.remove(first)
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        assert (first.calls, second.calls) == (2, 2)
+
+    async def test_middleware_overriding_call_is_called(self, server):
+        calls = []
+
+        class CallMiddleware(Middleware):
+            async def __call__(self, context, call_next):
+                calls.append(context.method)
+                return await call_next(context)
+
+        server.add_middleware(CallMiddleware())
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        assert "tools/call" in calls
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("count", [0, 1, 3, 6])
+    @pytest.mark.parametrize("pipeline", ["compiled", "per_call"])
+    async def test_call_tool_overhead_benchmark(self, server, count, pipeline):
+        """
+        Runs tool calls through compiled chains, or by building the chain and
+        dispatching each middleware's hooks for every call, as it used to be
+        done. Run with `--durations` to compare them.
+        """
+        from functools import partial
+
+        async def dispatch_per_call(middleware, context, call_next):
+            handler = partial(middleware.on_call_tool, call_next=call_next)
+            handler = partial(middleware.on_request, call_next=handler)
+            handler = partial(middleware.on_message, call_next=handler)
+            return await handler(context)
+
+        for _ in range(count):
+            server.add_middleware(ToolCallCounter())
+        calls = 2000
+        context = MiddlewareContext(
+            message=mcp.types.CallToolRequestParams(
+                name="add", arguments={"a": 1, "b": 2}
+            ),
+            method="tools/call",
+        )
+
+        async with Context(fastmcp=server):
+            for _ in range(calls):
+                if pipeline == "compiled":
+                    await server._apply_middleware(context, server._call_tool_handler)
+                else:
+                    chain = server._call_tool_handler
+                    for mw in reversed(server.middleware):
+                        chain = partial(dispatch_per_call, mw, call_next=chain)
+                    await chain(context)
+
+        assert all(mw.calls == calls for mw in server.middleware)
@@ -1,8 +1,11 @@
 """Tests for rate limiting middleware."""
 
 import asyncio
+import time
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import mcp.types
 import pytest
 
 from fastmcp import FastMCP
@@ -10,8 +13,11 @@ from fastmcp.client import Client
 from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware.middleware import MiddlewareContext
 from fastmcp.server.middleware.rate_limiting import (
+    MemoryRateLimitStorage,
     RateLimitError,
+    RateLimiterStore,
     RateLimitingMiddleware,
+    RedisRateLimitStorage,
     SlidingWindowRateLimiter,
     SlidingWindowRateLimitingMiddleware,
     TokenBucketRateLimiter,
@@ -74,6 +80,75 @@ class TestTokenBucketRateLimiter:
         await asyncio.sleep(0.2)
         assert await limiter.consume(2) is True
 
+    def test_try_consume_at_time(self):
+        """Test consuming tokens at given times."""
+        limiter = TokenBucketRateLimiter(capacity=2, refill_rate=1.0)
+        now = limiter.last_refill
+
+        assert limiter.try_consume(2, now) is True
+        assert limiter.try_consume(1, now + 0.5) is False
+        assert limiter.try_consume(1, now + 1.0) is True
+
+        # times before the last refill do not remove tokens
+        assert limiter.try_consume(1, now) is False
+        assert limiter.tokens == 0
+
+    def test_is_idle(self):
+        """Test that a bucket is idle once it has refilled."""
+        limiter = TokenBucketRateLimiter(capacity=2, refill_rate=1.0)
+        now = limiter.last_refill
+        assert limiter.is_idle(now)
+
+        limiter.try_consume(1, now)
+        assert not limiter.is_idle(now + 0.5)
+        assert limiter.is_idle(now + 1.0)
+
+
+class TestRateLimiterStore:
+    """Test the store of rate limiters by client ID."""
+
+    def make_store(self, max_size: int = 100) -> RateLimiterStore:
+        return RateLimiterStore(
+            lambda: TokenBucketRateLimiter(capacity=2, refill_rate=1.0),
+            max_size=max_size,
+        )
+
+    def test_limiters_are_created_once(self):
+        """Test that each client gets a limiter of its own."""
+        store = self.make_store()
+        a = store.get("a")
+        a.try_consume(1)
+        assert store.get("a") is a
+        assert store.get("b") is not a
+        assert len(store) == 2
+
+    def test_idle_limiters_are_evicted(self):
+        """Test that limiters which have refilled are evicted."""
+        store = self.make_store()
+        now = time.monotonic()
+        store.get("a", now).try_consume(1, now)
+        store.get("b", now).try_consume(1, now)
+
+        store.get("c", now + 0.5)
+        assert set(store._limiters) == {"a", "b", "c"}
+
+        store.get("c", now + 1.5)
+        assert set(store._limiters) == {"c"}
+
+    def test_least_recently_used_limiter_is_evicted(self):
+        """Test that the store holds at most max_size limiters."""
+        store = self.make_store(max_size=2)
+        now = time.monotonic()
+        for client_id in ["a", "b", "a", "c"]:
+            store.get(client_id, now).try_consume(1, now)
+
+        assert set(store._limiters) == {"a", "c"}
+
+    def test_invalid_max_size(self):
+        """Test that the store must hold at least one limiter."""
+        with pytest.raises(ValueError, match="max_size"):
+            self.make_store(max_size=0)
+
 
 class TestSlidingWindowRateLimiter:
     """Test sliding window rate limiter."""
@@ -83,7 +158,7 @@ class TestSlidingWindowRateLimiter:
         limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=60)
         assert limiter.max_requests == 10
         assert limiter.window_seconds == 60
-        assert len(limiter.requests) == 0
+        assert limiter.current_count == limiter.previous_count == 0
 
     async def test_is_allowed_success(self):
         """Test allowing requests within limit."""
@@ -108,17 +183,188 @@ class TestSlidingWindowRateLimiter:
     async def test_sliding_window(self):
         """Test sliding window behavior."""
         limiter = SlidingWindowRateLimiter(max_requests=2, window_seconds=1)
+        start = float(limiter.window)
 
         # Use up requests
-        assert await limiter.is_allowed() is True
-        assert await limiter.is_allowed() is True
-        assert await limiter.is_allowed() is False
+        assert limiter.try_acquire(now=start + 0.1) is True
+        assert limiter.try_acquire(now=start + 0.2) is True
+        assert limiter.try_acquire(now=start + 0.3) is False
+
+        # Halfway through the next window, half of the previous window's
+        # requests still count
+        assert limiter.count(start + 1.5) == 1
+        assert limiter.try_acquire(now=start + 1.5) is True
+        assert limiter.try_acquire(now=start + 1.6) is False
 
-        # Wait for window to pass
-        await asyncio.sleep(1.1)
+        # Wait for the windows to pass
+        assert limiter.is_idle(start + 3.0)
 
         # Should be able to make requests again
-        assert await limiter.is_allowed() is True
+        assert limiter.try_acquire(now=start + 3.0) is True
+        assert limiter.try_acquire(now=start + 3.0) is True
+
+    def test_memory_is_constant(self):
+        """Test that requests are counted rather than stored."""
+        limiter = SlidingWindowRateLimiter(max_requests=10_000, window_seconds=60)
+        size = len(vars(limiter))
+        for _ in range(10_000):
+            assert limiter.try_acquire()
+        assert limiter.try_acquire() is False
+        assert len(vars(limiter)) == size
+
+
+class FakeRedis:
+    """A Redis client stand-in keeping integer keys in a dict."""
+
+    def __init__(self):
+        self.data: dict[str, int] = {}
+        self.expirations: dict[str, int] = {}
+        self.transactions = 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        assert transaction
+        return FakePipeline(self)
+
+    def set(
+        self, key: str, value: int, nx: bool = False, ex: int | None = None
+    ) -> bool | None:
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        if ex is not None:
+            self.expirations[key] = ex
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        value = self.data.get(key)
+        return None if value is None else str(value).encode()
+
+    def incrby(self, key: str, amount: int) -> int:
+        self.data[key] = self.data.get(key, 0) + amount
+        return self.data[key]
+
+    async def decrby(self, key: str, amount: int) -> int:
+        return self.incrby(key, -amount)
+
+
+class FakePipeline:
+    """Queues commands and runs them together when executed."""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.commands = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs) -> "FakePipeline":
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self.redis.transactions += 1
+        return [
+            getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class TestRateLimitStorage:
+    """Test the storages of sliding window rate limits."""
+
+    async def test_memory_storage(self):
+        """Test that each key and limit is counted separately."""
+        storage = MemoryRateLimitStorage()
+
+        assert await storage.acquire("a", max_requests=2, window_seconds=60)
+        assert await storage.acquire("a", max_requests=2, window_seconds=60)
+        assert not await storage.acquire("a", max_requests=2, window_seconds=60)
+        assert await storage.acquire("b", max_requests=2, window_seconds=60)
+        assert await storage.acquire("a", max_requests=3, window_seconds=60)
+
+    async def test_redis_storage(self):
+        """Test that rejected requests are not counted, and windows expire."""
+        redis = FakeRedis()
+        storage = RedisRateLimitStorage(redis, prefix="test", clock=lambda: 6030.0)
+
+        assert await storage.acquire("a", max_requests=2, window_seconds=60)
+        assert await storage.acquire("a", max_requests=2, window_seconds=60, cost=1)
+        assert not await storage.acquire("a", max_requests=2, window_seconds=60)
+
+        assert redis.data == {"test:a:100": 2}
+        assert redis.expirations == {"test:a:100": 120}
+        # each request is counted in a single transaction
+        assert redis.transactions == 3
+
+    @pytest.mark.parametrize(
+        "storage",
+        [MemoryRateLimitStorage(), RedisRateLimitStorage(FakeRedis())],
+        ids=["memory", "redis"],
+    )
+    async def test_cost_above_limit_is_never_allowed(self, storage):
+        """Test that a request costing more than the limit is rejected."""
+        assert not await storage.acquire("a", max_requests=2, window_seconds=60, cost=3)
+        assert await storage.acquire("a", max_requests=2, window_seconds=60, cost=2)
+
+    async def test_redis_storage_counts_previous_window(self):
+        """Test that the previous window's requests are weighted."""
+        now = 10 * 3600.0
+        redis = FakeRedis()
+        storage = RedisRateLimitStorage(redis, prefix="test", clock=lambda: now)
+        redis.data["test:a:9"] = 10
+
+        # at the start of the window, the previous one's requests fill it
+        assert not await storage.acquire("a", 10, 3600)
+        # halfway through, half of them count
+        now += 1800
+        for _ in range(5):
+            assert await storage.acquire("a", 10, 3600)
+        assert not await storage.acquire("a", 10, 3600)
+
+    async def test_shared_storage_limits_processes_together(
+        self, mock_context, mock_call_next
+    ):
+        """Test that middleware sharing a storage shares its limits."""
+        storage = RedisRateLimitStorage(FakeRedis())
+        first = SlidingWindowRateLimitingMiddleware(max_requests=3, storage=storage)
+        second = SlidingWindowRateLimitingMiddleware(max_requests=3, storage=storage)
+
+        await first.on_request(mock_context, mock_call_next)
+        await second.on_request(mock_context, mock_call_next)
+        await first.on_request(mock_context, mock_call_next)
+        with pytest.raises(RateLimitError):
+            await second.on_request(mock_context, mock_call_next)
+
+    @pytest.mark.benchmark
+    @pytest.mark.timeout(60)
+    def test_memory_benchmark(self):
+        """
+        Compares the memory used to limit 1,000 clients to 1,000 requests per
+        minute with storing a timestamp per request, as the limiter used to.
+        """
+        import tracemalloc
+        from collections import deque
+
+        tracemalloc.start()
+        limiters = [SlidingWindowRateLimiter(1000, 60) for _ in range(1000)]
+        for limiter in limiters:
+            assert limiter.try_acquire(cost=1000, now=limiter.window * 60.0)
+        counters = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        timestamps = [deque(time.time() for _ in range(1000)) for _ in range(1000)]
+        stored = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert len(timestamps) == len(limiters)
+        assert counters < stored / 10
 
 
 class TestRateLimitingMiddleware:
@@ -198,6 +444,81 @@ class TestRateLimitingMiddleware:
         with pytest.raises(RateLimitError, match="Global rate limit exceeded"):
             await middleware.on_request(mock_context, mock_call_next)
 
+    async def test_request_costs(self, mock_call_next):
+        """Test that methods and tools can consume more or fewer tokens."""
+        middleware = RateLimitingMiddleware(
+            max_requests_per_second=1.0,
+            burst_capacity=4,
+            method_costs={"tools/list": 0.5, "tools/call": 2},
+            tool_costs={"expensive": 4},
+        )
+
+        def make_context(method: str, tool: str | None = None) -> MiddlewareContext:
+            message = mcp.types.CallToolRequestParams(name=tool or "", arguments={})
+            return MiddlewareContext(message=message, method=method)
+
+        assert middleware._get_cost(make_context("tools/list")) == 0.5
+        assert middleware._get_cost(make_context("tools/call", "cheap")) == 2
+        assert middleware._get_cost(make_context("tools/call", "expensive")) == 4
+        assert middleware._get_cost(make_context("prompts/list")) == 1
+        # messages without a method or a tool name cost one token
+        assert middleware._get_cost(MiddlewareContext(message={})) == 1
+        assert (
+            middleware._get_cost(MiddlewareContext(message={}, method="tools/call"))
+            == 2
+        )
+
+        await middleware.on_request(make_context("tools/call", "cheap"), mock_call_next)
+        await middleware.on_request(make_context("tools/list"), mock_call_next)
+        with pytest.raises(RateLimitError):
+            await middleware.on_request(
+                make_context("tools/call", "cheap"), mock_call_next
+            )
+
+    @pytest.mark.parametrize(
+        "costs",
+        [{"method_costs": {"tools/list": 5}}, {"tool_costs": {"expensive": 4.5}}],
+    )
+    def test_costs_above_burst_capacity_are_rejected(self, costs):
+        """Test that requests that could never be allowed are rejected upfront."""
+        with pytest.raises(ValueError, match="exceeds the burst capacity"):
+            RateLimitingMiddleware(burst_capacity=4, **costs)
+
+    async def test_many_clients_are_bounded(self, mock_context, mock_call_next):
+        """Test that the limiters of many clients are not all kept."""
+        client_ids = iter(range(1000))
+        middleware = RateLimitingMiddleware(
+            get_client_id=lambda ctx: str(next(client_ids)), max_clients=100
+        )
+
+        for _ in range(1000):
+            await middleware.on_request(mock_context, mock_call_next)
+        assert len(middleware.limiters) == 100
+
+    @pytest.mark.benchmark
+    @pytest.mark.timeout(60)
+    async def test_many_clients_benchmark(self):
+        """
+        Limits 50,000 clients with the default maximum of limiters kept; run
+        with `--durations` to measure the per-request overhead.
+        """
+        client_ids = [f"client-{i}" for i in range(50_000)]
+        current = iter(client_ids * 4)
+        middleware = RateLimitingMiddleware(
+            max_requests_per_second=1000.0,
+            get_client_id=lambda ctx: next(current),
+        )
+        context = MiddlewareContext(message={}, method="tools/call")
+
+        async def call_next(context):
+            return None
+
+        for _ in range(len(client_ids) * 4):
+            await middleware.on_request(context, call_next)
+
+        assert len(middleware.limiters) <= 10_000
+        assert client_ids[-1] in middleware.limiters
+
 
 class TestSlidingWindowRateLimitingMiddleware:
     """Test sliding window rate limiting middleware."""
@@ -242,6 +563,20 @@ class TestSlidingWindowRateLimitingMiddleware:
         with pytest.raises(RateLimitError, match="Rate limit exceeded"):
             await middleware.on_request(mock_context, mock_call_next)
 
+    async def test_limiters(self, mock_context, mock_call_next):
+        """Test that in-memory limiters are available by client ID."""
+        middleware = SlidingWindowRateLimitingMiddleware(max_requests=5)
+        await middleware.on_request(mock_context, mock_call_next)
+
+        assert len(middleware.limiters) == 1
+        assert middleware.limiters["global"].current_count == 1
+
+        middleware = SlidingWindowRateLimitingMiddleware(
+            max_requests=5, storage=RedisRateLimitStorage(FakeRedis())
+        )
+        with pytest.raises(AttributeError, match="RedisRateLimitStorage"):
+            middleware.limiters
+
 
 class TestRateLimitError:
     """Test rate limit error."""
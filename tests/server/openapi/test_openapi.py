@@ -1,18 +1,23 @@
 import base64
+import datetime
 import json
 import re
 from enum import Enum
 
+import anyio
 import httpx
 import pytest
 from dirty_equals import IsStr
 from fastapi import FastAPI, HTTPException, Response
 from fastapi.responses import PlainTextResponse
 from httpx import ASGITransport, AsyncClient
+from mcp import McpError
 from mcp.types import BlobResourceContents
 from pydantic import BaseModel, TypeAdapter
 from pydantic.networks import AnyUrl
+from pytest_httpx import HTTPXMock
 
+import fastmcp
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.exceptions import ToolError
@@ -21,9 +26,17 @@ from fastmcp.server.openapi import (
     MCPType,
     OpenAPIResource,
     OpenAPIResourceTemplate,
+    OpenAPIRouteChanges,
+    OpenAPISnapshot,
     OpenAPITool,
+    RequestCoalescer,
     RouteMap,
+    RouteMapIndex,
 )
+from fastmcp.utilities.http import HTTPPoolConfig, PooledAsyncClient
+from fastmcp.utilities.http_cache import HTTPCache
+from fastmcp.utilities.openapi import HTTPRoute
+from fastmcp.utilities.tests import temporary_settings
 
 
 class User(BaseModel):
@@ -201,6 +214,643 @@ async def test_create_openapi_server_with_timeout(
         assert template._timeout == 1.0
 
 
+class TestHTTPPool:
+    async def test_creates_pooled_client_from_spec_servers(
+        self, fastapi_app: FastAPI, httpx_mock: HTTPXMock
+    ):
+        openapi_spec = fastapi_app.openapi()
+        openapi_spec["servers"] = [{"url": "https://api.example.com"}]
+        httpx_mock.add_response(
+            url="https://api.example.com/users/1",
+            json={"id": 1, "name": "Alice", "active": True},
+        )
+
+        server = FastMCP.from_openapi(
+            openapi_spec=openapi_spec,
+            http_pool=HTTPPoolConfig(max_connections=10, read_timeout=3.0),
+        )
+        assert isinstance(server._client, PooledAsyncClient)
+        assert server._client.base_url == "https://api.example.com"
+        assert server._timeout == httpx.Timeout(
+            connect=5.0, read=3.0, write=30.0, pool=30.0
+        )
+
+        async with Client(server) as client:
+            result = await client.call_tool("get_user_users", {"user_id": 1})
+        assert result.data == {"id": 1, "name": "Alice", "active": True}
+
+        stats = server.http_pool_stats()
+        assert stats is not None
+        assert stats.requests == 1
+        assert stats.in_flight == 0
+        assert stats.max_connections == 10
+
+    async def test_spec_without_servers_requires_client(self, fastapi_app: FastAPI):
+        with pytest.raises(ValueError, match="server URL"):
+            FastMCP.from_openapi(openapi_spec=fastapi_app.openapi())
+
+    async def test_client_and_http_pool_are_exclusive(
+        self, fastapi_app: FastAPI, api_client: httpx.AsyncClient
+    ):
+        with pytest.raises(ValueError, match="not both"):
+            FastMCP.from_openapi(
+                openapi_spec=fastapi_app.openapi(),
+                client=api_client,
+                http_pool=HTTPPoolConfig(),
+            )
+
+    async def test_no_stats_for_other_clients(
+        self, fastapi_app: FastAPI, api_client: httpx.AsyncClient
+    ):
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(), client=api_client
+        )
+        assert server.http_pool_stats() is None
+        assert server._timeout is None
+
+
+class TestHTTPCache:
+    @pytest.fixture
+    def counting_client(self, fastapi_app: FastAPI) -> httpx.AsyncClient:
+        requests: list[httpx.Request] = []
+
+        class CountingTransport(httpx.ASGITransport):
+            async def handle_async_request(self, request):
+                requests.append(request)
+                response = await super().handle_async_request(request)
+                response.headers["cache-control"] = "max-age=60"
+                return response
+
+        client = httpx.AsyncClient(
+            transport=CountingTransport(app=fastapi_app), base_url="http://test"
+        )
+        client.requests = requests  # type: ignore[attr-defined]
+        return client
+
+    async def test_cached_get_tool(
+        self, fastapi_app: FastAPI, counting_client: httpx.AsyncClient
+    ):
+        cache = HTTPCache()
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(),
+            client=counting_client,
+            route_maps=[RouteMap(methods=["GET"], mcp_type=MCPType.TOOL, cache=cache)],
+        )
+
+        async with Client(server) as client:
+            first = await client.call_tool("get_user_users", {"user_id": 1})
+            second = await client.call_tool("get_user_users", {"user_id": 1})
+            await client.call_tool("get_user_users", {"user_id": 2})
+
+        assert first.data == second.data
+        assert len(counting_client.requests) == 2  # type: ignore[attr-defined]
+        assert cache.stats().hits == 1
+
+    async def test_cached_resource_and_template(
+        self, fastapi_app: FastAPI, counting_client: httpx.AsyncClient
+    ):
+        cache = HTTPCache()
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(),
+            client=counting_client,
+            route_maps=[
+                RouteMap(
+                    methods=["GET"],
+                    pattern=r"\{",
+                    mcp_type=MCPType.RESOURCE_TEMPLATE,
+                    cache=cache,
+                ),
+                RouteMap(methods=["GET"], mcp_type=MCPType.RESOURCE, cache=cache),
+            ],
+        )
+
+        async with Client(server) as client:
+            await client.read_resource("resource://get_users_users_get")
+            await client.read_resource("resource://get_users_users_get")
+            await client.read_resource("resource://get_user_users/1")
+            await client.read_resource("resource://get_user_users/1")
+
+        assert len(counting_client.requests) == 2  # type: ignore[attr-defined]
+
+    async def test_uncached_routes_and_non_get_requests(
+        self, fastapi_app: FastAPI, counting_client: httpx.AsyncClient
+    ):
+        cache = HTTPCache()
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(),
+            client=counting_client,
+            route_maps=[RouteMap(methods=["POST"], mcp_type=MCPType.TOOL, cache=cache)],
+        )
+
+        async with Client(server) as client:
+            await client.call_tool("get_user_users", {"user_id": 1})
+            await client.call_tool("get_user_users", {"user_id": 1})
+            await client.call_tool(
+                "create_user_users_post", {"name": "D", "active": True}
+            )
+            await client.call_tool(
+                "create_user_users_post", {"name": "D", "active": True}
+            )
+
+        assert len(counting_client.requests) == 4  # type: ignore[attr-defined]
+
+
+class TestRequestCoalescing:
+    @pytest.fixture
+    def gated_client(self, fastapi_app: FastAPI) -> httpx.AsyncClient:
+        """A client whose requests are held until its `release` event is set."""
+        requests: list[httpx.Request] = []
+        release = anyio.Event()
+
+        class GatedTransport(httpx.ASGITransport):
+            async def handle_async_request(self, request):
+                requests.append(request)
+                await release.wait()
+                return await super().handle_async_request(request)
+
+        client = httpx.AsyncClient(
+            transport=GatedTransport(app=fastapi_app), base_url="http://test"
+        )
+        client.requests = requests  # type: ignore[attr-defined]
+        client.release = release  # type: ignore[attr-defined]
+        return client
+
+    async def run_concurrently(self, client: httpx.AsyncClient, *calls) -> list:
+        results = [None] * len(calls)
+
+        async def run(i, call):
+            results[i] = await call()
+
+        async with anyio.create_task_group() as tg:
+            for i, call in enumerate(calls):
+                tg.start_soon(run, i, call)
+            await anyio.wait_all_tasks_blocked()
+            client.release.set()  # type: ignore[attr-defined]
+        return results
+
+    async def test_identical_get_requests_are_coalesced(
+        self, fastapi_app: FastAPI, gated_client: httpx.AsyncClient
+    ):
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(),
+            client=gated_client,
+            coalesce_requests=True,
+        )
+        tool = await server._tool_manager.get_tool("get_user_users")
+
+        results = await self.run_concurrently(
+            gated_client,
+            *[lambda: tool.run({"user_id": 1})] * 5,
+            lambda: tool.run({"user_id": 2}),
+        )
+
+        assert len(gated_client.requests) == 2  # type: ignore[attr-defined]
+        assert [r.structured_content["id"] for r in results] == [1, 1, 1, 1, 1, 2]
+        assert server._coalescer is not None
+        assert server._coalescer.coalesced == 4
+
+    async def test_resources_are_coalesced(
+        self, fastapi_app: FastAPI, gated_client: httpx.AsyncClient
+    ):
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(),
+            client=gated_client,
+            route_maps=[RouteMap(methods=["GET"], mcp_type=MCPType.RESOURCE)],
+            coalesce_requests=True,
+        )
+        resource = await server._resource_manager.get_resource(
+            "resource://get_users_users_get"
+        )
+
+        results = await self.run_concurrently(gated_client, *[resource.read] * 3)
+
+        assert len(gated_client.requests) == 1  # type: ignore[attr-defined]
+        assert len(set(results)) == 1
+
+    async def test_non_get_requests_are_not_coalesced(
+        self, fastapi_app: FastAPI, gated_client: httpx.AsyncClient
+    ):
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(),
+            client=gated_client,
+            coalesce_requests=True,
+        )
+        tool = await server._tool_manager.get_tool("create_user_users_post")
+
+        await self.run_concurrently(
+            gated_client, *[lambda: tool.run({"name": "D", "active": True})] * 3
+        )
+
+        assert len(gated_client.requests) == 3  # type: ignore[attr-defined]
+
+    async def test_coalescing_is_disabled_by_default(
+        self, fastapi_app: FastAPI, gated_client: httpx.AsyncClient
+    ):
+        server = FastMCP.from_openapi(
+            openapi_spec=fastapi_app.openapi(), client=gated_client
+        )
+        tool = await server._tool_manager.get_tool("get_user_users")
+
+        await self.run_concurrently(
+            gated_client, *[lambda: tool.run({"user_id": 1})] * 3
+        )
+
+        assert server._coalescer is None
+        assert len(gated_client.requests) == 3  # type: ignore[attr-defined]
+
+    async def test_errors_are_shared(self):
+        coalescer = RequestCoalescer()
+        request = httpx.Request("GET", "http://test/")
+        release = anyio.Event()
+        calls = 0
+
+        async def send():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise httpx.ConnectError("refused")
+
+        errors = []
+
+        async def run():
+            try:
+                await coalescer.send(request, send)
+            except httpx.ConnectError as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run)
+            tg.start_soon(run)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert calls == 1
+        assert len(errors) == 2
+
+    async def test_waiters_retry_when_request_is_cancelled(self):
+        coalescer = RequestCoalescer()
+        request = httpx.Request("GET", "http://test/")
+        response = httpx.Response(200)
+        calls = 0
+
+        async def send():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await anyio.sleep_forever()
+            return response
+
+        leader_scope = anyio.CancelScope()
+        results = []
+
+        async def leader():
+            with leader_scope:
+                await coalescer.send(request, send)
+
+        async def waiter():
+            results.append(await coalescer.send(request, send))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(leader)
+            await anyio.wait_all_tasks_blocked()
+            tg.start_soon(waiter)
+            await anyio.wait_all_tasks_blocked()
+            leader_scope.cancel()
+
+        assert calls == 2
+        assert results == [response]
+
+
+class TestResourceSizeLimit:
+    @pytest.fixture
+    def users_spec(self) -> dict:
+        return {
+            "openapi": "3.0.0",
+            "info": {"title": "Users", "version": "1.0.0"},
+            "servers": [{"url": "https://api.example.com"}],
+            "paths": {
+                "/users": {
+                    "get": {
+                        "operationId": "list_users",
+                        "responses": {"200": {"description": "Users"}},
+                    }
+                }
+            },
+        }
+
+    def make_server(self, users_spec, **kwargs) -> FastMCPOpenAPI:
+        return FastMCP.from_openapi(
+            openapi_spec=users_spec,
+            route_maps=[RouteMap(methods=["GET"], mcp_type=MCPType.RESOURCE)],
+            **kwargs,
+        )
+
+    async def test_json_is_passed_through(self, users_spec, httpx_mock: HTTPXMock):
+        body = b'[{"id":1, "name":"Alice"}]'
+        httpx_mock.add_response(
+            url="https://api.example.com/users",
+            content=body,
+            headers={"content-type": "application/json"},
+        )
+        server = self.make_server(users_spec)
+
+        async with Client(server) as client:
+            result = await client.read_resource("resource://list_users")
+        assert result[0].text == body.decode()  # type: ignore[attr-defined]
+
+    async def test_large_responses_are_refused(self, users_spec, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url="https://api.example.com/users",
+            content=b'[{"id": 1}' + b', {"id": 1}' * 100 + b"]",
+            headers={"content-type": "application/json"},
+        )
+        server = self.make_server(users_spec, max_resource_size=100)
+
+        async with Client(server) as client:
+            with pytest.raises(McpError, match="exceeded the maximum size of 100"):
+                await client.read_resource("resource://list_users")
+
+    async def test_responses_within_the_limit_are_returned(
+        self, users_spec, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(
+            url="https://api.example.com/users",
+            content=b"x" * 100,
+            headers={"content-type": "text/plain"},
+        )
+        server = self.make_server(users_spec, max_resource_size=100)
+
+        async with Client(server) as client:
+            result = await client.read_resource("resource://list_users")
+        assert result[0].text == "x" * 100  # type: ignore[attr-defined]
+
+    async def test_cached_large_responses_are_refused(
+        self, users_spec, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(
+            url="https://api.example.com/users",
+            content=b"x" * 1000,
+            headers={"content-type": "text/plain", "cache-control": "max-age=60"},
+        )
+        server = FastMCP.from_openapi(
+            openapi_spec=users_spec,
+            route_maps=[
+                RouteMap(methods=["GET"], mcp_type=MCPType.RESOURCE, cache=HTTPCache())
+            ],
+            max_resource_size=100,
+        )
+
+        async with Client(server) as client:
+            for _ in range(2):
+                with pytest.raises(McpError, match="exceeded the maximum size"):
+                    await client.read_resource("resource://list_users")
+
+    def test_limit_defaults_to_setting(self, users_spec):
+        assert (
+            self.make_server(users_spec)._max_resource_size
+            == fastmcp.settings.openapi_max_resource_size
+        )
+        with temporary_settings(openapi_max_resource_size=None):
+            assert self.make_server(users_spec)._max_resource_size is None
+        assert (
+            self.make_server(users_spec, max_resource_size=None)._max_resource_size
+            is None
+        )
+
+    async def test_default_limit_is_enforced(
+        self, users_spec, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(
+            url="https://api.example.com/users",
+            content=b"x" * 1000,
+            headers={"content-type": "text/plain"},
+        )
+
+        with temporary_settings(openapi_max_resource_size=100):
+            server = self.make_server(users_spec)
+            async with Client(server) as client:
+                with pytest.raises(McpError, match="exceeded the maximum size"):
+                    await client.read_resource("resource://list_users")
+
+
+class TestOpenAPISnapshot:
+    async def test_rebuild_from_snapshot(
+        self,
+        fastapi_app: FastAPI,
+        api_client: httpx.AsyncClient,
+        tmp_path,
+        monkeypatch,
+    ):
+        openapi_spec = fastapi_app.openapi()
+        server = FastMCPOpenAPI(
+            openapi_spec=openapi_spec, client=api_client, route_maps=GET_ROUTE_MAPS
+        )
+        server.export_snapshot(tmp_path / "snapshot.json")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the spec should not be parsed")
+
+        monkeypatch.setattr(
+            "fastmcp.utilities.openapi.parse_openapi_to_http_routes", fail
+        )
+        monkeypatch.setattr("fastmcp.server.openapi._combine_schemas", fail)
+        monkeypatch.setattr(
+            "fastmcp.server.openapi.format_description_with_responses", fail
+        )
+        rebuilt = FastMCPOpenAPI(
+            openapi_spec=openapi_spec,
+            client=api_client,
+            route_maps=GET_ROUTE_MAPS,
+            snapshot_path=tmp_path / "snapshot.json",
+        )
+
+        for method in ("get_tools", "get_resources", "get_resource_templates"):
+            original = await getattr(server, method)()
+            loaded = await getattr(rebuilt, method)()
+            assert loaded.keys() == original.keys()
+            for key, component in original.items():
+                assert loaded[key].description == component.description
+                assert loaded[key].model_dump() == component.model_dump()
+
+        async with Client(rebuilt) as client:
+            result = await client.call_tool(
+                "create_user_users_post", {"name": "Dan", "active": True}
+            )
+        assert result.data == {"id": 4, "name": "Dan", "active": True}
+
+    async def test_snapshot_is_written(
+        self, fastapi_app: FastAPI, api_client: httpx.AsyncClient, tmp_path
+    ):
+        path = tmp_path / "snapshots" / "api.json"
+        FastMCPOpenAPI(
+            openapi_spec=fastapi_app.openapi(), client=api_client, snapshot_path=path
+        )
+        snapshot = OpenAPISnapshot.load(path, fastapi_app.openapi())
+        assert snapshot is not None
+        assert all(entry.parameters is not None for entry in snapshot.routes)
+        assert not snapshot.changed
+
+    async def test_snapshot_of_another_spec_is_replaced(
+        self, fastapi_app: FastAPI, api_client: httpx.AsyncClient, tmp_path
+    ):
+        path = tmp_path / "snapshot.json"
+        openapi_spec = fastapi_app.openapi()
+        FastMCPOpenAPI(openapi_spec=openapi_spec, client=api_client, snapshot_path=path)
+
+        openapi_spec["paths"].pop("/users/{user_id}")
+        server = FastMCPOpenAPI(
+            openapi_spec=openapi_spec, client=api_client, snapshot_path=path
+        )
+        assert "get_user_users" not in await server.get_tools()
+        snapshot = OpenAPISnapshot.load(path, openapi_spec)
+        assert snapshot is not None
+        assert len(snapshot.routes) == len(server._snapshot.routes)
+
+    async def test_new_component_types_are_added_to_snapshot(
+        self, fastapi_app: FastAPI, api_client: httpx.AsyncClient, tmp_path
+    ):
+        path = tmp_path / "snapshot.json"
+        openapi_spec = fastapi_app.openapi()
+        FastMCPOpenAPI(openapi_spec=openapi_spec, client=api_client, snapshot_path=path)
+        FastMCPOpenAPI(
+            openapi_spec=openapi_spec,
+            client=api_client,
+            route_maps=GET_ROUTE_MAPS,
+            snapshot_path=path,
+        )
+
+        snapshot = OpenAPISnapshot.load(path, openapi_spec)
+        assert snapshot is not None
+        assert {
+            component_type
+            for entry in snapshot.routes
+            for component_type in entry.descriptions
+        } == {"tool", "resource", "resource_template"}
+
+    async def test_unreadable_snapshot_is_ignored(
+        self, fastapi_app: FastAPI, api_client: httpx.AsyncClient, tmp_path
+    ):
+        path = tmp_path / "snapshot.json"
+        path.write_text("not json")
+        server = FastMCPOpenAPI(
+            openapi_spec=fastapi_app.openapi(), client=api_client, snapshot_path=path
+        )
+        assert "get_user_users" in await server.get_tools()
+        assert OpenAPISnapshot.load(path, fastapi_app.openapi()) is not None
+
+    async def test_spec_is_only_hashed_for_snapshots(
+        self, fastapi_app: FastAPI, api_client: httpx.AsyncClient, monkeypatch
+    ):
+        def fail(*args, **kwargs):
+            raise AssertionError("the spec should not be hashed")
+
+        monkeypatch.setattr("fastmcp.server.openapi.spec_hash", fail)
+        server = FastMCPOpenAPI(openapi_spec=fastapi_app.openapi(), client=api_client)
+        assert "create_user_users_post" in await server.get_tools()
+
+    async def test_spec_with_dates(self, api_client: httpx.AsyncClient, tmp_path):
+        # YAML loaders parse unquoted dates, e.g. in examples, as dates
+        openapi_spec = TestUpdateSpec.make_spec("a")
+        openapi_spec["info"]["x-released"] = datetime.date(2024, 1, 2)
+        path = tmp_path / "snapshot.json"
+
+        server = FastMCPOpenAPI(openapi_spec=openapi_spec, client=api_client)
+        assert "a" in await server.get_tools()
+        server = FastMCPOpenAPI(
+            openapi_spec=openapi_spec, client=api_client, snapshot_path=path
+        )
+        assert "a" in await server.get_tools()
+        assert OpenAPISnapshot.load(path, openapi_spec) is not None
+
+
+class TestUpdateSpec:
+    @staticmethod
+    def make_spec(*operation_ids: str, summary: str = "") -> dict:
+        return {
+            "openapi": "3.1.0",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {
+                f"/{operation_id}": {
+                    "post": {
+                        "operationId": operation_id,
+                        "summary": summary or None,
+                        "responses": {"200": {"description": "OK"}},
+                    }
+                }
+                for operation_id in operation_ids
+            },
+        }
+
+    async def test_adds_and_removes_components(self, api_client: httpx.AsyncClient):
+        server = FastMCPOpenAPI(
+            openapi_spec=self.make_spec("a", "b"), client=api_client
+        )
+        tool_b = (await server.get_tools())["b"]
+
+        changes = server.update_spec(self.make_spec("b", "c"))
+
+        assert changes == OpenAPIRouteChanges(added=["c"], removed=["a"])
+        tools = await server.get_tools()
+        assert set(tools) == {"b", "c"}
+        # components of unchanged routes are kept
+        assert tools["b"] is tool_b
+
+    async def test_replaces_changed_components(self, api_client: httpx.AsyncClient):
+        server = FastMCPOpenAPI(openapi_spec=self.make_spec("a"), client=api_client)
+
+        changes = server.update_spec(self.make_spec("a", summary="Updated"))
+
+        assert changes == OpenAPIRouteChanges(added=["a"], removed=["a"])
+        tool = (await server.get_tools())["a"]
+        assert tool.description.startswith("Updated")
+
+    async def test_unchanged_spec(self, api_client: httpx.AsyncClient):
+        server = FastMCPOpenAPI(openapi_spec=self.make_spec("a"), client=api_client)
+        changes = server.update_spec(self.make_spec("a"))
+        assert changes == OpenAPIRouteChanges(added=[], removed=[])
+
+    async def test_updates_are_visible_through_mounts(
+        self, api_client: httpx.AsyncClient
+    ):
+        server = FastMCPOpenAPI(openapi_spec=self.make_spec("a"), client=api_client)
+        parent = FastMCP()
+        parent.mount(server)
+
+        async with Client(parent) as client:
+            assert [tool.name for tool in await client.list_tools()] == ["a"]
+            server.update_spec(self.make_spec("b"))
+            assert [tool.name for tool in await client.list_tools()] == ["b"]
+
+    async def test_names_of_removed_components_are_reused(
+        self, api_client: httpx.AsyncClient
+    ):
+        server = FastMCPOpenAPI(openapi_spec=self.make_spec("a"), client=api_client)
+        server.update_spec(self.make_spec())
+        server.update_spec(self.make_spec("a"))
+        assert set(await server.get_tools()) == {"a"}
+
+    async def test_duplicate_names_stay_unique(self, api_client: httpx.AsyncClient):
+        def make_spec(summary: str = "") -> dict:
+            spec = self.make_spec("a", "b", "c")
+            for path in spec["paths"].values():
+                path["post"]["operationId"] = "foo"
+            spec["paths"]["/a"]["post"]["summary"] = summary or None
+            return spec
+
+        server = FastMCPOpenAPI(openapi_spec=make_spec(), client=api_client)
+        assert set(await server.get_tools()) == {"foo", "foo_2", "foo_3"}
+
+        changes = server.update_spec(make_spec(summary="Updated"))
+
+        assert changes == OpenAPIRouteChanges(added=["foo_4"], removed=["foo"])
+        tools = await server.get_tools()
+        assert {name: tool._route.path for name, tool in tools.items()} == {  # type: ignore[attr-defined]
+            "foo_2": "/b",
+            "foo_3": "/c",
+            "foo_4": "/a",
+        }
+
+
 class TestTools:
     async def test_default_behavior_converts_everything_to_tools(
         self, fastapi_app: FastAPI
@@ -2200,6 +2850,59 @@ class TestRouteMapTags:
         assert tool_names == expected_tools
 
 
+class TestRouteMapIndex:
+    """Tests for classifying routes with a RouteMapIndex."""
+
+    def test_first_match_wins_across_methods(self):
+        route_maps = [
+            RouteMap(methods=["GET"], pattern=r"^/admin", mcp_type=MCPType.EXCLUDE),
+            RouteMap(methods="*", pattern=r"^/items", mcp_type=MCPType.RESOURCE),
+            RouteMap(methods=["GET", "POST"], pattern=r".*", mcp_type=MCPType.TOOL),
+        ]
+        index = RouteMapIndex(route_maps)
+
+        def match(method, path):
+            return index.match(HTTPRoute(path=path, method=method))
+
+        assert match("GET", "/admin/stats") is route_maps[0]
+        assert match("POST", "/admin/stats") is route_maps[2]
+        assert match("GET", "/items") is route_maps[1]
+        assert match("POST", "/items") is route_maps[1]
+        # methods that no route map lists only use the wildcard route maps
+        assert match("DELETE", "/items") is route_maps[1]
+        assert match("DELETE", "/users").mcp_type == MCPType.TOOL
+
+    def test_string_and_compiled_patterns(self):
+        route_maps = [
+            RouteMap(pattern=re.compile(r"^/users/\{id\}$"), mcp_type=MCPType.EXCLUDE),
+            RouteMap(pattern=r"\{.*\}", mcp_type=MCPType.RESOURCE_TEMPLATE),
+        ]
+        index = RouteMapIndex(route_maps)
+
+        assert index.match(HTTPRoute(path="/users/{id}", method="GET")) is route_maps[0]
+        assert index.match(HTTPRoute(path="/posts/{id}", method="GET")) is route_maps[1]
+
+    def test_tags(self):
+        route_maps = [
+            RouteMap(mcp_type=MCPType.EXCLUDE, tags={"admin", "internal"}),
+            RouteMap(mcp_type=MCPType.TOOL),
+        ]
+        index = RouteMapIndex(route_maps)
+
+        route = HTTPRoute(path="/stats", method="GET", tags=["admin", "internal"])
+        assert index.match(route) is route_maps[0]
+        route = HTTPRoute(path="/stats", method="GET", tags=["admin"])
+        assert index.match(route) is route_maps[1]
+
+    def test_classification_timings(self):
+        index = RouteMapIndex([RouteMap(mcp_type=MCPType.TOOL)])
+        for i in range(3):
+            index.match(HTTPRoute(path=f"/items/{i}", method="GET"))
+
+        assert index.routes_classified == 3
+        assert index.classification_time > 0
+
+
 class TestMCPNames:
     """Tests for the mcp_names dictionary functionality."""
 
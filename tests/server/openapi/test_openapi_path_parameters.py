@@ -6,8 +6,8 @@ import pytest
 from fastapi import FastAPI, Query
 
 from fastmcp import Client, FastMCP
-from fastmcp.server.openapi import MCPType, OpenAPITool, RouteMap
-from fastmcp.utilities.openapi import HTTPRoute, ParameterInfo
+from fastmcp.server.openapi import MCPType, OpenAPITool, RequestPlan, RouteMap
+from fastmcp.utilities.openapi import HTTPRoute, ParameterInfo, RequestBodyInfo
 
 
 @pytest.fixture
@@ -474,3 +474,96 @@ def test_parameter_location_enum_handling():
         param_in_str = param_in.value if isinstance(param_in, Enum) else param_in
         assert param_in_str == expected_str
         assert isinstance(param_in_str, str)
+
+
+class TestRequestPlan:
+    @pytest.fixture
+    def route(self) -> HTTPRoute:
+        return HTTPRoute(
+            path="/users/{user_id}/items/{item_id}",
+            method="POST",
+            operation_id="update_item",
+            parameters=[
+                ParameterInfo(
+                    name="user_id", location="path", required=True, schema={}
+                ),
+                ParameterInfo(
+                    name="item_id",
+                    location="path",
+                    required=True,
+                    schema={"type": "array", "items": {"type": "integer"}},
+                ),
+                ParameterInfo(
+                    name="tags",
+                    location="query",
+                    schema={"type": "array", "explode": False},
+                ),
+                ParameterInfo(name="X-Trace", location="header", schema={}),
+            ],
+            request_body=RequestBodyInfo(
+                required=True,
+                content_schema={"application/json": {"type": "object"}},
+            ),
+        )
+
+    def test_from_route(self, route: HTTPRoute):
+        plan = RequestPlan.from_route(route)
+
+        assert plan.path_params == (("user_id", False), ("item_id", True))
+        assert plan.required_path_params == {"user_id", "item_id"}
+        assert plan.query_params == (("tags", True, False),)
+        assert plan.header_params == (("X-Trace", "x-trace"),)
+        assert plan.non_body_args == {
+            "user_id",
+            "item_id",
+            "tags",
+            "X-Trace",
+            "context",
+        }
+
+    def test_no_request_body(self):
+        route = HTTPRoute(path="/items", method="GET", operation_id="list_items")
+
+        plan = RequestPlan.from_route(route)
+
+        assert plan.non_body_args is None
+        assert plan.format_path({}) == "/items"
+
+    def test_format_path(self, route: HTTPRoute):
+        plan = RequestPlan.from_route(route)
+
+        assert plan.format_path({"user_id": "1", "item_id": "2,3"}) == (
+            "/users/1/items/2,3"
+        )
+        # values are substituted once, even if they look like parameters
+        assert plan.format_path({"user_id": "{item_id}", "item_id": "2"}) == (
+            "/users/{item_id}/items/2"
+        )
+
+    async def test_run_builds_request(self, route: HTTPRoute, mock_client):
+        tool = OpenAPITool(
+            client=mock_client,
+            route=route,
+            name="update_item",
+            description="Update an item",
+            parameters={},
+        )
+
+        await tool.run(
+            {
+                "user_id": 1,
+                "item_id": [2, 3],
+                "tags": ["a", "b"],
+                "X-Trace": "abc",
+                "name": "Item",
+            }
+        )
+
+        mock_client.request.assert_called_with(
+            method="POST",
+            url="/users/1/items/2,3",
+            params={"tags": "a,b"},
+            headers={"x-trace": "abc"},
+            json={"name": "Item"},
+            timeout=None,
+        )
@@ -2,10 +2,12 @@ import json
 import sys
 from contextlib import asynccontextmanager
 
+import anyio
 import pytest
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
+from fastmcp.client.messages import MessageHandler
 from fastmcp.client.transports import FastMCPTransport, SSETransport
 from fastmcp.server.proxy import FastMCPProxy
 
@@ -573,6 +575,37 @@ class TestPrefixConflictResolution:
             assert result.messages is not None
             assert result.messages[0].content.text == "Second app prompt"  # type: ignore[attr-defined]
 
+    async def test_overlapping_prefixes_route_to_matching_server(self):
+        """Test that prefixes sharing a common stem route to the right server."""
+        main_app = FastMCP("MainApp")
+        my_app = FastMCP("MyApp")
+        my_api_app = FastMCP("MyApiApp")
+
+        @my_app.tool
+        def api_tool() -> str:
+            return "my app"
+
+        @my_api_app.tool
+        def tool() -> str:
+            return "my api app"
+
+        @my_app.prompt
+        def api_prompt() -> str:
+            return "my app prompt"
+
+        main_app.mount(my_app, "my")
+        main_app.mount(my_api_app, "my_api")
+
+        async with Client(main_app) as client:
+            # my_api_tool could be "my" + "api_tool" or "my_api" + "tool"; the
+            # later mount wins
+            result = await client.call_tool("my_api_tool", {})
+            assert result.data == "my api app"
+
+            # only "my" serves this prompt, so routing falls through to it
+            prompt_result = await client.get_prompt("my_api_prompt", {})
+            assert prompt_result.messages[0].content.text == "my app prompt"  # type: ignore[attr-defined]
+
 
 class TestDynamicChanges:
     """Test that changes to mounted servers are reflected dynamically."""
@@ -620,14 +653,59 @@ class TestDynamicChanges:
         assert "sub_temp_tool" in tools
 
         # Remove the tool from sub_app
-        sub_app._tool_manager._tools.pop("temp_tool")
+        sub_app.remove_tool("temp_tool")
 
         # The tool should no longer be accessible
-        # Refresh the cache by clearing it
-        main_app._cache.cache.clear()
         tools = await main_app.get_tools()
         assert "sub_temp_tool" not in tools
 
+    async def test_adding_tool_to_nested_server_after_mounting(self):
+        """Test that changes propagate through multiple levels of mounting."""
+        main_app = FastMCP("MainApp")
+        sub_app = FastMCP("SubApp")
+        nested_app = FastMCP("NestedApp")
+
+        sub_app.mount(nested_app, "nested")
+        main_app.mount(sub_app, "sub")
+
+        tools = await main_app.get_tools()
+        assert "sub_nested_deep_tool" not in tools
+
+        @nested_app.tool
+        def deep_tool() -> str:
+            return "deep"
+
+        tools = await main_app.get_tools()
+        assert "sub_nested_deep_tool" in tools
+
+        nested_app.remove_tool("deep_tool")
+        tools = await main_app.get_tools()
+        assert "sub_nested_deep_tool" not in tools
+
+    async def test_disabling_tool_after_mounting(self):
+        """Test that enabling or disabling a nested tool is reflected in the parent."""
+        main_app = FastMCP("MainApp")
+        sub_app = FastMCP("SubApp")
+        nested_app = FastMCP("NestedApp")
+
+        @nested_app.tool
+        def deep_tool() -> str:
+            return "deep"
+
+        sub_app.mount(nested_app, "nested")
+        main_app.mount(sub_app, "sub")
+
+        tools = await main_app.get_tools()
+        assert "sub_nested_deep_tool" in tools
+
+        deep_tool.disable()
+        tools = await main_app.get_tools()
+        assert "sub_nested_deep_tool" not in tools
+
+        deep_tool.enable()
+        tools = await main_app.get_tools()
+        assert "sub_nested_deep_tool" in tools
+
     async def test_cache_expiration(self):
         main_app = FastMCP("MainApp", cache_expiration_seconds=2)
         sub_app = FastMCP("SubApp")
@@ -642,6 +720,170 @@ class TestDynamicChanges:
         assert len(tools) == 0
 
 
+class TestReplaceMount:
+    """Test replacing mounted servers."""
+
+    async def test_replace_mount(self):
+        main_app = FastMCP("MainApp")
+        old_app = FastMCP("OldApp")
+        new_app = FastMCP("NewApp")
+
+        @old_app.tool
+        def old_tool() -> str:
+            return "old"
+
+        @new_app.tool
+        def new_tool() -> str:
+            return "new"
+
+        main_app.mount(old_app, "api")
+        assert "api_old_tool" in await main_app.get_tools()
+
+        replaced = await main_app.replace_mount("api", new_app)
+
+        assert replaced is old_app
+        tools = await main_app.get_tools()
+        assert "api_new_tool" in tools
+        assert "api_old_tool" not in tools
+        async with Client(main_app) as client:
+            result = await client.call_tool("api_new_tool", {})
+            assert result.data == "new"
+
+        # the old server no longer affects the parent
+        @old_app.tool
+        def another_tool() -> str:
+            return "another"
+
+        assert "api_another_tool" not in await main_app.get_tools()
+
+    async def test_in_flight_calls_finish_on_old_server(self):
+        main_app = FastMCP("MainApp")
+        old_app = FastMCP("OldApp")
+        new_app = FastMCP("NewApp")
+        started = anyio.Event()
+        release = anyio.Event()
+
+        @old_app.tool
+        async def slow_tool() -> str:
+            started.set()
+            await release.wait()
+            return "old"
+
+        @new_app.tool
+        def slow_tool_2() -> str:
+            return "new"
+
+        main_app.mount(old_app, "api")
+        results = []
+        replaced = anyio.Event()
+
+        async with Client(main_app) as client:
+
+            async def call():
+                result = await client.call_tool("api_slow_tool", {})
+                results.append(result.content[0].text)  # type: ignore[attr-defined]
+
+            async def replace():
+                await main_app.replace_mount("api", new_app)
+                replaced.set()
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(call)
+                await started.wait()
+                tg.start_soon(replace)
+                await anyio.wait_all_tasks_blocked()
+
+                # the new server is already routed to, but replace_mount waits
+                # for the call in flight on the old server
+                assert "api_slow_tool_2" in await main_app.get_tools()
+                assert not replaced.is_set()
+                release.set()
+
+        assert replaced.is_set()
+        assert results == ["old"]
+
+    async def test_waits_for_resource_reads(self):
+        main_app = FastMCP("MainApp")
+        old_app = FastMCP("OldApp")
+        started = anyio.Event()
+        release = anyio.Event()
+
+        @old_app.resource("data://value")
+        async def value() -> str:
+            started.set()
+            await release.wait()
+            return "old"
+
+        main_app.mount(old_app, "api")
+        replaced = anyio.Event()
+
+        async def replace():
+            await main_app.replace_mount("api", FastMCP("NewApp"))
+            replaced.set()
+
+        async with Client(main_app) as client:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.read_resource, "data://api/value")
+                await started.wait()
+                tg.start_soon(replace)
+                await anyio.wait_all_tasks_blocked()
+                assert not replaced.is_set()
+                release.set()
+
+        assert replaced.is_set()
+
+    async def test_notifies_clients_once(self):
+        main_app = FastMCP("MainApp")
+        old_app = FastMCP("OldApp")
+        new_app = FastMCP("NewApp")
+
+        @new_app.tool
+        def new_tool() -> str:
+            return "new"
+
+        main_app.mount(old_app, "api")
+        received: list[str] = []
+
+        class RecordingHandler(MessageHandler):
+            async def on_notification(self, message) -> None:
+                received.append(message.root.method)
+
+        async with Client(main_app, message_handler=RecordingHandler()) as client:
+            await client.ping()
+            await main_app.replace_mount("api", new_app)
+            # a request round trip makes sure the notification was delivered
+            await client.ping()
+
+        assert received == ["notifications/tools/list_changed"]
+
+    async def test_notifies_every_client(self):
+        main_app = FastMCP("MainApp")
+        main_app.mount(FastMCP("OldApp"), "api")
+        received: list[str] = []
+
+        class RecordingHandler(MessageHandler):
+            async def on_notification(self, message) -> None:
+                received.append(message.root.method)
+
+        async with (
+            Client(main_app, message_handler=RecordingHandler()) as first,
+            Client(main_app, message_handler=RecordingHandler()) as second,
+        ):
+            await first.list_tools()
+            await second.list_tools()
+            await main_app.replace_mount("api", FastMCP("NewApp"))
+            await first.ping()
+            await second.ping()
+
+        assert received == ["notifications/tools/list_changed"] * 2
+
+    async def test_unknown_prefix(self):
+        main_app = FastMCP("MainApp")
+        main_app.mount(FastMCP("SubApp"), "sub")
+        with pytest.raises(ValueError, match="No server is mounted"):
+            await main_app.replace_mount("other", FastMCP("OtherApp"))
+
+
 class TestResourcesAndTemplates:
     """Test mounting with resources and resource templates."""
 
@@ -1,6 +1,8 @@
 import json
+from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio
 import pytest
 from anyio import create_task_group
 from dirty_equals import Contains
@@ -9,9 +11,12 @@ from pydantic import AnyUrl
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
+from fastmcp.client.messages import MessageHandler
 from fastmcp.client.transports import FastMCPTransport, StreamableHttpTransport
 from fastmcp.exceptions import ToolError
-from fastmcp.server.proxy import FastMCPProxy
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.proxy import FastMCPProxy, ProxySessionPool
+from fastmcp.utilities.tests import temporary_settings
 
 USERS = [
     {"id": "1", "name": "Alice", "active": True},
@@ -516,3 +521,259 @@ async def test_proxy_handles_multiple_concurrent_tasks_correctly(
     assert list(results["tools"]) == Contains(
         "greet", "add", "error_tool", "tool_without_description"
     )
+
+
+class TestInventoryCache:
+    @pytest.fixture
+    def list_counter(self, fastmcp_server: FastMCP) -> dict[str, int]:
+        counts: dict[str, int] = {}
+
+        class CountingMiddleware(Middleware):
+            async def on_request(self, context, call_next):
+                assert context.method is not None
+                counts[context.method] = counts.get(context.method, 0) + 1
+                return await call_next(context)
+
+        fastmcp_server.add_middleware(CountingMiddleware())
+        return counts
+
+    async def test_lists_backend_on_every_call_by_default(
+        self, fastmcp_server: FastMCP, list_counter: dict[str, int]
+    ):
+        proxy = FastMCP.as_proxy(Client(transport=FastMCPTransport(fastmcp_server)))
+        await proxy.get_tools()
+        await proxy.get_tools()
+        assert list_counter["tools/list"] == 2
+
+    async def test_reuses_backend_lists_within_ttl(
+        self, fastmcp_server: FastMCP, list_counter: dict[str, int]
+    ):
+        proxy = FastMCP.as_proxy(
+            Client(transport=FastMCPTransport(fastmcp_server)),
+            inventory_cache_ttl=60,
+        )
+        async with Client(proxy) as client:
+            await client.list_tools()
+            await client.list_tools()
+            await client.list_resources()
+            await client.read_resource("resource://wave")
+            await client.list_prompts()
+            await client.get_prompt("welcome", {"name": "Alice"})
+
+        assert list_counter["tools/list"] == 1
+        assert list_counter["resources/list"] == 1
+        assert list_counter["prompts/list"] == 1
+
+    async def test_list_changed_notification_invalidates_cache(
+        self, fastmcp_server: FastMCP, list_counter: dict[str, int]
+    ):
+        @fastmcp_server.tool
+        def add_tool() -> str:
+            @fastmcp_server.tool
+            def new_tool() -> str:
+                return "new"
+
+            return "added"
+
+        proxy = FastMCP.as_proxy(
+            Client(transport=FastMCPTransport(fastmcp_server)),
+            inventory_cache_ttl=60,
+        )
+        async with Client(proxy) as client:
+            tools = await client.list_tools()
+            assert "new_tool" not in [tool.name for tool in tools]
+
+            await client.call_tool("add_tool", {})
+
+            tools = await client.list_tools()
+            assert "new_tool" in [tool.name for tool in tools]
+
+    async def test_forwards_messages_to_original_handler(self, fastmcp_server: FastMCP):
+        @fastmcp_server.tool
+        def add_tool() -> str:
+            @fastmcp_server.tool
+            def new_tool() -> str:
+                return "new"
+
+            return "added"
+
+        received: list[str] = []
+
+        class RecordingHandler(MessageHandler):
+            async def on_tool_list_changed(self, message) -> None:
+                received.append(message.method)
+
+        proxy = FastMCP.as_proxy(
+            Client(
+                transport=FastMCPTransport(fastmcp_server),
+                message_handler=RecordingHandler(),
+            ),
+            inventory_cache_ttl=60,
+        )
+        async with Client(proxy) as client:
+            await client.call_tool("add_tool", {})
+
+        assert received == ["notifications/tools/list_changed"]
+
+
+class CountingTransport(FastMCPTransport):
+    """An in-memory transport that counts the sessions it opens."""
+
+    def __init__(self, mcp: FastMCP):
+        super().__init__(mcp)
+        self.sessions_opened = 0
+
+    def connect_session(self, **session_kwargs):
+        self.sessions_opened += 1
+        return super().connect_session(**session_kwargs)
+
+
+class GatedTransport(CountingTransport):
+    """A CountingTransport whose connections wait for a gate to open."""
+
+    def __init__(self, mcp: FastMCP):
+        super().__init__(mcp)
+        self.gate = anyio.Event()
+
+    @asynccontextmanager
+    async def connect_session(self, **session_kwargs):
+        await self.gate.wait()
+        async with super().connect_session(**session_kwargs) as session:
+            yield session
+
+
+class TestSessionPool:
+    @pytest.fixture
+    def transport(self, fastmcp_server: FastMCP) -> CountingTransport:
+        @fastmcp_server.tool
+        async def slow(delay: float) -> str:
+            await anyio.sleep(delay)
+            return "done"
+
+        return CountingTransport(fastmcp_server)
+
+    async def test_connects_per_request_by_default(self, transport: CountingTransport):
+        proxy = FastMCP.as_proxy(Client(transport=transport))
+        async with Client(proxy) as client:
+            await client.call_tool("greet", {"name": "Alice"})
+            await client.call_tool("greet", {"name": "Bob"})
+
+        assert len(proxy.sessions) == 0
+        assert transport.sessions_opened > 2
+
+    async def test_reuses_pooled_session(self, transport: CountingTransport):
+        proxy = FastMCP.as_proxy(Client(transport=transport), session_pool_size=2)
+        async with Client(proxy) as client:
+            await client.list_tools()
+            await client.call_tool("greet", {"name": "Alice"})
+            await client.read_resource("resource://wave")
+            await client.read_resource("data://user/1")
+            await client.get_prompt("welcome", {"name": "Alice"})
+            assert len(proxy.sessions) == 1
+
+        assert transport.sessions_opened == 1
+
+    async def test_opens_sessions_for_concurrent_requests(
+        self, transport: CountingTransport
+    ):
+        proxy = FastMCP.as_proxy(Client(transport=transport), session_pool_size=2)
+        async with Client(proxy) as client:
+            async with create_task_group() as tg:
+                for _ in range(4):
+                    tg.start_soon(client.call_tool, "slow", {"delay": 0.1})
+            assert len(proxy.sessions) == 2
+
+        assert transport.sessions_opened == 2
+
+    async def test_reconnects_stopped_session(self, transport: CountingTransport):
+        proxy = FastMCP.as_proxy(Client(transport=transport), session_pool_size=1)
+        async with Client(proxy) as client:
+            await client.call_tool("greet", {"name": "Alice"})
+
+            # simulate the backend connection dropping
+            pooled_client = proxy.sessions._sessions[0].client
+            pooled_client._stop_event.set()
+            assert pooled_client._session_task is not None
+            await pooled_client._session_task
+
+            result = await client.call_tool("greet", {"name": "Bob"})
+            assert result.data == "Hello, Bob!"
+
+        assert transport.sessions_opened == 2
+
+    async def test_replaces_idle_session_that_fails_ping(
+        self, transport: CountingTransport
+    ):
+        proxy = FastMCP.as_proxy(Client(transport=transport), session_pool_size=1)
+        proxy.sessions.ping_idle_after = 0
+        async with Client(proxy) as client:
+            await client.call_tool("greet", {"name": "Alice"})
+
+            async def ping() -> bool:
+                raise anyio.BrokenResourceError
+
+            pooled_client = proxy.sessions._sessions[0].client
+            pooled_client.ping = ping  # type: ignore[method-assign]
+
+            result = await client.call_tool("greet", {"name": "Bob"})
+            assert result.data == "Hello, Bob!"
+            assert proxy.sessions._sessions[0].client is not pooled_client
+
+        assert transport.sessions_opened == 2
+
+    async def test_idle_sessions_are_pinged_before_reuse(
+        self, transport: CountingTransport
+    ):
+        proxy = FastMCP.as_proxy(Client(transport=transport), session_pool_size=1)
+        proxy.sessions.ping_idle_after = 0
+        async with Client(proxy) as client:
+            await client.call_tool("greet", {"name": "Alice"})
+            await client.call_tool("greet", {"name": "Bob"})
+
+        assert transport.sessions_opened == 1
+
+    async def test_sessions_are_closed_after_last_server_session(
+        self, transport: CountingTransport
+    ):
+        proxy = FastMCP.as_proxy(Client(transport=transport), session_pool_size=1)
+        async with Client(proxy) as first:
+            async with Client(proxy) as second:
+                await second.call_tool("greet", {"name": "Alice"})
+            # the pool is still in use by the first session
+            assert len(proxy.sessions) == 1
+            await first.call_tool("greet", {"name": "Bob"})
+
+        assert len(proxy.sessions) == 0
+        assert transport.sessions_opened == 1
+
+    async def test_connects_outside_lock(self, fastmcp_server: FastMCP):
+        transport = GatedTransport(fastmcp_server)
+        pool = ProxySessionPool(Client(transport=transport), size=2)
+
+        async def use_session():
+            async with pool.session() as client:
+                await client.ping()
+
+        async with create_task_group() as tg:
+            tg.start_soon(use_session)
+            with anyio.fail_after(1):
+                while not pool._sessions:
+                    await anyio.sleep(0.01)
+            # the first session is still connecting
+            assert not pool._lock.locked()
+            transport.gate.set()
+
+        assert len(pool) == 1
+        await pool.close()
+
+    def test_ping_idle_after_is_configurable(self, fastmcp_server: FastMCP):
+        proxy = FastMCP.as_proxy(fastmcp_server, session_ping_idle_after=30)
+        assert proxy.sessions.ping_idle_after == 30
+
+        with temporary_settings(proxy_session_ping_idle_after=10):
+            proxy = FastMCP.as_proxy(fastmcp_server)
+        assert proxy.sessions.ping_idle_after == 10
+
+    def test_rejects_negative_size(self, fastmcp_server: FastMCP):
+        with pytest.raises(ValueError, match="Invalid session pool size"):
+            FastMCP.as_proxy(fastmcp_server, session_pool_size=-1)
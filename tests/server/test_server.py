@@ -8,6 +8,7 @@ from fastmcp import Client, FastMCP
 from fastmcp.exceptions import NotFoundError
 from fastmcp.prompts.prompt import FunctionPrompt, Prompt
 from fastmcp.resources import Resource, ResourceTemplate
+from fastmcp.server.middleware import Middleware
 from fastmcp.server.server import (
     add_resource_prefix,
     has_resource_prefix,
@@ -1366,3 +1367,159 @@ class TestShouldIncludeComponent:
         mcp2 = FastMCP(tools=[tool2], exclude_tags={"bad_tag"})
         result = mcp2._should_enable_component(tool2)
         assert result is True
+
+
+class TestListResponseCache:
+    @pytest.fixture
+    def list_calls(self) -> list[str]:
+        return []
+
+    def count_lists(
+        self, mcp: FastMCP, list_calls: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Records every list request that is built rather than served from cache."""
+        for name in [
+            "_list_tools",
+            "_list_resources",
+            "_list_resource_templates",
+            "_list_prompts",
+        ]:
+            original = getattr(mcp, name)
+
+            async def wrapper(original=original, name=name):
+                list_calls.append(name)
+                return await original()
+
+            monkeypatch.setattr(mcp, name, wrapper)
+
+    @pytest.fixture
+    def server(self) -> FastMCP:
+        mcp = FastMCP(cache_expiration_seconds=60)
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @mcp.resource("resource://data")
+        def data() -> str:
+            return "data"
+
+        @mcp.resource("resource://{id}/data")
+        def templated(id: str) -> str:
+            return id
+
+        @mcp.prompt
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        return mcp
+
+    async def test_lists_are_cached(
+        self, server: FastMCP, list_calls: list[str], monkeypatch
+    ):
+        self.count_lists(server, list_calls, monkeypatch)
+        async with Client(server) as client:
+            for _ in range(2):
+                assert [t.name for t in await client.list_tools()] == ["add"]
+                assert len(await client.list_resources()) == 1
+                assert len(await client.list_resource_templates()) == 1
+                assert len(await client.list_prompts()) == 1
+
+        assert sorted(list_calls) == [
+            "_list_prompts",
+            "_list_resource_templates",
+            "_list_resources",
+            "_list_tools",
+        ]
+
+    async def test_not_cached_by_default(self, list_calls: list[str], monkeypatch):
+        mcp = FastMCP()
+        self.count_lists(mcp, list_calls, monkeypatch)
+        async with Client(mcp) as client:
+            await client.list_tools()
+            await client.list_tools()
+
+        assert list_calls == ["_list_tools", "_list_tools"]
+
+    async def test_adding_component_invalidates_cache(
+        self, server: FastMCP, list_calls: list[str], monkeypatch
+    ):
+        self.count_lists(server, list_calls, monkeypatch)
+        async with Client(server) as client:
+            await client.list_tools()
+
+            @server.tool
+            def multiply(a: int, b: int) -> int:
+                return a * b
+
+            tools = await client.list_tools()
+
+        assert {t.name for t in tools} == {"add", "multiply"}
+        assert list_calls == ["_list_tools", "_list_tools"]
+
+    async def test_changes_to_mounted_server_invalidate_cache(
+        self, server: FastMCP, list_calls: list[str], monkeypatch
+    ):
+        sub = FastMCP()
+        server.mount(sub, prefix="sub")
+        self.count_lists(server, list_calls, monkeypatch)
+        async with Client(server) as client:
+            await client.list_prompts()
+
+            @sub.prompt
+            def farewell() -> str:
+                return "Goodbye!"
+
+            prompts = await client.list_prompts()
+
+        assert {p.name for p in prompts} == {"greet", "sub_farewell"}
+        assert list_calls == ["_list_prompts", "_list_prompts"]
+
+    async def test_disabling_component_invalidates_cache(self, server: FastMCP):
+        async with Client(server) as client:
+            assert len(await client.list_tools()) == 1
+            tool = await server.get_tool("add")
+            tool.disable()
+            assert await client.list_tools() == []
+
+    async def test_not_cached_with_middleware(
+        self, server: FastMCP, list_calls: list[str], monkeypatch
+    ):
+        server.add_middleware(Middleware())
+        self.count_lists(server, list_calls, monkeypatch)
+        async with Client(server) as client:
+            await client.list_tools()
+            await client.list_tools()
+
+        assert list_calls == ["_list_tools", "_list_tools"]
+
+    def test_manager_generations_include_mounted_changes(self):
+        parent = FastMCP()
+        child = FastMCP()
+        parent.mount(child)
+        managers = [
+            parent._tool_manager,
+            parent._resource_manager,
+            parent._prompt_manager,
+        ]
+        for manager in managers:
+            assert [mounted.server for mounted in manager.mounted_servers] == [child]
+            assert manager.is_cacheable()
+        generations = [manager.generation for manager in managers]
+
+        @child.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @child.resource("resource://data")
+        def data() -> str:
+            return "data"
+
+        @child.prompt
+        def hello() -> str:
+            return "hello"
+
+        assert all(
+            manager.generation > generation
+            for manager, generation in zip(managers, generations)
+        )
@@ -0,0 +1,225 @@
+from collections.abc import Callable, Generator
+from typing import Any
+
+import anyio
+import httpx
+
+from fastmcp.server.openapi import FastMCPOpenAPI
+from fastmcp.tool_loader import (
+    TOOL_CATALOG_TABLES,
+    UPDATED_AT_TABLES_QUERY,
+    ToolCatalogWatcher,
+    build_openapi_spec,
+    catalog_version_query,
+)
+
+
+def make_row(tool_name: str, parameter_name: str | None = None, **kwargs) -> dict:
+    return {
+        "tool_name": tool_name,
+        "tool_description": f"The {tool_name} tool",
+        "endpoint_id": 1,
+        "url": f"https://api.example.com/{tool_name}",
+        "method": "POST",
+        "parameter_name": parameter_name,
+        "parameter_type": "string",
+        "is_required": False,
+        **kwargs,
+    }
+
+
+class FakeAcquire:
+    """Like asyncpg's pool acquire context: awaited or used with `async with`."""
+
+    def __init__(self, pool: "FakePool"):
+        self.pool = pool
+
+    def __await__(self) -> Generator[Any, None, "FakePool"]:
+        self.pool.acquired += 1
+        yield from []
+        return self.pool
+
+    async def __aenter__(self) -> "FakePool":
+        return self.pool
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class FakePool:
+    """
+    An asyncpg pool stand-in serving the catalog from a list of rows. It is
+    also the connection it hands out.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+        self.version = 1
+        self.updated_at_tables: set[str] = set(TOOL_CATALOG_TABLES)
+        self.version_queries: list[str] = []
+        # errors raised by the next version checks
+        self.errors: list[Exception] = []
+        self.listeners: dict[str, Callable[..., None]] = {}
+        # connections acquired with `await` and not yet released
+        self.acquired = 0
+
+    def acquire(self) -> FakeAcquire:
+        return FakeAcquire(self)
+
+    async def release(self, connection: "FakePool") -> None:
+        self.acquired -= 1
+
+    async def add_listener(self, channel: str, callback: Callable[..., None]) -> None:
+        self.listeners[channel] = callback
+
+    async def remove_listener(
+        self, channel: str, callback: Callable[..., None]
+    ) -> None:
+        assert self.listeners.pop(channel) == callback
+
+    def notify(self, channel: str, payload: str = "") -> None:
+        """Delivers a notification the way asyncpg calls listeners."""
+        self.listeners[channel](self, 1234, channel, payload)
+
+    async def fetch(self, query: str, *args: Any) -> list[dict[str, Any]]:
+        if query == UPDATED_AT_TABLES_QUERY:
+            return [{"table_name": table} for table in self.updated_at_tables]
+        return self.rows
+
+    async def fetchrow(self, query: str) -> tuple:
+        if self.errors:
+            raise self.errors.pop(0)
+        self.version_queries.append(query)
+        return (self.version,)
+
+
+def test_build_openapi_spec():
+    spec = build_openapi_spec(
+        [
+            make_row("create_item", "name", is_required=True),
+            make_row("create_item", "size", parameter_type="integer"),
+            make_row(
+                "get_item",
+                "item_id",
+                url="https://api.example.com/items/{item_id}",
+                method="GET",
+            ),
+            make_row("list_items", None, method="GET"),
+        ]
+    )
+
+    assert spec["paths"]["/create_item"]["post"]["requestBody"]["content"][
+        "application/json"
+    ]["schema"] == {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "size": {"type": "integer"}},
+        "required": ["name"],
+    }
+    assert spec["paths"]["/items/{item_id}"]["get"]["parameters"] == [
+        {
+            "name": "item_id",
+            "in": "path",
+            "required": True,
+            "schema": {"type": "string"},
+        }
+    ]
+    assert spec["paths"]["/list_items"]["get"]["parameters"] == []
+
+
+def test_build_openapi_spec_uses_first_endpoint():
+    spec = build_openapi_spec(
+        [make_row("a", "x"), make_row("a", "y", endpoint_id=2, url="https://api/b")]
+    )
+    assert list(spec["paths"]) == ["/a"]
+    schema = spec["paths"]["/a"]["post"]["requestBody"]["content"]["application/json"]
+    assert list(schema["schema"]["properties"]) == ["x"]
+
+
+async def test_watcher_refreshes_changed_catalog():
+    pool = FakePool([make_row("a"), make_row("b")])
+    server = FastMCPOpenAPI(
+        openapi_spec=build_openapi_spec(pool.rows),
+        client=httpx.AsyncClient(base_url="https://api.example.com"),
+    )
+    watcher = ToolCatalogWatcher(pool, server)  # type: ignore[arg-type]
+
+    changes = await watcher.refresh()
+    assert changes is not None and changes.added == changes.removed == []
+
+    # the catalog version is unchanged, so the catalog is not reloaded
+    pool.rows = [make_row("b"), make_row("c")]
+    assert await watcher.refresh() is None
+
+    pool.version += 1
+    changes = await watcher.refresh()
+    assert changes is not None
+    assert (changes.added, changes.removed) == (["c"], ["a"])
+    assert set(await server.get_tools()) == {"b", "c"}
+
+
+def test_catalog_version_query():
+    query = catalog_version_query({"mcp_tools"})
+    assert query.count("count(*)") == 3
+    assert "max(updated_at) FROM mcp_tools" in query
+    assert "max(updated_at) FROM api_endpoints" not in query
+
+
+async def test_watcher_checks_updated_at_columns():
+    pool = FakePool([make_row("a")])
+    pool.updated_at_tables = {"api_endpoints"}
+    server = FastMCPOpenAPI(
+        openapi_spec=build_openapi_spec(pool.rows),
+        client=httpx.AsyncClient(base_url="https://api.example.com"),
+    )
+    watcher = ToolCatalogWatcher(pool, server)  # type: ignore[arg-type]
+
+    await watcher.refresh()
+    await watcher.refresh()
+    assert pool.version_queries == [catalog_version_query({"api_endpoints"})] * 2
+
+
+async def test_watcher_survives_failed_first_check():
+    pool = FakePool([make_row("a")])
+    pool.errors.append(ConnectionError("database unavailable"))
+    server = FastMCPOpenAPI(
+        openapi_spec=build_openapi_spec(pool.rows),
+        client=httpx.AsyncClient(base_url="https://api.example.com"),
+    )
+    watcher = ToolCatalogWatcher(pool, server, interval=0.01)  # type: ignore[arg-type]
+    pool.rows = [make_row("b")]
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(watcher.run)
+        # the watcher keeps running and picks up the change
+        with anyio.fail_after(1):
+            while set(await server.get_tools()) != {"b"}:
+                await anyio.sleep(0.01)
+        tg.cancel_scope.cancel()
+
+
+async def test_watcher_refreshes_on_notification():
+    pool = FakePool([make_row("a")])
+    server = FastMCPOpenAPI(
+        openapi_spec=build_openapi_spec(pool.rows),
+        client=httpx.AsyncClient(base_url="https://api.example.com"),
+    )
+    # polling alone would not pick up the change within the test
+    watcher = ToolCatalogWatcher(pool, server, interval=60, channel="tools")  # type: ignore[arg-type]
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(watcher.run)
+        with anyio.fail_after(1):
+            while "tools" not in pool.listeners:
+                await anyio.sleep(0.01)
+
+        # the version is unchanged, e.g. a row was updated in place in a table
+        # without an updated_at column, but the notification forces a reload
+        pool.rows = [make_row("b")]
+        pool.notify("tools", "mcp_tools")
+        with anyio.fail_after(1):
+            while set(await server.get_tools()) != {"b"}:
+                await anyio.sleep(0.01)
+        tg.cancel_scope.cancel()
+
+    assert pool.listeners == {}
+    assert pool.acquired == 0
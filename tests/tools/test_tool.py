@@ -1,7 +1,11 @@
+import inspect
 import json
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Annotated, Any
 
+import pydantic_core
 import pytest
 from mcp.types import (
     AudioContent,
@@ -13,8 +17,10 @@ from mcp.types import (
 from pydantic import AnyUrl, BaseModel, Field, TypeAdapter
 from typing_extensions import TypedDict
 
-from fastmcp.tools.tool import Tool, _convert_to_content
+import fastmcp.tools.tool
+from fastmcp.tools.tool import Tool, ToolResult, _convert_to_content
 from fastmcp.utilities.json_schema import compress_schema
+from fastmcp.utilities.tests import temporary_settings
 from fastmcp.utilities.types import Audio, File, Image
 
 
@@ -552,7 +558,7 @@ class TestToolFromFunctionOutputSchema:
         # Dict objects automatically become structured content even without schema
         assert result.structured_content == {"message": "Hello, world!"}
         assert len(result.content) == 1
-        assert result.content[0].text == '{\n  "message": "Hello, world!"\n}'  # type: ignore[attr-defined]
+        assert result.content[0].text == '{"message":"Hello, world!"}'  # type: ignore[attr-defined]
 
     async def test_output_schema_none_disables_structured_content(self):
         """Test that output_schema=None explicitly disables structured content."""
@@ -606,7 +612,7 @@ class TestToolFromFunctionOutputSchema:
         result = await tool.run({})
         # Dict result with object schema is used directly
         assert result.structured_content == {"value": 42}
-        assert result.content[0].text == '{\n  "value": 42\n}'  # type: ignore[attr-defined]
+        assert result.content[0].text == '{"value":42}'  # type: ignore[attr-defined]
 
     async def test_explicit_object_schema_with_non_dict_return_fails(self):
         """Test that explicit object schemas fail when function returns non-dict."""
@@ -858,7 +864,7 @@ class TestConvertResultToContent:
         assert isinstance(result, list)
         assert len(result) == 1
         assert isinstance(result[0], TextContent)
-        assert result[0].text == '{\n  "a": 1,\n  "b": 2\n}'
+        assert result[0].text == '{"a":1,"b":2}'
 
     def test_list_of_basic_types(self):
         """Test that a list of basic types is converted to a single TextContent."""
@@ -866,7 +872,7 @@ class TestConvertResultToContent:
         assert isinstance(result, list)
         assert len(result) == 1
         assert isinstance(result[0], TextContent)
-        assert result[0].text == '[\n  1,\n  "two",\n  {\n    "c": 3\n  }\n]'
+        assert result[0].text == '[1,"two",{"c":3}]'
 
     def test_list_of_mcp_types(self):
         """Test that a list of MCP types is returned as a list of those types."""
@@ -897,7 +903,7 @@ class TestConvertResultToContent:
         assert image_content_count == 1
 
         text_item = next(item for item in result if isinstance(item, TextContent))
-        assert text_item.text == '{\n  "a": 1\n}'
+        assert text_item.text == '{"a":1}'
 
         image_item = next(item for item in result if isinstance(item, ImageContent))
         assert image_item.data == "ZmFrZWltYWdlZGF0YQ=="
@@ -919,7 +925,7 @@ class TestConvertResultToContent:
         assert image_content_count == 1
 
         text_item = next(item for item in result if isinstance(item, TextContent))
-        assert text_item.text == '[\n  {\n    "a": 1\n  },\n  {\n    "b": 2\n  }\n]'
+        assert text_item.text == '[{"a":1},{"b":2}]'
 
         image_item = next(item for item in result if isinstance(item, ImageContent))
         assert image_item.data == "ZmFrZWltYWdlZGF0YQ=="
@@ -941,7 +947,7 @@ class TestConvertResultToContent:
         assert audio_content_count == 1
 
         text_item = next(item for item in result if isinstance(item, TextContent))
-        assert text_item.text == '{\n  "a": 1\n}'
+        assert text_item.text == '{"a":1}'
 
         audio_item = next(item for item in result if isinstance(item, AudioContent))
         assert audio_item.data == "ZmFrZWF1ZGlvZGF0YQ=="
@@ -966,7 +972,7 @@ class TestConvertResultToContent:
         assert embedded_content_count == 1
 
         text_item = next(item for item in result if isinstance(item, TextContent))
-        assert text_item.text == '{\n  "a": 1\n}'
+        assert text_item.text == '{"a":1}'
 
         embedded_item = next(
             item
@@ -1031,7 +1037,7 @@ class TestConvertResultToContent:
         assert isinstance(result, list)
         assert len(result) == 1
         assert isinstance(result[0], TextContent)
-        assert result[0].text == '[\n  1,\n  "two",\n  {\n    "c": 3\n  }\n]'
+        assert result[0].text == '[1,"two",{"c":3}]'
 
         content1 = TextContent(type="text", text="hello")
         result = _convert_to_content([1, content1], _process_as_single_item=True)
@@ -1359,3 +1365,191 @@ class TestToolTitle:
         # Should fall back to annotations.title
         mcp_tool = tool.to_mcp_tool()
         assert mcp_tool.title == "Annotation Title"
+
+
+class TestFunctionToolCallPlan:
+    """Tests for caching the introspection of tool functions."""
+
+    async def test_function_is_introspected_once(self, monkeypatch):
+        calls = []
+        original = fastmcp.tools.tool.find_kwarg_by_type
+
+        def counting_find_kwarg_by_type(fn, kwarg_type):
+            calls.append(fn)
+            return original(fn, kwarg_type=kwarg_type)
+
+        monkeypatch.setattr(
+            fastmcp.tools.tool, "find_kwarg_by_type", counting_find_kwarg_by_type
+        )
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool.from_function(add)
+        calls.clear()
+        for _ in range(3):
+            result = await tool.run({"a": 1, "b": 2})
+            assert result.structured_content == {"result": 3}
+        assert calls == []
+
+    async def test_replaced_function_is_introspected(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        def multiply(a: int, b: int) -> int:
+            return a * b
+
+        tool = Tool.from_function(add)
+        await tool.run({"a": 2, "b": 3})
+
+        copied = tool.model_copy(update={"fn": multiply})
+        result = await copied.run({"a": 2, "b": 3})
+        assert result.structured_content == {"result": 6}
+
+    async def test_arguments_are_not_modified(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        arguments = {"a": "1", "b": 2}
+        await Tool.from_function(add).run(arguments)
+        assert arguments == {"a": "1", "b": 2}
+
+    @pytest.mark.benchmark
+    async def test_call_overhead_benchmark(self, record_property):
+        """
+        Compares the per-call time of a trivial tool with the call path tools
+        used before call plans, which introspected the function on every call.
+        Both times are recorded as properties of the test.
+        """
+        from fastmcp.server.context import Context
+        from fastmcp.server.dependencies import get_context
+        from fastmcp.tools.tool import _make_tool_result
+        from fastmcp.utilities.types import find_kwarg_by_type, get_cached_typeadapter
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool.from_function(add)
+
+        async def run_without_plan(arguments: dict[str, Any]) -> ToolResult:
+            arguments = arguments.copy()
+            context_kwarg = find_kwarg_by_type(add, kwarg_type=Context)
+            if context_kwarg and context_kwarg not in arguments:
+                arguments[context_kwarg] = get_context()
+            result = get_cached_typeadapter(add).validate_python(arguments)
+            if inspect.isawaitable(result):
+                result = await result
+            return _make_tool_result(
+                result, serializer=tool.serializer, output_schema=tool.output_schema
+            )
+
+        async def time_calls(run: Callable[[dict[str, Any]], Awaitable[ToolResult]]):
+            start = time.perf_counter()
+            for _ in range(calls):
+                result = await run({"a": 1, "b": 2})
+            assert result.structured_content == {"result": 3}
+            return (time.perf_counter() - start) / calls
+
+        calls = 2000
+        # warm up both paths, e.g. the TypeAdapter cache
+        await run_without_plan({"a": 1, "b": 2})
+        await tool.run({"a": 1, "b": 2})
+
+        without_plan = await time_calls(run_without_plan)
+        with_plan = await time_calls(tool.run)
+
+        record_property("call_without_plan_us", round(without_plan * 1e6, 2))
+        record_property("call_with_plan_us", round(with_plan * 1e6, 2))
+        assert with_plan < without_plan, (
+            f"{with_plan * 1e6:.1f}us per call with the plan, "
+            f"{without_plan * 1e6:.1f}us without"
+        )
+
+
+class TestToolResultSerialization:
+    """Tests for serializing tool results to text and structured content."""
+
+    async def test_result_is_compact_json(self):
+        def get_data() -> dict[str, Any]:
+            return {"a": 1, "b": [1, 2]}
+
+        result = await Tool.from_function(get_data).run({})
+        assert result.content[0].text == '{"a":1,"b":[1,2]}'  # type: ignore[attr-defined]
+        assert result.structured_content == {"a": 1, "b": [1, 2]}
+
+    async def test_result_indent_setting(self):
+        def get_data() -> dict[str, Any]:
+            return {"a": 1}
+
+        tool = Tool.from_function(get_data)
+        with temporary_settings(tool_result_indent=2):
+            result = await tool.run({})
+        assert result.content[0].text == '{\n  "a": 1\n}'  # type: ignore[attr-defined]
+
+    async def test_result_is_converted_once(self, monkeypatch):
+        calls = []
+        original = pydantic_core.to_jsonable_python
+
+        def counting_to_jsonable_python(value, *args, **kwargs):
+            calls.append(value)
+            return original(value, *args, **kwargs)
+
+        monkeypatch.setattr(
+            pydantic_core, "to_jsonable_python", counting_to_jsonable_python
+        )
+
+        class Item(BaseModel):
+            name: str
+            tags: list[str]
+
+        def get_items() -> list[Item]:
+            return [Item(name="a", tags=["x"]), Item(name="b", tags=[])]
+
+        result = await Tool.from_function(get_items).run({})
+        assert len(calls) == 1
+        assert result.structured_content == {
+            "result": [{"name": "a", "tags": ["x"]}, {"name": "b", "tags": []}]
+        }
+        assert json.loads(result.content[0].text) == result.structured_content["result"]  # type: ignore[attr-defined]
+
+    async def test_custom_serializer_is_used_for_text(self):
+        def get_data() -> dict[str, Any]:
+            return {"a": 1}
+
+        tool = Tool.from_function(get_data, serializer=lambda data: f"data: {data}")
+        result = await tool.run({})
+        assert result.content[0].text == "data: {'a': 1}"  # type: ignore[attr-defined]
+        assert result.structured_content == {"a": 1}
+
+    @pytest.mark.benchmark
+    @pytest.mark.timeout(60)
+    def test_large_result_benchmark(self):
+        """
+        Compares serializing large results once, compactly, with the previous
+        indented text conversion followed by a separate conversion of the
+        structured content.
+        """
+        from fastmcp.tools.tool import _make_tool_result
+
+        for count in (20_000, 100_000):
+            data = {
+                "rows": [
+                    {"id": i, "name": f"row {i}", "tags": ["a", "b"], "score": i / 3}
+                    for i in range(count)
+                ]
+            }
+
+            start = time.perf_counter()
+            result = _make_tool_result(data)
+            current = time.perf_counter() - start
+
+            start = time.perf_counter()
+            indented = pydantic_core.to_json(data, fallback=str, indent=2)
+            pydantic_core.to_jsonable_python(data)
+            pydantic_core.to_jsonable_python(data)
+            previous = time.perf_counter() - start
+
+            text = result.content[0].text  # type: ignore[attr-defined]
+            assert json.loads(text) == result.structured_content == data
+            assert len(text) < len(indented)
+            assert current < previous
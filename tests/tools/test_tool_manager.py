@@ -259,6 +259,62 @@ class TestAddTools:
         assert result.fn.__name__ == "replacement_fn"
 
 
+class TestToolIndex:
+    """Test the cached tool inventory used for lookups."""
+
+    async def test_index_reused_between_lookups(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(add))
+
+        await manager.get_tool("add")
+        index = manager._tool_index
+        assert index is not None
+
+        await manager.get_tool("add")
+        assert manager._tool_index is index
+
+    async def test_get_tools_returns_copy(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(add))
+
+        tools = await manager.get_tools()
+        tools.pop("add")
+        assert await manager.has_tool("add")
+
+    async def test_add_tool_invalidates_index(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        def subtract(a: int, b: int) -> int:
+            return a - b
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(add))
+        assert not await manager.has_tool("subtract")
+
+        manager.add_tool(Tool.from_function(subtract))
+        assert await manager.has_tool("subtract")
+
+    async def test_mounted_server_changes_invalidate_index(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        parent.mount(child, "child")
+
+        assert not await parent._tool_manager.has_tool("child_add")
+
+        @child.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert await parent._tool_manager.has_tool("child_add")
+
+
 class TestToolTags:
     """Test functionality related to tool tags."""
 
@@ -486,7 +542,7 @@ class TestCallTools:
                 },
             )
 
-        assert result.content[0].text == '[\n  "rex",\n  "gertrude"\n]'  # type: ignore[attr-defined]
+        assert result.content[0].text == '["rex","gertrude"]'  # type: ignore[attr-defined]
         assert result.structured_content == {"result": ["rex", "gertrude"]}
 
     async def test_call_tool_with_custom_serializer(self):
@@ -0,0 +1,152 @@
+"""Tests for parsing large OpenAPI specs efficiently."""
+
+from typing import Any
+
+import httpx
+import pytest
+from openapi_pydantic import (
+    OpenAPI,
+    Operation,
+    Parameter,
+    PathItem,
+    Reference,
+    RequestBody,
+    Response,
+    Schema,
+)
+
+from fastmcp.server.openapi import FastMCPOpenAPI
+from fastmcp.utilities.openapi import (
+    OpenAPIParser,
+    _combine_schemas,
+    _referenced_definitions,
+    parse_openapi_to_http_routes,
+)
+
+
+def make_spec(operations: int, schemas: int) -> dict[str, Any]:
+    """
+    Builds a spec with the given number of GET and POST operations, each using
+    one of `schemas` component schemas, which refer to the previous schema.
+    """
+    components = {}
+    for i in range(schemas):
+        properties: dict[str, Any] = {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+        }
+        if i % 10:
+            properties["parent"] = {"$ref": f"#/components/schemas/Model{i - 1}"}
+        components[f"Model{i}"] = {"type": "object", "properties": properties}
+
+    paths = {}
+    for i in range(operations // 2):
+        ref = {"$ref": f"#/components/schemas/Model{i % schemas}"}
+        paths[f"/items{i}/{{item_id}}"] = {
+            "parameters": [
+                {
+                    "name": "item_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"},
+                }
+            ],
+            "get": {
+                "operationId": f"get_item{i}",
+                "responses": {
+                    "200": {
+                        "description": "The item",
+                        "content": {"application/json": {"schema": ref}},
+                    }
+                },
+            },
+            "post": {
+                "operationId": f"update_item{i}",
+                "requestBody": {
+                    "required": True,
+                    "content": {"application/json": {"schema": ref}},
+                },
+                "responses": {"200": {"description": "Updated"}},
+            },
+        }
+
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": "Large API", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": components},
+    }
+
+
+def test_routes_share_schema_definitions():
+    routes = parse_openapi_to_http_routes(make_spec(operations=20, schemas=5))
+    assert len(routes) == 20
+    assert len(routes[0].schema_definitions) == 5
+    assert all(
+        route.schema_definitions is routes[0].schema_definitions for route in routes
+    )
+
+
+def test_references_are_resolved_once():
+    spec = make_spec(operations=2, schemas=2)
+    parser = OpenAPIParser(
+        OpenAPI.model_validate(spec),
+        Reference,
+        Schema,
+        Parameter,
+        RequestBody,
+        Response,
+        Operation,
+        PathItem,
+    )
+    ref = Reference.model_validate({"$ref": "#/components/schemas/Model1"})
+
+    resolved = parser._resolve_ref(ref)
+    same_ref = Reference.model_validate({"$ref": "#/components/schemas/Model1"})
+    assert parser._resolve_ref(same_ref) is resolved
+    assert parser._resolved_refs == {"#/components/schemas/Model1": resolved}
+
+
+def test_referenced_definitions():
+    definitions = {
+        "A": {"type": "object", "properties": {"b": {"$ref": "#/$defs/B"}}},
+        "B": {"type": "object", "properties": {"a": {"$ref": "#/$defs/A"}}},
+        "C": {"type": "string"},
+        "D": {"type": "object", "properties": {"c": {"$ref": "#/$defs/C"}}},
+    }
+    schema = {"properties": {"x": {"items": {"$ref": "#/$defs/B"}}}}
+
+    assert _referenced_definitions(schema, definitions) == {
+        "A": definitions["A"],
+        "B": definitions["B"],
+    }
+    assert _referenced_definitions({"type": "object"}, definitions) == {}
+
+
+def test_combined_schema_includes_only_referenced_definitions():
+    routes = parse_openapi_to_http_routes(make_spec(operations=30, schemas=30))
+    route = next(r for r in routes if r.operation_id == "update_item12")
+
+    schema = _combine_schemas(route)
+
+    # Model12 refers to Model11 and Model10, which has no parent
+    assert set(schema["$defs"]) == {"Model11", "Model10"}
+    assert schema["properties"]["parent"] == {"$ref": "#/$defs/Model11"}
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(60)
+def test_large_spec_startup_benchmark():
+    """
+    Builds a server from a spec with 3,000 operations. This guards against
+    per-route work that grows with the size of the whole spec.
+    """
+    spec = make_spec(operations=3000, schemas=300)
+
+    routes = parse_openapi_to_http_routes(spec)
+    server = FastMCPOpenAPI(
+        openapi_spec=spec, client=httpx.AsyncClient(base_url="http://api")
+    )
+
+    assert len(routes) == 3000
+    assert len(server._tool_manager._tools) == 3000
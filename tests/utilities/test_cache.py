@@ -4,7 +4,9 @@ import datetime
 import time
 from unittest.mock import patch
 
-from fastmcp.utilities.cache import TimedCache
+import pytest
+
+from fastmcp.utilities.cache import CacheStats, TimedCache
 
 
 class TestTimedCache:
@@ -23,17 +25,14 @@ class TestTimedCache:
         cache = TimedCache(datetime.timedelta(seconds=10))
         key, value = "test_key", "test_value"
 
-        with patch("datetime.datetime") as mock_datetime:
-            now = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
-            mock_datetime.now.return_value = now
-
+        with patch("time.monotonic", return_value=100.0):
             cache.set(key, value)
 
             # Check that the value is stored with the correct expiration
             assert key in cache.cache
             stored_value, expiration = cache.cache[key]
             assert stored_value == value
-            assert expiration == now + datetime.timedelta(seconds=10)
+            assert expiration == 110.0
 
     def test_get_found(self):
         """Test retrieving a value that exists and has not expired."""
@@ -41,9 +40,7 @@ class TestTimedCache:
         key, value = "test_key", "test_value"
 
         # Set a future expiration time
-        future = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
-            seconds=30
-        )
+        future = time.monotonic() + 30
         cache.cache[key] = (value, future)
 
         # The value should be returned
@@ -55,9 +52,7 @@ class TestTimedCache:
         key, value = "test_key", "test_value"
 
         # Set a past expiration time
-        past = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
-            seconds=1
-        )
+        past = time.monotonic() - 1
         cache.cache[key] = (value, past)
 
         # Should return NOT_FOUND
@@ -117,23 +112,21 @@ class TestTimedCache:
         cache = TimedCache(datetime.timedelta(seconds=10))
         key = "test_key"
 
-        with patch("datetime.datetime") as mock_datetime:
+        with patch("time.monotonic") as mock_monotonic:
             # Set initial value at t=0
-            initial_time = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
-            mock_datetime.now.return_value = initial_time
+            mock_monotonic.return_value = 0.0
             cache.set(key, "initial_value")
 
             initial_expiration = cache.cache[key][1]
-            assert initial_expiration == initial_time + datetime.timedelta(seconds=10)
+            assert initial_expiration == 10.0
 
             # Overwrite at t=5
-            later_time = initial_time + datetime.timedelta(seconds=5)
-            mock_datetime.now.return_value = later_time
+            mock_monotonic.return_value = 5.0
             cache.set(key, "new_value")
 
             # Expiration should be extended
             new_expiration = cache.cache[key][1]
-            assert new_expiration == later_time + datetime.timedelta(seconds=10)
+            assert new_expiration == 15.0
 
     def test_different_key_types(self):
         """Test that different types of keys can be used."""
@@ -231,3 +224,73 @@ class TestTimedCache:
         # Check some random items
         for i in [0, 123, 456, 789, 999]:
             assert cache.get(f"key{i}") == f"value{i}"
+
+    def test_zero_expiration_is_not_stored(self):
+        """Test that entries that would expire immediately are not kept."""
+        cache = TimedCache(datetime.timedelta(seconds=0))
+
+        cache.set("key", "value")
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TimedCache(datetime.timedelta(seconds=10), max_size=2)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+
+        # Reading key1 makes key2 the least recently used entry
+        assert cache.get("key1") == "value1"
+        cache.set("key3", "value3")
+
+        assert len(cache) == 2
+        assert cache.get("key2") is TimedCache.NOT_FOUND
+        assert cache.get("key1") == "value1"
+        assert cache.get("key3") == "value3"
+        assert cache.evictions == 1
+
+    def test_unbounded(self):
+        """Test that a max_size of None disables eviction."""
+        cache = TimedCache(datetime.timedelta(seconds=10), max_size=None)
+
+        for i in range(2000):
+            cache.set(i, i)
+
+        assert len(cache) == 2000
+        assert cache.evictions == 0
+
+    def test_invalid_max_size(self):
+        """Test that a max_size below 1 is rejected."""
+        with pytest.raises(ValueError, match="Invalid cache max_size"):
+            TimedCache(datetime.timedelta(seconds=10), max_size=0)
+
+    def test_sweeps_expired_entries(self):
+        """Test that expired entries are removed without being read."""
+        cache = TimedCache(datetime.timedelta(seconds=10))
+
+        with patch("time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = cache._next_sweep - 10
+            cache.set("key1", "value1")
+            cache.set("key2", "value2")
+
+            # Setting a new entry after the sweep interval removes the others
+            mock_monotonic.return_value = cache._next_sweep
+            cache.set("key3", "value3")
+
+        assert list(cache.cache) == ["key3"]
+        assert cache.expirations == 2
+
+    def test_stats(self):
+        """Test that hits, misses, evictions and expirations are counted."""
+        cache = TimedCache(datetime.timedelta(seconds=10), max_size=1)
+
+        cache.set("key1", "value1")
+        cache.get("key1")
+        cache.get("missing")
+        cache.set("key2", "value2")
+        cache.cache["key2"] = ("value2", time.monotonic() - 1)
+        cache.get("key2")
+
+        assert cache.stats() == CacheStats(
+            hits=1, misses=2, evictions=1, expirations=1, size=0
+        )
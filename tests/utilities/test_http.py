@@ -0,0 +1,167 @@
+import gzip
+
+import anyio
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from fastmcp.utilities.http import (
+    HTTPPoolConfig,
+    HTTPPoolStats,
+    PooledAsyncClient,
+    send_with_limit,
+    truncate_response,
+)
+
+
+class TestHTTPPoolConfig:
+    def test_limits(self):
+        pool = HTTPPoolConfig(
+            max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+        )
+        assert pool.limits() == httpx.Limits(
+            max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+        )
+
+    def test_host_limits_cap_keepalive(self):
+        pool = HTTPPoolConfig(max_keepalive_connections=10)
+        assert pool.limits(4).max_keepalive_connections == 4
+
+    def test_timeout(self):
+        pool = HTTPPoolConfig(connect_timeout=1, read_timeout=2)
+        timeout = pool.timeout()
+        assert timeout.connect == 1
+        assert timeout.read == 2
+
+    def test_invalid_host_limit(self):
+        with pytest.raises(ValueError, match="api.example.com"):
+            HTTPPoolConfig(host_limits={"api.example.com": 0})
+
+
+class TestPooledAsyncClient:
+    async def test_uses_pool_timeout_by_default(self):
+        async with PooledAsyncClient(HTTPPoolConfig(read_timeout=7)) as client:
+            assert client.timeout.read == 7
+
+    async def test_rejects_custom_transport(self):
+        with pytest.raises(ValueError, match="transports"):
+            PooledAsyncClient(transport=httpx.MockTransport(lambda r: None))  # type: ignore[arg-type]
+
+    async def test_stats(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url="https://api.example.com/ok", is_reusable=True)
+        httpx_mock.add_exception(
+            httpx.ConnectError("refused"), url="https://api.example.com/down"
+        )
+
+        async with PooledAsyncClient(
+            HTTPPoolConfig(max_connections=4), base_url="https://api.example.com"
+        ) as client:
+            await client.get("/ok")
+            await client.get("/ok")
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/down")
+
+            assert client.pool_stats() == HTTPPoolStats(
+                requests=3,
+                errors=1,
+                in_flight=0,
+                peak_in_flight=1,
+                max_connections=4,
+            )
+
+    async def test_streamed_response_in_flight_until_closed(
+        self, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(url="https://api.example.com/ok", is_reusable=True)
+
+        async with PooledAsyncClient(
+            HTTPPoolConfig(max_connections=4), base_url="https://api.example.com"
+        ) as client:
+            async with client.stream("GET", "/ok"):
+                async with client.stream("GET", "/ok"):
+                    stats = client.pool_stats()
+                    assert stats.in_flight == 2
+                    assert stats.utilization == 0.5
+            assert client.pool_stats().in_flight == 0
+            assert client.pool_stats().peak_in_flight == 2
+
+    async def test_concurrent_requests(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url="https://api.example.com/ok", is_reusable=True)
+
+        async with PooledAsyncClient(base_url="https://api.example.com") as client:
+            async with anyio.create_task_group() as tg:
+                for _ in range(5):
+                    tg.start_soon(client.get, "/ok")
+
+            stats = client.pool_stats()
+            assert stats.requests == 5
+            assert stats.in_flight == 0
+
+    async def test_host_limits_mount_separate_pools(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url="https://slow.example.com/ok")
+
+        async with PooledAsyncClient(
+            HTTPPoolConfig(host_limits={"slow.example.com": 2})
+        ) as client:
+            await client.get("https://slow.example.com/ok")
+            assert client.pool_stats().requests == 1
+
+
+class TestSendWithLimit:
+    @staticmethod
+    def streaming_client(chunks: list[bytes], consumed: list[bytes]):
+        async def stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=stream())
+
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://api"
+        )
+
+    async def test_small_response(self):
+        consumed = []
+        async with self.streaming_client([b"abc", b"def"], consumed) as client:
+            response = await send_with_limit(
+                client, client.build_request("GET", "/"), 10
+            )
+        assert response.content == b"abcdef"
+        assert response.extensions["truncated"] is False
+        assert response.is_closed
+
+    async def test_large_response_is_truncated_without_reading_the_rest(self):
+        consumed = []
+        chunks = [b"x" * 10] * 100
+        async with self.streaming_client(chunks, consumed) as client:
+            response = await send_with_limit(
+                client, client.build_request("GET", "/"), 25
+            )
+        assert response.content == b"x" * 25
+        assert response.extensions["truncated"] is True
+        assert len(consumed) == 3
+
+    async def test_decoded_content(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"content-encoding": "gzip"},
+                content=gzip.compress(b"a" * 100),
+            )
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://api"
+        ) as client:
+            response = await send_with_limit(
+                client, client.build_request("GET", "/"), 10
+            )
+        assert response.content == b"a" * 10
+        assert "content-encoding" not in response.headers
+
+    def test_truncate_response(self):
+        request = httpx.Request("GET", "https://api/")
+        response = httpx.Response(200, content=b"abcdef", request=request)
+        assert truncate_response(response, 10) is response
+        assert truncate_response(response, 3).content == b"abc"
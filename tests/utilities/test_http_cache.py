@@ -0,0 +1,221 @@
+import gzip
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from fastmcp.utilities.http_cache import HTTPCache, HTTPCacheStats
+
+
+class Upstream:
+    """A mock upstream API that records the requests it receives."""
+
+    def __init__(self, headers: dict[str, str] | None = None, status_code: int = 200):
+        self.headers = headers or {}
+        self.status_code = status_code
+        self.requests: list[httpx.Request] = []
+        self.version = 1
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"v{self.version}"'
+        if "etag" in self.headers and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={**self.headers, "etag": etag})
+        headers = dict(self.headers)
+        if "etag" in headers:
+            headers["etag"] = etag
+        return httpx.Response(
+            self.status_code, headers=headers, json={"version": self.version}
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler), base_url="https://api"
+        )
+
+
+@pytest.fixture
+def now():
+    clock = {"now": 1000.0}
+    with patch("time.time", side_effect=lambda: clock["now"]):
+        yield clock
+
+
+class TestHTTPCache:
+    async def test_max_age(self, now):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        cache = HTTPCache()
+        async with upstream.client() as client:
+            first = await cache.send(client, "/items")
+            second = await cache.send(client, "/items")
+            assert len(upstream.requests) == 1
+            assert second.json() == first.json() == {"version": 1}
+
+            now["now"] += 61
+            await cache.send(client, "/items")
+            assert len(upstream.requests) == 2
+
+        assert cache.stats() == HTTPCacheStats(
+            hits=1, revalidations=0, misses=2, size=1
+        )
+
+    async def test_age_reduces_freshness(self, now):
+        upstream = Upstream({"cache-control": "max-age=60", "age": "50"})
+        cache = HTTPCache()
+        async with upstream.client() as client:
+            await cache.send(client, "/items")
+            now["now"] += 11
+            await cache.send(client, "/items")
+            assert len(upstream.requests) == 2
+
+    async def test_expires(self, now):
+        upstream = Upstream(
+            {
+                "date": "Thu, 01 Jan 2026 00:00:00 GMT",
+                "expires": "Thu, 01 Jan 2026 00:00:30 GMT",
+            }
+        )
+        cache = HTTPCache()
+        async with upstream.client() as client:
+            await cache.send(client, "/items")
+            now["now"] += 20
+            await cache.send(client, "/items")
+            assert len(upstream.requests) == 1
+            now["now"] += 20
+            await cache.send(client, "/items")
+            assert len(upstream.requests) == 2
+
+    async def test_no_store(self, now):
+        upstream = Upstream({"cache-control": "no-store"})
+        cache = HTTPCache(default_ttl=60)
+        async with upstream.client() as client:
+            await cache.send(client, "/items")
+            await cache.send(client, "/items")
+        assert len(upstream.requests) == 2
+        assert cache.stats().size == 0
+
+    async def test_default_ttl(self, now):
+        upstream = Upstream()
+        cache = HTTPCache(default_ttl=10)
+        async with upstream.client() as client:
+            await cache.send(client, "/items")
+            await cache.send(client, "/items")
+        assert len(upstream.requests) == 1
+
+    async def test_not_cached_without_freshness_or_validators(self, now):
+        upstream = Upstream()
+        cache = HTTPCache()
+        async with upstream.client() as client:
+            await cache.send(client, "/items")
+            await cache.send(client, "/items")
+        assert len(upstream.requests) == 2
+
+    async def test_errors_not_cached(self, now):
+        upstream = Upstream({"cache-control": "max-age=60"}, status_code=500)
+        cache = HTTPCache()
+        async with upstream.client() as client:
+            await cache.send(client, "/items")
+            await cache.send(client, "/items")
+        assert len(upstream.requests) == 2
+
+    async def test_etag_revalidation(self, now):
+        upstream = Upstream({"cache-control": "no-cache", "etag": ""})
+        cache = HTTPCache()
+        async with upstream.client() as client:
+            await cache.send(client, "/items")
+            response = await cache.send(client, "/items")
+            assert response.status_code == 200
+            assert response.json() == {"version": 1}
+            assert upstream.requests[1].headers["if-none-match"] == '"v1"'
+
+            upstream.version = 2
+            response = await cache.send(client, "/items")
+            assert response.json() == {"version": 2}
+
+        assert cache.stats().revalidations == 1
+
+    async def test_last_modified_revalidation(self, now):
+        last_modified = "Thu, 01 Jan 2026 00:00:00 GMT"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-modified-since") == last_modified:
+                return httpx.Response(304, headers={"cache-control": "max-age=60"})
+            return httpx.Response(
+                200, headers={"last-modified": last_modified}, text="data"
+            )
+
+        cache = HTTPCache()
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://api"
+        ) as client:
+            await cache.send(client, "/items")
+            response = await cache.send(client, "/items")
+            assert response.text == "data"
+            assert cache.stats().revalidations == 1
+
+            # the 304 response made the entry fresh for 60 seconds
+            await cache.send(client, "/items")
+            assert cache.stats().hits == 1
+
+    async def test_key_includes_params_and_headers(self, now):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        cache = HTTPCache()
+        async with upstream.client() as client:
+            await cache.send(client, "/items", params={"page": 1})
+            await cache.send(client, "/items", params={"page": 2})
+            await cache.send(client, "/items", headers={"authorization": "a"})
+            await cache.send(client, "/items", headers={"authorization": "b"})
+            await cache.send(client, "/items", headers={"authorization": "b"})
+        assert len(upstream.requests) == 4
+
+    async def test_decoded_content_is_reusable(self, now):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"cache-control": "max-age=60", "content-encoding": "gzip"},
+                content=gzip.compress(b'{"a": 1}'),
+            )
+
+        cache = HTTPCache()
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://api"
+        ) as client:
+            await cache.send(client, "/items")
+            response = await cache.send(client, "/items")
+        assert response.json() == {"a": 1}
+
+    async def test_lru_eviction(self, now):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        cache = HTTPCache(max_entries=1)
+        async with upstream.client() as client:
+            await cache.send(client, "/a")
+            await cache.send(client, "/b")
+            await cache.send(client, "/a")
+        assert len(upstream.requests) == 3
+
+    async def test_disk_backed(self, now, tmp_path):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        async with upstream.client() as client:
+            await HTTPCache(directory=tmp_path).send(client, "/items")
+            assert len(list(tmp_path.glob("*.json"))) == 1
+
+            # a new cache reads the entry back from disk
+            cache = HTTPCache(directory=tmp_path)
+            response = await cache.send(client, "/items")
+            assert response.json() == {"version": 1}
+            assert len(upstream.requests) == 1
+
+            cache.clear()
+            assert list(tmp_path.glob("*.json")) == []
+
+    async def test_disk_entries_expire_after_retention(self, now, tmp_path):
+        upstream = Upstream({"cache-control": "max-age=600"})
+        async with upstream.client() as client:
+            await HTTPCache(directory=tmp_path, retention=60).send(client, "/items")
+            now["now"] += 61
+            await HTTPCache(directory=tmp_path, retention=60).send(client, "/items")
+        assert len(upstream.requests) == 2
+
+    def test_invalid_retention(self):
+        with pytest.raises(ValueError):
+            HTTPCache(retention=0)
@@ -0,0 +1,128 @@
+import datetime
+import uuid
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from fastmcp.utilities import json_backend
+from fastmcp.utilities.json_backend import get_json_backend
+from fastmcp.utilities.tests import temporary_settings
+
+BACKENDS = ["stdlib", "pydantic_core", "orjson"]
+
+
+class Item(BaseModel):
+    name: str
+    created: datetime.datetime
+
+
+def make_payload(rows: int) -> dict[str, Any]:
+    """A payload shaped like a typical API response."""
+    return {
+        "count": rows,
+        "next": None,
+        "results": [
+            {
+                "id": i,
+                "name": f"item {i} ✓",
+                "price": i * 1.25,
+                "active": i % 2 == 0,
+                "tags": ["a", "b", "c"],
+                "owner": {"id": i % 7, "email": f"user{i % 7}@example.com"},
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    with temporary_settings(json_backend=request.param):
+        yield request.param
+
+
+class TestJSONBackend:
+    def test_backend_is_selected_by_setting(self, backend):
+        assert get_json_backend().name == backend
+
+    def test_dumps_is_compact(self, backend):
+        assert json_backend.dumps({"a": [1, 2.5, None], "b": "é"}) == (
+            '{"a":[1,2.5,null],"b":"é"}'
+        )
+
+    def test_dumps_indent(self, backend):
+        assert json_backend.dumps({"a": [1]}, indent=2) == '{\n  "a": [\n    1\n  ]\n}'
+        assert json_backend.dumps({"a": 1}, indent=4) == '{\n    "a": 1\n}'
+
+    def test_dumps_converts_like_pydantic(self, backend):
+        item = Item(
+            name="x",
+            created=datetime.datetime(
+                2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+            ),
+        )
+        key = uuid.UUID(int=1)
+        assert json_backend.dumps({"item": item, "key": key, 1: {1, 2}}) == (
+            '{"item":{"name":"x","created":"2024-01-02T03:04:05Z"},'
+            '"key":"00000000-0000-0000-0000-000000000001","1":[1,2]}'
+        )
+        assert json_backend.dumps(2**70) == str(2**70)
+
+    def test_dumps_fallback(self, backend):
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        with pytest.raises((TypeError, ValueError)):
+            json_backend.dumps({"a": Opaque()})
+        assert json_backend.dumps({"a": Opaque()}, fallback=str) == '{"a":"opaque"}'
+
+    def test_loads(self, backend):
+        assert json_backend.loads('{"a":[1,2.5,null],"b":"é"}') == {
+            "a": [1, 2.5, None],
+            "b": "é",
+        }
+        assert json_backend.loads(b"[true]") == [True]
+
+    def test_loads_invalid(self, backend):
+        with pytest.raises(ValueError):
+            json_backend.loads("{not json")
+
+    def test_backends_agree(self, backend):
+        payload = make_payload(50)
+        expected = get_json_backend("stdlib").dumps(payload)
+        assert json_backend.dumps(payload) == expected
+        assert json_backend.loads(expected) == payload
+
+    def test_auto_prefers_orjson(self):
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            expected = "pydantic_core"
+        else:
+            expected = "orjson"
+        assert get_json_backend("auto").name == expected
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_json_backend("simplejson")
+
+    @pytest.mark.benchmark
+    @pytest.mark.timeout(60)
+    def test_throughput_benchmark(self, backend):
+        """
+        Encodes and decodes small and large API-like payloads many times; run
+        with `--durations` to compare the throughput of the backends.
+        """
+        for rows, repeat in ((10, 2000), (5000, 5)):
+            payload = make_payload(rows)
+            expected = get_json_backend("stdlib").dumps(payload)
+            for _ in range(repeat):
+                text = json_backend.dumps(payload)
+            for _ in range(repeat):
+                decoded = json_backend.loads(text)
+            assert text == expected
+            assert decoded == payload
@@ -0,0 +1,63 @@
+from fastmcp.utilities.routing import PrefixRouter
+
+
+class TestPrefixRouter:
+    def test_empty_router(self):
+        router: PrefixRouter[str] = PrefixRouter()
+        assert router.route("weather_forecast") == []
+        assert len(router) == 0
+
+    def test_routes_prefixed_key(self):
+        router: PrefixRouter[str] = PrefixRouter()
+        router.add("weather", "weather-server")
+        router.add("news", "news-server")
+
+        assert router.route("weather_forecast") == [("forecast", "weather-server")]
+        assert router.route("news_headlines") == [("headlines", "news-server")]
+        assert router.route("sports_scores") == []
+
+    def test_prefix_requires_separator(self):
+        router: PrefixRouter[str] = PrefixRouter()
+        router.add("weather", "weather-server")
+
+        assert router.route("weatherforecast") == []
+        assert router.route("weather") == []
+
+    def test_unprefixed_targets_match_everything(self):
+        router: PrefixRouter[str] = PrefixRouter()
+        router.add(None, "first")
+        router.add("", "second")
+
+        assert router.route("anything") == [
+            ("anything", "second"),
+            ("anything", "first"),
+        ]
+
+    def test_prefixes_containing_separator(self):
+        router: PrefixRouter[str] = PrefixRouter()
+        router.add("my", "my-server")
+        router.add("my_api", "api-server")
+
+        assert router.route("my_api_tool") == [
+            ("tool", "api-server"),
+            ("api_tool", "my-server"),
+        ]
+
+    def test_most_recent_first(self):
+        router: PrefixRouter[str] = PrefixRouter()
+        router.add("api", "first")
+        router.add(None, "unprefixed")
+        router.add("api", "second")
+
+        assert router.route("api_tool") == [
+            ("tool", "second"),
+            ("api_tool", "unprefixed"),
+            ("tool", "first"),
+        ]
+
+    def test_custom_separator(self):
+        router: PrefixRouter[str] = PrefixRouter(separator="/")
+        router.add("api", "api-server")
+
+        assert router.route("api/tool") == [("tool", "api-server")]
+        assert router.route("api_tool") == []